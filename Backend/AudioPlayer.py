@@ -0,0 +1,241 @@
+import sys
+import os
+# Patch sys.path to the project root if run directly (so "from Backend..." imports work)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import io
+import time
+import queue
+import itertools
+import threading
+import logging
+from typing import Dict, Optional, Union
+import pygame
+
+# One owner for the audio device. The mixer is initialized once and kept open; a single player
+# thread plays clips from in-memory buffers in priority order (alerts such as the startup chime
+# before speech, FIFO within a priority), with one pygame Clock pacing its polling. Any thread
+# can queue a clip and wait on it, cancel it, or interrupt whatever is playing, so the chime and
+# overlapping TTS replies no longer fight over pygame.mixer.music or quit the mixer under each other.
+
+PRIORITY_ALERT = 0    # chimes and short notification sounds
+PRIORITY_SPEECH = 1   # TTS replies
+POLL_HZ = 20          # how often the player checks for cancellation while a clip plays
+
+logger = logging.getLogger(__name__)
+
+
+class AudioClip:
+    """A queued sound; wait() blocks until it finished, was cancelled or failed."""
+
+    def __init__(self, data: bytes, priority: int = PRIORITY_SPEECH, name: str = ""):
+        self.data = data
+        self.priority = priority
+        self.name = name
+        self.error: Optional[str] = None
+        self.cancelled = False
+        self.started_at: Optional[float] = None
+        self._playing = False
+        self._done = threading.Event()
+
+    def cancel(self) -> None:
+        """Skip the clip if it is still queued, or stop it if it is playing."""
+        self.cancelled = True
+        if not self._playing:
+            # A queued clip is over right away; a playing one once the player stops it
+            self._done.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """True once the clip is over (played, cancelled or failed); False on timeout."""
+        return self._done.wait(timeout)
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def played(self) -> bool:
+        """Finished playing to the end."""
+        return self.done and not self.cancelled and self.error is None
+
+    def _finish(self, error: Optional[str] = None) -> None:
+        self.error = error
+        self._done.set()
+
+
+class AudioPlayer:
+    """Persistent mixer + priority queue of in-memory clips played by one thread."""
+
+    def __init__(self):
+        self._queue: "queue.PriorityQueue" = queue.PriorityQueue()
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._current: Optional[AudioClip] = None
+        self._files: Dict[str, bytes] = {}
+        self._stopping = False
+        self.error: Optional[str] = None
+
+    def start(self) -> "AudioPlayer":
+        with self._lock:
+            if self._thread is None:
+                try:
+                    if not pygame.mixer.get_init():
+                        pygame.mixer.init()
+                    self.error = None
+                except pygame.error as e:
+                    self.error = f"Audio device unavailable: {e}"
+                    logger.error(self.error)
+                    return self
+                self._stopping = False
+                self._thread = threading.Thread(target=self._run, name="audio-player", daemon=True)
+                self._thread.start()
+        return self
+
+    def play(self, data: bytes, priority: int = PRIORITY_SPEECH, interrupt: bool = False,
+             name: str = "") -> AudioClip:
+        """
+        Queue an encoded clip (mp3/ogg/wav bytes). With interrupt=True the clip that is playing
+        now is stopped, so this one (or anything more urgent) plays next.
+        """
+        clip = AudioClip(data, priority, name)
+        self.start()
+        if self._thread is None:
+            clip._finish(self.error)
+            return clip
+        if interrupt:
+            self.interrupt()
+        self._queue.put((priority, next(self._order), clip))
+        return clip
+
+    def play_file(self, path: str, priority: int = PRIORITY_ALERT, interrupt: bool = False) -> AudioClip:
+        """Queue a sound file; its bytes are read once and kept for later plays."""
+        data = self._files.get(path)
+        if data is None:
+            try:
+                with open(path, "rb") as f:
+                    data = self._files[path] = f.read()
+            except OSError as e:
+                clip = AudioClip(b"", priority, path)
+                clip._finish(f"Could not read {path}: {e}")
+                return clip
+        return self.play(data, priority, interrupt, name=path)
+
+    def interrupt(self) -> None:
+        """Stop the clip that is playing (queued clips still play)."""
+        current = self._current
+        if current is not None:
+            current.cancel()
+
+    def clear(self) -> int:
+        """Cancel every queued clip and the one playing; returns how many were cancelled."""
+        cancelled = 0
+        while True:
+            try:
+                _, _, clip = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if clip is not None:
+                clip.cancel()
+                cancelled += 1
+        if self._current is not None:
+            self.interrupt()
+            cancelled += 1
+        return cancelled
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def busy(self) -> bool:
+        return self._current is not None or not self._queue.empty()
+
+    def _run(self) -> None:
+        clock = pygame.time.Clock()
+        while True:
+            _, _, clip = self._queue.get()
+            if clip is None:
+                break
+            if clip.cancelled:
+                clip._finish()
+                continue
+            clip._playing = True
+            self._current = clip
+            try:
+                pygame.mixer.music.load(io.BytesIO(clip.data))
+                pygame.mixer.music.play()
+                clip.started_at = time.perf_counter()
+                while pygame.mixer.music.get_busy():
+                    if clip.cancelled or self._stopping:
+                        pygame.mixer.music.stop()
+                        break
+                    clock.tick(POLL_HZ)
+                clip._finish()
+            except Exception as e:
+                logger.error(f"Could not play {clip.name or 'audio clip'}: {e}")
+                clip._finish(str(e))
+            finally:
+                self._current = None
+                try:
+                    pygame.mixer.music.unload()
+                except Exception:
+                    pass
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Drop queued clips, stop the player thread and release the audio device."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._stopping = True
+        self.clear()
+        self._queue.put((-1, next(self._order), None))  # wakes the player ahead of any clip
+        thread.join(timeout)
+        self.clear()  # release waiters on clips queued during shutdown
+        try:
+            pygame.mixer.quit()
+        except Exception:
+            pass
+
+
+# Global instance
+_audio_player = None
+_audio_player_lock = threading.Lock()
+
+def get_audio_player() -> AudioPlayer:
+    """Get the global audio player, opening the audio device on first use."""
+    global _audio_player
+    with _audio_player_lock:
+        if _audio_player is None:
+            _audio_player = AudioPlayer()
+        return _audio_player.start()
+
+
+def PlayAndWait(data: Union[bytes, AudioClip], func=lambda r=None: True,
+                priority: int = PRIORITY_SPEECH) -> bool:
+    """
+    Play a clip through the shared player and block until it ends, polling `func` like the TTS
+    callbacks do: func() returning False cancels the clip. Returns True if it played to the end.
+    """
+    clip = data if isinstance(data, AudioClip) else get_audio_player().play(data, priority)
+    while not clip.wait(1 / POLL_HZ):
+        if func() == False:
+            clip.cancel()
+            clip.wait()
+            break
+    return clip.played
+
+
+if __name__ == "__main__":
+    # python Backend/AudioPlayer.py file.mp3 [file.mp3 ...]  - play files back to back
+    player = get_audio_player()
+    for path in sys.argv[1:]:
+        start = time.perf_counter()
+        clip = player.play_file(path, PRIORITY_SPEECH)
+        clip.wait()
+        latency = (clip.started_at - start) * 1000 if clip.started_at else float("nan")
+        print(f"{path}: {'played' if clip.played else clip.error or 'cancelled'} (started after {latency:.0f} ms)")
+    player.shutdown()
@@ -5,32 +5,34 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-import requests
-from AppOpener import close, open as appopen
-from pywhatkit import search as pywhatkit_search, playonyt
 from dotenv import dotenv_values
 from bs4 import BeautifulSoup
-from groq import Groq
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN
 import webbrowser
 import subprocess
 import keyboard
 import asyncio
+import functools
 import logging
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import pyautogui
 from Backend.utils import TempDirectoryPath
+from Backend.Startup import LazyResource
+from Backend.HttpClient import get_http_client, CreateGroqClient
+from Backend.Scheduler import CommandScheduler
+from Backend.Commands import registry, AUTOMATION
+from Backend.ContentGenerator import GenerateDocument, SubmitDocuments, ParseSlides, WritePresentation
 import time
 import platform
 from typing import Callable, Dict, List, Any, Tuple, Optional
+from concurrent.futures import Future
 from PIL import Image, ImageGrab
 import pyperclip
 from datetime import datetime
 import json
+from Backend.CaptureService import get_capture_service
+from Backend.FrameCache import frame_cache
 from Backend.RealTimeScreenShare import (
     get_screen_analyzer,
     analyze_screen,
@@ -55,10 +57,21 @@ pyautogui.PAUSE = 0.1
 class ScreenCapture:
     """Real-time screen capture and analysis capabilities."""
     
+    @staticmethod
+    def _region_dict(region: Optional[Tuple[int, int, int, int]]) -> Optional[Dict[str, int]]:
+        if not region:
+            return None
+        x, y, width, height = region
+        return {"left": x, "top": y, "width": width, "height": height}
+
     @staticmethod
     def capture_screen(region: Optional[Tuple[int, int, int, int]] = None) -> Optional[Image.Image]:
-        """Capture screen or specific region."""
+        """Capture screen or specific region (shared capture service; ImageGrab if mss is missing)."""
         try:
+            service = get_capture_service()
+            if service is not None:
+                captured = service.grab(ScreenCapture._region_dict(region))
+                return captured.pil() if captured is not None else None
             if region:
                 x, y, width, height = region
                 return ImageGrab.grab(bbox=(x, y, x + width, y + height))
@@ -71,17 +84,23 @@ class ScreenCapture:
     def save_screenshot(filename: Optional[str] = None, region: Optional[Tuple[int, int, int, int]] = None) -> Tuple[bool, Optional[str]]:
         """Save screenshot to file."""
         try:
-            screenshot = ScreenCapture.capture_screen(region)
-            if not screenshot:
-                return False, "Failed to capture screen"
-            
             if not filename:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"screenshot_{timestamp}.png"
             
             os.makedirs("data", exist_ok=True)
             filepath = os.path.join("data", filename)
-            screenshot.save(filepath)
+            service = get_capture_service()
+            if service is not None:
+                # Encode straight from the captured buffer, no PIL round-trip
+                captured = service.grab(ScreenCapture._region_dict(region), fresh=True)
+                if captured is None or not captured.save(filepath):
+                    return False, "Failed to capture screen"
+            else:
+                screenshot = ScreenCapture.capture_screen(region)
+                if not screenshot:
+                    return False, "Failed to capture screen"
+                screenshot.save(filepath)
             logging.info(f"Screenshot saved to {filepath}")
             return True, filepath
         except Exception as e:
@@ -244,6 +263,7 @@ class Navigator:
             "enter":         lambda _: self.enter(),
             "escape":        lambda _: self.escape(),
             "tab":           lambda _: self.tab(),
+            "backspace":     lambda _: self.backspace(),
             "delete":        lambda _: self.delete(),
             # edit
             "select all":    lambda _: self.select_all(),
@@ -312,35 +332,16 @@ GROQ_API_KEY = env_vars.get("GroqAPIKey")
 EMAIL_ADDRESS = env_vars.get("EmailAddress")
 EMAIL_PASSWORD = env_vars.get("EmailPassword")
 
-# Initialize Groq client
-client = None
-if GROQ_API_KEY:
-    try:
-        client = Groq(api_key=GROQ_API_KEY)
-        client.models.list()
-        logging.info("Successfully initialized Groq client")
-    except Exception as e:
-        logging.error(f"Groq initialization failed: {str(e)}")
-else:
-    logging.warning("GROQ_API_KEY not found or invalid in .env file. AI features disabled.")
+# Groq client, created on first use (no network round-trip at import)
+def _CreateGroqClient():
+    if not GROQ_API_KEY:
+        raise RuntimeError("GROQ_API_KEY not found or invalid in .env file. AI features disabled.")
+    groq_client = CreateGroqClient(GROQ_API_KEY)
+    logging.info("Successfully initialized Groq client")
+    return groq_client
 
-# Configure HTTP session
-try:
-    session = requests.Session()
-    session.headers.update({
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    })
-    logging.info("HTTP session initialized successfully")
-except Exception as e:
-    logging.error(f"Failed to initialize HTTP session: {str(e)}")
-    session = None
+client = LazyResource("Groq (automation)", _CreateGroqClient)
 
-# AI Configuration
-SYSTEM_PROMPT = {
-    "role": "system",
-    "content": "You are a professional writing assistant. Generate high-quality content in clear, concise English."
-}
-messages = [SYSTEM_PROMPT]
 
 # --------------------------------------------------------------------------- #
 # Enhanced Automation Functions
@@ -349,6 +350,7 @@ messages = [SYSTEM_PROMPT]
 def GoogleSearch(query: str) -> Tuple[bool, Optional[str]]:
     """Perform Google search"""
     try:
+        from pywhatkit import search as pywhatkit_search  # slow import, deferred to first use
         pywhatkit_search(query)
         logging.info(f"Google search executed for: {query}")
         return True, None
@@ -357,142 +359,72 @@ def GoogleSearch(query: str) -> Tuple[bool, Optional[str]]:
         logging.error(error_msg)
         return False, error_msg
 
-def Content(topic: str) -> Tuple[bool, Optional[str]]:
-    """Generate and save AI content using Groq"""
-    if not client:
-        error_msg = "Cannot generate content: Groq client not initialized"
-        logging.error(error_msg)
-        return False, error_msg
+def _DocumentFilename(topic: str) -> str:
+    return topic.lower().replace(" ", "_").replace(":", "").replace("/", "_")
 
-    def generate_content(prompt: str) -> str:
-        """Generate content using Groq"""
-        try:
-            messages.append({"role": "user", "content": prompt})
-            response = client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=messages[-6:],
-                temperature=0.7,
-                max_tokens=2000,
-                top_p=1.0
-            )
-            content = response.choices[0].message.content.strip()
-            messages.append({"role": "assistant", "content": content})
-            logging.info(f"Generated content for prompt: {prompt[:50]}...")
-            return content
-        except Exception as e:
-            logging.error(f"Content generation failed: {str(e)}")
-            return f"Error: {str(e)}"
+def _OpenFile(filepath: str, editor: Optional[str] = None) -> None:
+    if editor:
+        subprocess.Popen([editor, filepath])
+    elif os.name == "nt":
+        os.startfile(filepath)
+    else:
+        subprocess.Popen(["xdg-open", filepath])
 
-    def save_and_open(content: str, filename: str) -> Tuple[bool, Optional[str]]:
-        """Save content to file and open in editor"""
-        try:
-            os.makedirs("data", exist_ok=True)
-            filepath = os.path.join("data", f"{filename}.txt")
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(content)
-            logging.info(f"Saved content to {filepath}")
-            editor = "notepad.exe" if os.name == "nt" else "gedit"
-            subprocess.Popen([editor, filepath])
-            return True, None
-        except Exception as e:
-            error_msg = f"File operation failed: {str(e)}"
-            logging.error(error_msg)
-            return False, error_msg
+def _CleanTopic(topic: str) -> str:
+    return topic.strip()[:100]
 
+def _Document(topic: str, template: str, document: Optional[Future]) -> Tuple[Optional[str], Optional[str]]:
+    """The (content, error) of a batch-submitted document, or generate it now."""
+    if document is not None:
+        return document.result()
+    return GenerateDocument(client.get(), topic, template)
+
+def Content(topic: str, document: Optional[Future] = None) -> Tuple[bool, Optional[str]]:
+    """Generate and save AI content using Groq (cached per topic)"""
     logging.info(f"Starting content generation for: {topic}")
-    clean_topic = topic.strip()[:100]
-    content = generate_content(clean_topic)
-    
-    if content.startswith("Error:"):
-        logging.error(content)
-        return False, content
-        
-    filename = clean_topic.lower().replace(" ", "_").replace(":", "").replace("/", "_")
-    success, error = save_and_open(f"Topic: {clean_topic}\n\n{content}", filename)
-    return success, error
-
-def CreateGammaPresentation(topic: str) -> Tuple[bool, Optional[str]]:
-    """Generate a PowerPoint presentation using Groq"""
-    if not client:
-        error_msg = "Cannot generate presentation: Groq client not initialized"
+    clean_topic = _CleanTopic(topic)
+    content, error = _Document(clean_topic, "essay", document)
+    if error:
+        error_msg = f"Cannot generate content: {error}"
         logging.error(error_msg)
         return False, error_msg
 
-    def generate_presentation_content(prompt: str) -> str:
-        """Generate presentation content using Groq"""
-        try:
-            messages.append({"role": "user", "content": f"Create a presentation outline about {prompt} with 6 slides: Title, Purpose, Key Features, How It Works, Example Usage, and Conclusion. For each slide, provide a title and 3-5 concise bullet points. Format as plain text with slide titles prefixed by 'Slide X: ' and bullet points prefixed by '- '. Separate slides with a blank line."})
-            response = client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=messages[-6:],
-                temperature=0.7,
-                max_tokens=2000,
-                top_p=1.0
-            )
-            content = response.choices[0].message.content.strip()
-            messages.append({"role": "assistant", "content": content})
-            logging.info(f"Generated presentation content for: {prompt[:50]}...")
-            return content
-        except Exception as e:
-            logging.error(f"Presentation content generation failed: {str(e)}")
-            return f"Error: {str(e)}"
-
-    def save_and_open_presentation(content: str, filename: str) -> Tuple[bool, Optional[str]]:
-        """Save presentation content to PowerPoint file and open"""
-        try:
-            prs = Presentation()
-            slide_layout = prs.slide_layouts[6]
-
-            slides = content.split("\n\n")
-            for slide_text in slides:
-                lines = slide_text.split("\n")
-                if not lines or not lines[0].startswith("Slide"):
-                    continue
-
-                slide = prs.slides.add_slide(slide_layout)
-                
-                title_text = lines[0].replace("Slide ", "").replace(": ", "")
-                title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
-                title_frame = title_box.text_frame
-                title_frame.text = title_text
-                title_frame.paragraphs[0].font.size = Pt(32)
-
-                content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5))
-                text_frame = content_box.text_frame
-                for bullet in lines[1:]:
-                    if bullet.startswith("- "):
-                        p = text_frame.add_paragraph()
-                        p.text = bullet[2:].strip()
-                        p.level = 0
-                        p.font.size = Pt(18)
-                        p.alignment = PP_ALIGN.LEFT
-
-            os.makedirs("data", exist_ok=True)
-            filepath = os.path.join("data", f"{filename}.pptx")
-            prs.save(filepath)
-            logging.info(f"Presentation saved to {filepath}")
-
-            if os.name == "nt":
-                os.startfile(filepath)
-            else:
-                subprocess.Popen(["xdg-open", filepath])
-            return True, None
-        except Exception as e:
-            error_msg = f"Presentation file operation failed: {str(e)}"
-            logging.error(error_msg)
-            return False, error_msg
+    try:
+        os.makedirs("data", exist_ok=True)
+        filepath = os.path.join("data", f"{_DocumentFilename(clean_topic)}.txt")
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(f"Topic: {clean_topic}\n\n{content}")
+        logging.info(f"Saved content to {filepath}")
+        _OpenFile(filepath, "notepad.exe" if os.name == "nt" else "gedit")
+        return True, None
+    except Exception as e:
+        error_msg = f"File operation failed: {str(e)}"
+        logging.error(error_msg)
+        return False, error_msg
 
+def CreateGammaPresentation(topic: str, document: Optional[Future] = None) -> Tuple[bool, Optional[str]]:
+    """Generate a PowerPoint presentation using Groq (outline cached per topic)"""
     logging.info(f"Starting presentation generation for: {topic}")
-    clean_topic = topic.strip()[:100]
-    content = generate_presentation_content(clean_topic)
-    
-    if content.startswith("Error:"):
-        logging.error(content)
-        return False, content
-        
-    filename = clean_topic.lower().replace(" ", "_").replace(":", "").replace("/", "_")
-    success, error = save_and_open_presentation(content, filename)
-    return success, error
+    clean_topic = _CleanTopic(topic)
+    content, error = _Document(clean_topic, "presentation", document)
+    if error:
+        error_msg = f"Cannot generate presentation: {error}"
+        logging.error(error_msg)
+        return False, error_msg
+
+    slides = ParseSlides(content)
+    if not slides:
+        return False, "Presentation outline had no slides"
+    try:
+        filepath = os.path.join("data", f"{_DocumentFilename(clean_topic)}.pptx")
+        WritePresentation(slides, filepath)
+        logging.info(f"Presentation saved to {filepath}")
+        _OpenFile(filepath)
+        return True, None
+    except Exception as e:
+        error_msg = f"Presentation file operation failed: {str(e)}"
+        logging.error(error_msg)
+        return False, error_msg
 
 def YoutubeSearch(query: str) -> Tuple[bool, Optional[str]]:
     """Search YouTube"""
@@ -509,6 +441,7 @@ def YoutubeSearch(query: str) -> Tuple[bool, Optional[str]]:
 def PlayYoutube(query: str) -> Tuple[bool, Optional[str]]:
     """Play YouTube video"""
     try:
+        from pywhatkit import playonyt
         playonyt(query)
         logging.info(f"YouTube playback started for: {query}")
         return True, None
@@ -520,6 +453,7 @@ def PlayYoutube(query: str) -> Tuple[bool, Optional[str]]:
 def OpenApp(app_name: str) -> Tuple[bool, Optional[str]]:
     """Open application with screen-aware verification"""
     try:
+        from AppOpener import open as appopen  # AppOpener scans installed apps on import
         appopen(app_name, match_closest=True, throw_error=True)
         logging.info(f"Opened app: {app_name}")
         
@@ -534,13 +468,8 @@ def OpenApp(app_name: str) -> Tuple[bool, Optional[str]]:
         
         return True, None
     except Exception:
-        if not session:
-            error_msg = f"Cannot open website for {app_name}: HTTP session not initialized"
-            logging.error(error_msg)
-            return False, error_msg
         try:
-            url = f"https://www.google.com/search?q={app_name}+official+site"
-            response = session.get(url)
+            response = get_http_client().get("https://www.google.com/search", params={"q": f"{app_name} official site"})
             soup = BeautifulSoup(response.text, "html.parser")
             link = soup.find("a", {"jsname": "UWckNb"})
             if link and (href := link.get("href")):
@@ -559,6 +488,7 @@ def CloseApp(app_name: str) -> Tuple[bool, Optional[str]]:
     """Close application or folder"""
     logging.info(f"Attempting to close: {app_name}")
     try:
+        from AppOpener import close
         if "youtube" in app_name.lower():
             try:
                 close("youtube", match_closest=True, throw_error=True)
@@ -875,10 +805,58 @@ def ReadScreenText() -> Tuple[bool, Optional[str]]:
 # Command Translation and Execution
 # --------------------------------------------------------------------------- #
 
+# Handlers for the automation commands declared in Backend/Commands.py
+registry.bind({
+    "open": OpenApp,
+    "close": CloseApp,
+    "play": PlayYoutube,
+    "google search": GoogleSearch,
+    "youtube search": YoutubeSearch,
+    "system": System,
+    "send mail": SendMail,
+    "content": Content,
+    "create presentation": CreateGammaPresentation,
+    "voice type": VoiceType,
+    "read clipboard": ReadClipboard,
+    "write to clipboard": WriteToClipboard,
+    "minimize window": MinimizeWindow,
+    "maximize window": MaximizeWindow,
+    "switch window": SwitchWindow,
+    "create file": CreateFile,
+    "read file": ReadFile,
+    "screenshot": TakeScreenshot,
+    "screen info": GetScreenInfo,
+    "analyze screen": AnalyzeScreen,
+    "read screen": ReadScreenText,
+    "find text": FindTextOnScreen,
+    "observe screen": ObserveScreen,
+})
+
+# Document commands and the template each one generates
+DOCUMENT_TEMPLATES = {"content": "essay", "create presentation": "presentation"}
+
+def _SubmitDocumentBatch(matches: list) -> Dict[int, Future]:
+    """
+    When one decision asks for several essays/decks, submit them together on the bounded content
+    pool so they generate concurrently; returns the future for each match position.
+    """
+    documents = [(i, m) for i, m in enumerate(matches) if m.spec.name in DOCUMENT_TEMPLATES]
+    if len(documents) < 2:
+        return {}
+    groq_client = client.get()
+    futures = {}
+    for template in set(DOCUMENT_TEMPLATES.values()):
+        batch = [(i, m) for i, m in documents if DOCUMENT_TEMPLATES[m.spec.name] == template]
+        topics = [_CleanTopic(m.args[0]) for _, m in batch]
+        for (i, _), future in zip(batch, SubmitDocuments(groq_client, topics, template)):
+            futures[i] = future
+    return futures
+
 async def TranslateAndExecute(commands: list[str]) -> Tuple[List[bool], Optional[str]]:
-    """Process commands asynchronously with improved error handling"""
-    tasks = []
+    """Schedule commands by lane (UI steps in order, I/O in parallel) with improved error handling"""
+    scheduler = CommandScheduler(after_ui=frame_cache.invalidate)
     errors = []
+    matches = []
     
     for command in commands:
         cmd = command.strip().lower()
@@ -886,104 +864,30 @@ async def TranslateAndExecute(commands: list[str]) -> Tuple[List[bool], Optional
             continue
             
         try:
-            if cmd.startswith("open "):
-                app = cmd[5:].strip()
-                tasks.append(asyncio.to_thread(OpenApp, app))
-            elif cmd.startswith("close "):
-                app = cmd[6:].strip()
-                tasks.append(asyncio.to_thread(CloseApp, app))
-            elif cmd.startswith("play "):
-                query = cmd[5:].strip()
-                tasks.append(asyncio.to_thread(PlayYoutube, query))
-            elif cmd.startswith(("write ", "content ")):
-                topic = cmd.split(" ", 1)[1].strip()
-                if not client:
-                    errors.append(f"Skipping content generation for '{topic}': Groq client not initialized")
-                    continue
-                tasks.append(asyncio.to_thread(Content, topic))
-            elif cmd.startswith("create presentation "):
-                topic = cmd[19:].strip()
-                if not client:
-                    errors.append(f"Skipping presentation generation for '{topic}': Groq client not initialized")
-                    continue
-                tasks.append(asyncio.to_thread(CreateGammaPresentation, topic))
-            elif cmd.startswith("google search "):
-                query = cmd[14:].strip()
-                tasks.append(asyncio.to_thread(GoogleSearch, query))
-            elif cmd.startswith("youtube search "):
-                query = cmd[15:].strip()
-                tasks.append(asyncio.to_thread(YoutubeSearch, query))
-            elif cmd.startswith("system "):
-                command = cmd[7:].strip()
-                tasks.append(asyncio.to_thread(System, command))
-            elif cmd.startswith("send mail "):
-                parts = cmd[9:].split(" about ", 1)
-                to_address = parts[0].replace("to ", "").strip()
-                subject_body = parts[1].split(" with ", 1) if len(parts) > 1 else ["", ""]
-                tasks.append(asyncio.to_thread(
-                    SendMail,
-                    to_address,
-                    subject_body[0].strip(),
-                    subject_body[1].strip() if len(subject_body) > 1 else ""
-                ))
-            elif cmd.startswith("voice type ") or cmd.startswith("type "):
-                text = cmd.split(" ", 2)[2].strip() if cmd.startswith("voice type ") else cmd[5:].strip()
-                tasks.append(asyncio.to_thread(VoiceType, text))
-            elif cmd.startswith("screenshot") or cmd.startswith("take screenshot"):
-                filename = None
-                if "named" in cmd or "save as" in cmd:
-                    parts = cmd.split("named" if "named" in cmd else "save as", 1)
-                    if len(parts) > 1:
-                        filename = parts[1].strip() + ".png"
-                tasks.append(asyncio.to_thread(TakeScreenshot, filename))
-            elif cmd.startswith("read clipboard"):
-                tasks.append(asyncio.to_thread(ReadClipboard))
-            elif cmd.startswith("copy to clipboard ") or cmd.startswith("write to clipboard "):
-                text = cmd.split(" ", 3)[3].strip() if "copy to clipboard" in cmd else cmd.split(" ", 3)[3].strip()
-                tasks.append(asyncio.to_thread(WriteToClipboard, text))
-            elif cmd.startswith("minimize window"):
-                tasks.append(asyncio.to_thread(MinimizeWindow))
-            elif cmd.startswith("maximize window"):
-                tasks.append(asyncio.to_thread(MaximizeWindow))
-            elif cmd.startswith("switch window"):
-                tasks.append(asyncio.to_thread(SwitchWindow))
-            elif cmd.startswith("create file "):
-                parts = cmd[12:].split(" with content ", 1)
-                filename = parts[0].strip()
-                content = parts[1].strip() if len(parts) > 1 else ""
-                tasks.append(asyncio.to_thread(CreateFile, filename, content))
-            elif cmd.startswith("read file "):
-                filename = cmd[10:].strip()
-                tasks.append(asyncio.to_thread(ReadFile, filename))
-            elif cmd.startswith("screen info") or cmd.startswith("get screen info"):
-                tasks.append(asyncio.to_thread(GetScreenInfo))
-            elif cmd.startswith("analyze screen") or cmd.startswith("screen analysis"):
-                tasks.append(asyncio.to_thread(AnalyzeScreen))
-            elif cmd.startswith("read screen") or cmd.startswith("read screen text"):
-                tasks.append(asyncio.to_thread(ReadScreenText))
-            elif cmd.startswith("find text ") or cmd.startswith("click on "):
-                # Extract text to find
-                text_to_find = cmd.split("find text ", 1)[1] if "find text" in cmd else cmd.split("click on ", 1)[1]
-                tasks.append(asyncio.to_thread(FindTextOnScreen, text_to_find))
-            elif cmd.startswith("observe screen") or cmd.startswith("what's on screen"):
-                # Extract query if provided
-                query = cmd.split("observe screen", 1)[1].strip() if "observe screen" in cmd else cmd.split("what's on screen", 1)[1].strip() if "what's on screen" in cmd else "analyze screen"
-                if not query:
-                    query = "analyze screen"
-                tasks.append(asyncio.to_thread(ObserveScreen, query))
-            else:
+            match = registry.match(cmd)
+            if match is None or match.spec.kind != AUTOMATION:
                 logging.warning(f"Unknown command: {cmd}")
                 errors.append(f"Unknown command: {cmd}")
+                continue
+            matches.append(match)
         except Exception as e:
             error_msg = f"Command processing error: {str(e)}"
             logging.error(error_msg)
             errors.append(error_msg)
 
-    if not tasks:
+    documents = _SubmitDocumentBatch(matches)
+    for i, match in enumerate(matches):
+        spec = match.spec
+        handler = spec.handler
+        if i in documents:
+            handler = functools.partial(handler, document=documents[i])
+        scheduler.add(match.text, handler, *match.args, lane=spec.lane, timeout=spec.timeout, cost=spec.cost)
+
+    if not scheduler:
         error_msg = "No valid commands to execute" + ("; " + "; ".join(errors) if errors else "")
         return [], error_msg
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    results = await scheduler.run()
     
     # Process results - extract success/failure from tuples
     processed_results = []
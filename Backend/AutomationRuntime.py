@@ -0,0 +1,136 @@
+import sys
+import os
+# Patch sys.path to the project root if run directly (so "from Backend..." imports work)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import asyncio
+import threading
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Coroutine, Dict, List, Optional, Set, Tuple
+from dotenv import dotenv_values
+
+# Long-lived home for automation coroutines. One background thread owns an asyncio event loop
+# whose default executor is a bounded thread pool (so every asyncio.to_thread call made by the
+# command scheduler shares it). Callers submit work from any thread and get a
+# concurrent.futures.Future back, instead of paying asyncio.run's loop and pool setup per call.
+
+env_vars = dotenv_values(".env")
+AUTOMATION_WORKERS = int(env_vars.get("AutomationWorkers", 8))
+
+logger = logging.getLogger(__name__)
+
+
+class AutomationRuntime:
+    """Persistent event loop + bounded worker pool with a future-based submission API."""
+
+    def __init__(self, max_workers: int = AUTOMATION_WORKERS):
+        self.max_workers = max_workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
+        self._started = threading.Event()
+        self._counts = {"submitted": 0, "completed": 0, "failed": 0, "cancelled": 0}
+
+    def start(self) -> "AutomationRuntime":
+        with self._lock:
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="automation")
+                self._thread = threading.Thread(target=self._run_loop, name="automation-loop", daemon=True)
+                self._thread.start()
+        self._started.wait()
+        return self
+
+    def _run_loop(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._loop.set_default_executor(self._executor)
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    def submit(self, coroutine: Coroutine[Any, Any, Any]) -> Future:
+        """Schedule a coroutine on the runtime loop; future.cancel() cancels the task."""
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        with self._lock:
+            self._pending.add(future)
+            self._counts["submitted"] += 1
+        future.add_done_callback(self._finished)
+        return future
+
+    def _finished(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+            if future.cancelled():
+                self._counts["cancelled"] += 1
+            elif future.exception() is not None:
+                self._counts["failed"] += 1
+            else:
+                self._counts["completed"] += 1
+
+    def submit_commands(self, commands: List[str]) -> Future:
+        """Run one utterance's commands through Automation(); the future yields (success, error)."""
+        from Backend.Automation import Automation
+        return self.submit(Automation(commands))
+
+    def run_commands(self, commands: List[str], timeout: Optional[float] = None) -> Tuple[bool, Optional[str]]:
+        """Blocking form of submit_commands for synchronous callers."""
+        future = self.submit_commands(commands)
+        try:
+            return future.result(timeout)
+        except Exception as e:
+            future.cancel()
+            return False, f"Automation error: {e}"
+
+    @property
+    def queue_depth(self) -> int:
+        """Submitted jobs that have not finished yet (running or waiting)."""
+        with self._lock:
+            return len(self._pending)
+
+    def cancel_all(self) -> int:
+        """Cancel every unfinished job; returns how many were cancelled."""
+        with self._lock:
+            pending = list(self._pending)
+        return sum(future.cancel() for future in pending)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts, queue_depth=len(self._pending), workers=self.max_workers)
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Cancel outstanding work, stop the loop and release the worker pool."""
+        if self._thread is None:
+            return
+        self.cancel_all()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._thread = None
+            self._loop = None
+            self._started.clear()
+
+
+# Global instance
+_runtime = None
+_runtime_lock = threading.Lock()
+
+def get_automation_runtime() -> AutomationRuntime:
+    """Get the global automation runtime, starting its loop thread on first use."""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = AutomationRuntime()
+        return _runtime.start()
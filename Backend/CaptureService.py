@@ -0,0 +1,186 @@
+import sys
+import os
+# Patch sys.path to the project root if run directly (so "from Backend..." imports work)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import threading
+import time
+import logging
+from typing import Dict, Optional
+import cv2
+import numpy as np
+from PIL import Image
+from Backend.FrameCache import frame_cache, RegionKey
+
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+# Single screen-capture path for screenshots, screen analysis and OCR. A grab is exposed as a
+# zero-copy NumPy view over the mss buffer; BGR, grayscale and PIL versions are only built
+# when a consumer asks for them, and then memoized on the frame. Recent grabs are shared
+# through the frame cache.
+
+logger = logging.getLogger(__name__)
+
+
+class CapturedFrame:
+    """One screen grab. `raw` is a read-only (H, W, 4) BGRA view of the mss buffer."""
+
+    def __init__(self, shot, region: Dict[str, int]):
+        self._shot = shot  # keeps the buffer behind `raw` alive
+        self.region = region
+        self.timestamp = time.monotonic()
+        self.raw = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        self.raw.setflags(write=False)
+        self._bgr = None
+        self._gray = None
+        self._pil = None
+        self._lock = threading.Lock()
+
+    @property
+    def width(self) -> int:
+        return self.raw.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.raw.shape[0]
+
+    @property
+    def bgr(self) -> np.ndarray:
+        """BGR copy for OpenCV consumers (converted once, read-only)."""
+        with self._lock:
+            if self._bgr is None:
+                self._bgr = cv2.cvtColor(self.raw, cv2.COLOR_BGRA2BGR)
+                self._bgr.setflags(write=False)
+            return self._bgr
+
+    @property
+    def gray(self) -> np.ndarray:
+        with self._lock:
+            if self._gray is None:
+                self._gray = cv2.cvtColor(self.raw, cv2.COLOR_BGRA2GRAY)
+                self._gray.setflags(write=False)
+            return self._gray
+
+    def pil(self) -> Image.Image:
+        """RGB PIL image decoded straight from the BGRA buffer (no intermediate NumPy copy)."""
+        with self._lock:
+            if self._pil is None:
+                self._pil = Image.frombuffer("RGB", (self.width, self.height), self._shot.raw, "raw", "BGRX", 0, 1)
+            return self._pil.copy()
+
+    def save(self, path: str) -> bool:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return bool(cv2.imwrite(path, self.bgr))
+
+
+class CaptureService:
+    """Thread-safe screen grabs: one mss handle per thread, results shared via the frame cache."""
+
+    def __init__(self):
+        if not MSS_AVAILABLE:
+            raise ImportError("mss module is not available. Please install it with: pip install mss")
+        self._local = threading.local()
+        self.monitor = dict(self._sct().monitors[0])
+
+    def _sct(self):
+        # mss handles are not thread-safe, so every thread gets its own
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = self._local.sct = mss.mss()
+        return sct
+
+    def _monitor_for(self, region: Optional[Dict[str, int]]) -> Dict[str, int]:
+        if not region:
+            return self.monitor
+        return {
+            "top": region.get("top", 0),
+            "left": region.get("left", 0),
+            "width": region.get("width", self.monitor["width"]),
+            "height": region.get("height", self.monitor["height"])
+        }
+
+    def grab(self, region: Optional[Dict[str, int]] = None, fresh: bool = False) -> Optional[CapturedFrame]:
+        """Capture the screen or a region; reuses a grab younger than the frame cache TTL unless fresh=True."""
+        def capture():
+            monitor = self._monitor_for(region)
+            try:
+                return CapturedFrame(self._sct().grab(monitor), monitor)
+            except Exception as e:
+                logger.error(f"Screen capture failed: {e}")
+                return None
+        key = RegionKey(region)
+        if fresh:
+            frame = capture()
+            if frame is not None:
+                frame_cache.put(key, frame)
+            return frame
+        return frame_cache.get_or_capture(key, capture)
+
+    @staticmethod
+    def invalidate() -> None:
+        """Forget cached grabs, e.g. after an action changed the screen."""
+        frame_cache.invalidate()
+
+
+# Global instance
+_capture_service = None
+_capture_service_lock = threading.Lock()
+
+def get_capture_service() -> Optional[CaptureService]:
+    """Get or create the global capture service (None if mss is unavailable)."""
+    global _capture_service
+    with _capture_service_lock:
+        if _capture_service is None:
+            try:
+                _capture_service = CaptureService()
+            except Exception as e:
+                logger.error(f"Failed to create capture service: {e}")
+                return None
+        return _capture_service
+
+
+def BenchmarkCapture(iterations: int = 20) -> Dict[str, float]:
+    """Mean milliseconds per full-screen capture for the old and new paths."""
+    from PIL import ImageGrab
+    service = get_capture_service()
+    if service is None:
+        return {}
+    sct = mss.mss()
+
+    def timed(func):
+        func()  # warm-up
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - start) * 1000 / iterations
+
+    results = {
+        "old: ImageGrab.grab -> PIL": timed(lambda: ImageGrab.grab()),
+        "old: mss -> np.array + cvtColor -> BGR": timed(
+            lambda: cv2.cvtColor(np.array(sct.grab(service.monitor)), cv2.COLOR_BGRA2BGR)),
+        "new: grab().raw (zero-copy BGRA)": timed(lambda: service.grab(fresh=True).raw),
+        "new: grab().bgr": timed(lambda: service.grab(fresh=True).bgr),
+        "new: grab().pil()": timed(lambda: service.grab(fresh=True).pil()),
+        "new: cached grab().bgr": timed(lambda: service.grab().bgr),
+    }
+    sct.close()
+    return results
+
+
+if __name__ == "__main__":
+    from rich import print
+    from rich.table import Table
+    table = Table(title="Screen capture benchmark (ms per full-screen frame)")
+    table.add_column("Path")
+    table.add_column("ms", justify="right")
+    for path, milliseconds in BenchmarkCapture().items():
+        table.add_row(path, f"{milliseconds:.1f}")
+    print(table)
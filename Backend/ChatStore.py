@@ -0,0 +1,160 @@
+import sys
+import os
+# Patch sys.path to the project root if run directly (so "from Backend..." imports work)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import json
+import threading
+import logging
+from typing import Callable, Dict, List, Optional
+from Backend.utils import AnswerModifier, ASSISTANT_NAME, USERNAME
+
+# Append-only chat history. Each message is one JSON line in Data/ChatLog.jsonl, so saving a
+# turn is an O(1) append instead of rewriting the whole log. The full history is read from disk
+# once per process and kept in memory; readers get copies or tails of that index.
+
+CHAT_LOG_PATH = os.path.join("Data", "ChatLog.jsonl")
+LEGACY_CHAT_LOG_PATH = os.path.join("Data", "ChatLog.json")
+
+
+class ChatStore:
+    """Thread-safe JSONL chat log with an in-memory index of all entries."""
+
+    def __init__(self, path: str = CHAT_LOG_PATH, legacy_path: Optional[str] = LEGACY_CHAT_LOG_PATH):
+        self.path = path
+        self.legacy_path = legacy_path
+        self._lock = threading.Lock()
+        self._entries: List[Dict[str, str]] = []
+        self._loaded = False
+
+    def _load(self) -> None:
+        """Read the log once; migrate the legacy ChatLog.json the first time."""
+        if self._loaded:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not os.path.exists(self.path) and self.legacy_path and os.path.exists(self.legacy_path):
+            self._migrate_legacy()
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                for number, line in enumerate(file, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        logging.warning(f"Skipping corrupt chat log line {number}")
+                        continue
+                    if isinstance(entry, dict) and "role" in entry:
+                        self._entries.append({"role": entry["role"], "content": entry.get("content", "")})
+        except FileNotFoundError:
+            pass
+        self._loaded = True
+
+    def _migrate_legacy(self) -> None:
+        try:
+            with open(self.legacy_path, "r", encoding="utf-8") as file:
+                legacy = json.load(file)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read legacy chat log {self.legacy_path}: {e}")
+            return
+        if not isinstance(legacy, list):
+            return
+        with open(self.path, "w", encoding="utf-8") as file:
+            for entry in legacy:
+                if isinstance(entry, dict) and "role" in entry:
+                    file.write(json.dumps({"role": entry["role"], "content": entry.get("content", "")}, ensure_ascii=False) + "\n")
+        logging.info(f"Migrated {len(legacy)} messages from {self.legacy_path} to {self.path}")
+
+    def extend(self, entries: List[Dict[str, str]]) -> None:
+        """Append messages to the log (one JSON line each) and to the in-memory index."""
+        entries = [{"role": e["role"], "content": e.get("content", "")} for e in entries]
+        if not entries:
+            return
+        with self._lock:
+            self._load()
+            try:
+                with open(self.path, "a", encoding="utf-8") as file:
+                    file.write("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries))
+            except OSError as e:
+                logging.error(f"Error appending to chat log: {e}")
+            self._entries.extend(entries)
+
+    def append(self, role: str, content: str) -> None:
+        self.extend([{"role": role, "content": content}])
+
+    def messages(self) -> List[Dict[str, str]]:
+        """Copy of the full history."""
+        with self._lock:
+            self._load()
+            return [dict(e) for e in self._entries]
+
+    def tail(self, count: int) -> List[Dict[str, str]]:
+        """Copy of the last `count` messages."""
+        with self._lock:
+            self._load()
+            return [dict(e) for e in self._entries[-count:]] if count > 0 else []
+
+    def page(self, start: int, end: int) -> List[Dict[str, str]]:
+        """Copy of the messages at positions start..end-1 (for loading older history on demand)."""
+        with self._lock:
+            self._load()
+            return [dict(e) for e in self._entries[max(start, 0):end]]
+
+    def since(self, index: int) -> List[Dict[str, str]]:
+        """Copy of the messages appended at or after position `index`."""
+        with self._lock:
+            self._load()
+            return [dict(e) for e in self._entries[index:]]
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._entries)
+
+
+def FormatChatEntry(entry: Dict[str, str]) -> str:
+    """Render one message the way the GUI chat history shows it."""
+    if entry.get("role") == "user":
+        return f"{USERNAME}: {entry.get('content', '')} 😄"
+    if entry.get("role") == "assistant":
+        return f"{ASSISTANT_NAME}: {entry.get('content', '')} 🌟"
+    return ""
+
+
+class IncrementalChatFormatter:
+    """Renders only messages added since the previous call."""
+
+    def __init__(self, store: ChatStore, formatter: Callable[[Dict[str, str]], str] = FormatChatEntry):
+        self.store = store
+        self.formatter = formatter
+        self._rendered = 0
+        self._lock = threading.Lock()
+
+    def render_new(self) -> str:
+        """Formatted text for the messages not rendered yet ('' if there are none)."""
+        with self._lock:
+            entries = self.store.since(self._rendered)
+            self._rendered += len(entries)
+            return AnswerModifier("\n".join(filter(None, (self.formatter(e) for e in entries))))
+
+    @property
+    def rendered_count(self) -> int:
+        return self._rendered
+
+
+# Global instance
+_chat_store = None
+_chat_store_lock = threading.Lock()
+
+def get_chat_store() -> ChatStore:
+    """Get or create the global chat store instance."""
+    global _chat_store
+    with _chat_store_lock:
+        if _chat_store is None:
+            _chat_store = ChatStore()
+        return _chat_store
@@ -5,11 +5,14 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from groq import Groq
-from json import load, dump
 import datetime
+import re
 from dotenv import dotenv_values
 from Backend.utils import AnswerModifier
+from Backend.ChatStore import get_chat_store
+from Backend.ContextWindow import ConversationWindow
+from Backend.Startup import LazyResource
+from Backend.HttpClient import CreateGroqClient
 
 # Load environment variables
 env_vars = dotenv_values(".env")
@@ -17,54 +20,105 @@ Username = env_vars.get("Username")
 Assistantname = env_vars.get("Assistantname")
 GroqAPIKey = env_vars.get("GroqAPIKey")
 
-client = None
-if GroqAPIKey:
-    try:
-        client = Groq(api_key=GroqAPIKey)
-    except Exception as api_error:
-        print(f"[red]Groq initialization error: {api_error}[/red]")
+def _CreateGroqClient():
+    if not GroqAPIKey:
+        raise RuntimeError("GroqAPIKey not found in .env")
+    return CreateGroqClient(GroqAPIKey)
+
+# Created on first use (or warmed by the startup orchestrator)
+client = LazyResource("Groq (chatbot)", _CreateGroqClient)
 
-messages = []
+# Recent turns within the token budget; older turns are folded into a rolling summary
+conversation = ConversationWindow()
 System = f"""Hello, I am {Username}, You are a very accurate and advanced AI chatbot named {Assistantname} which also has real-time up-to-date information from the internet.\n*** Do not tell time until I ask, do not talk too much, just answer the question.***\n*** Reply in only English, even if the question is in Hindi, reply in English.***\n*** Do not provide notes in the output, just answer the question and never mention your training data. ***\n"""
 SystemChatBot = [{"role": "system", "content": System}]
 
-chat_log_path = "Data/ChatLog.json"
-os.makedirs(os.path.dirname(chat_log_path), exist_ok=True)
+# Sentence boundary used when streaming: end punctuation followed by whitespace, or a line break
+SENTENCE_BOUNDARY = re.compile(r"[.!?]+[\"')\]]*\s+|\n+")
+MIN_SENTENCE_CHARS = 12  # very short fragments are merged into the next sentence
+
+def _RequestCompletion():
+    """Start a streaming Groq completion over the current conversation."""
+    return client.get().chat.completions.create(
+        model="llama-3.3-70b-versatile",
+        messages=conversation.build(SystemChatBot),
+        max_tokens=1024,
+        temperature=0.7,
+        top_p=1,
+        stream=True
+    )
+
+def _RecordAnswer(query, answer):
+    conversation.add("assistant", answer)
+    # Append just this turn to the chat log instead of rewriting it
+    get_chat_store().extend([{"role": "user", "content": query}, {"role": "assistant", "content": answer}])
+
+def SplitSentences(deltas):
+    """
+    Regroup streamed text deltas into sentence-sized pieces as soon as each sentence is complete.
+    Pieces keep their trailing whitespace, so "".join(pieces) reproduces the full text.
+    """
+    buffer = ""
+    for delta in deltas:
+        buffer += delta
+        start = 0
+        for match in SENTENCE_BOUNDARY.finditer(buffer):
+            if len(buffer[start:match.end()].strip()) >= MIN_SENTENCE_CHARS:
+                yield buffer[start:match.end()]
+                start = match.end()
+        buffer = buffer[start:]
+    if buffer.strip():
+        yield buffer
 
 # ---
 def ChatBot(query):
     """
     Query Groq chatbot for an answer. Returns (answer_string, error_message_or_None)
     """
-    global messages
-    if client is None:
+    if client.get() is None:
         msg = "Groqkey missing or initialization failed."
         print(f"[yellow]{msg}[/yellow]")
         return "Sorry, chatbot is unavailable right now.", msg
     try:
-        messages.append({"role": "user", "content": query})
-        completion = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=SystemChatBot + messages,
-            max_tokens=1024,
-            temperature=0.7,
-            top_p=1,
-            stream=True
-        )
+        conversation.add("user", query)
+        completion = _RequestCompletion()
         answer = ""
         for chunk in completion:
             if chunk.choices[0].delta.content:
                 answer += chunk.choices[0].delta.content
         answer = answer.replace("</s>", "").strip()
-        messages.append({"role": "assistant", "content": answer})
-        with open(chat_log_path, "w") as f:
-            dump(messages, f, indent=4)
+        _RecordAnswer(query, answer)
         return AnswerModifier(answer), None
     except Exception as e:
         msg = f"Groq chatbot error: {e}"
         print(f"[red]{msg}[/red]")
         return "Sorry, I couldn't answer due to an internal error.", msg
 
+def ChatBotStream(query):
+    """
+    Streaming variant of ChatBot: yields (sentence, error_message_or_None) as Groq produces text,
+    so speech can start before the whole answer exists. "".join of the sentences is the answer.
+    """
+    if client.get() is None:
+        msg = "Groqkey missing or initialization failed."
+        print(f"[yellow]{msg}[/yellow]")
+        yield "Sorry, chatbot is unavailable right now.", msg
+        return
+    answer = ""
+    try:
+        conversation.add("user", query)
+        completion = _RequestCompletion()
+        deltas = (chunk.choices[0].delta.content for chunk in completion if chunk.choices[0].delta.content)
+        for sentence in SplitSentences(deltas):
+            sentence = sentence.replace("</s>", "")
+            answer += sentence
+            yield sentence, None
+        _RecordAnswer(query, answer.strip())
+    except Exception as e:
+        msg = f"Groq chatbot error: {e}"
+        print(f"[red]{msg}[/red]")
+        yield ("" if answer else "Sorry, I couldn't answer due to an internal error."), msg
+
 if __name__ == "__main__":
     while True:
         response, err = ChatBot(input("Enter Your Question: "))
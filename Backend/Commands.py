@@ -0,0 +1,223 @@
+import sys
+import os
+# Patch sys.path to the project root if run directly (so "from Backend..." imports work)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from Backend.Scheduler import UI_LANE, SCREEN_LANE, IO_LANE
+
+# Single table of every decision command the assistant understands. Prefixes are stored in a
+# word-level trie, so a command is resolved by walking its words once (longest prefix wins) and
+# "end" can no longer match inside "send mail" or "up" inside "pick up". Each spec carries an
+# argument extractor plus handler metadata (lane, timeout, expected cost) for the scheduler.
+# Automation binds the handlers; main.py, assistant_core, the DMM and the fast router only need
+# the kinds and prefixes, so importing this module stays cheap.
+
+# Command kinds
+CHAT = "chat"              # general / realtime answers
+EXIT = "exit"
+REMINDER = "reminder"
+IMAGE = "image"            # image generation
+AUTOMATION = "automation"  # Automation.TranslateAndExecute
+NAVIGATION = "navigation"  # Navigator.run
+
+Extractor = Callable[[str], Optional[Tuple[Any, ...]]]
+_MAIL = re.compile(r"^(?:to\s+)?(.+?)(?:\s+about\s+(.+?)(?:\s+with\s+(.+))?)?$", re.IGNORECASE | re.DOTALL)
+
+
+# --------------------------------------------------------------------------- #
+# Argument extractors: take the text after the prefix, return the handler's
+# positional arguments, or None when the command does not fit this spec.
+# --------------------------------------------------------------------------- #
+def NoArguments(argument: str) -> Optional[Tuple[Any, ...]]:
+    """Trailing words are ignored ("minimize window now")."""
+    return ()
+
+
+def RequiredText(argument: str) -> Optional[Tuple[Any, ...]]:
+    return (argument,) if argument else None
+
+
+def OptionalText(default: str) -> Extractor:
+    return lambda argument: (argument or default,)
+
+
+def Amount(argument: str) -> Optional[Tuple[Any, ...]]:
+    """Navigation phrases take nothing or a trailing number ("scroll down 10")."""
+    if not argument:
+        return ()
+    return (int(argument),) if argument.isdigit() else None
+
+
+def MailArguments(argument: str) -> Optional[Tuple[Any, ...]]:
+    """"to <address> about <subject> with <body>" -> (address, subject, body)."""
+    match = _MAIL.match(argument)
+    if not match or not match.group(1).strip():
+        return None
+    address, subject, body = match.groups()
+    return address.strip(), (subject or "").strip(), (body or "").strip()
+
+
+def ScreenshotArguments(argument: str) -> Optional[Tuple[Any, ...]]:
+    """Optional "named <name>" / "save as <name>" -> (filename or None,)."""
+    match = re.search(r"(?:named|save as)\s+(.+)$", argument, re.IGNORECASE)
+    return (match.group(1).strip() + ".png",) if match else (None,)
+
+
+def FileArguments(argument: str) -> Optional[Tuple[Any, ...]]:
+    """"<name> with content <text>" -> (name, text)."""
+    filename, _, content = argument.partition(" with content ")
+    return (filename.strip(), content.strip()) if filename.strip() else None
+
+
+@dataclass
+class CommandSpec:
+    name: str
+    prefixes: Tuple[str, ...]
+    kind: str
+    extract: Extractor = RequiredText
+    lane: str = IO_LANE
+    timeout: Optional[float] = None  # seconds the scheduler waits for the handler
+    cost: float = 0.0                # typical run time in seconds
+    handler: Optional[Callable[..., Any]] = None
+
+
+@dataclass
+class CommandMatch:
+    spec: CommandSpec
+    prefix: str
+    argument: str
+    args: Tuple[Any, ...]
+
+    @property
+    def text(self) -> str:
+        return f"{self.prefix} {self.argument}".strip()
+
+
+class _TrieNode:
+    __slots__ = ("children", "spec", "prefix")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.spec: Optional[CommandSpec] = None
+        self.prefix = ""
+
+
+class CommandRegistry:
+    """Word-level prefix trie of CommandSpecs."""
+
+    def __init__(self, specs: Iterable[CommandSpec] = ()):
+        self._root = _TrieNode()
+        self._specs: Dict[str, CommandSpec] = {}
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: CommandSpec) -> CommandSpec:
+        self._specs[spec.name] = spec
+        for prefix in spec.prefixes:
+            node = self._root
+            for word in prefix.split():
+                node = node.children.setdefault(word, _TrieNode())
+            if node.spec is not None and node.spec is not spec:
+                raise ValueError(f"Prefix '{prefix}' is already registered for '{node.spec.name}'")
+            node.spec = spec
+            node.prefix = prefix
+        return spec
+
+    def bind(self, handlers: Dict[str, Callable[..., Any]]) -> None:
+        """Attach handlers to registered specs by command name."""
+        for name, handler in handlers.items():
+            self._specs[name].handler = handler
+
+    def spec(self, name: str) -> CommandSpec:
+        return self._specs[name]
+
+    def match(self, command: str) -> Optional[CommandMatch]:
+        """Longest registered prefix whose extractor accepts the rest of the command."""
+        words = command.split()
+        lowered = [word.lower() for word in words]
+        node = self._root
+        candidates: List[Tuple[int, _TrieNode]] = []
+        for depth, word in enumerate(lowered, 1):
+            node = node.children.get(word)
+            if node is None:
+                break
+            if node.spec is not None:
+                candidates.append((depth, node))
+        for depth, node in reversed(candidates):
+            argument = " ".join(words[depth:])
+            args = node.spec.extract(argument)
+            if args is not None:
+                return CommandMatch(node.spec, node.prefix, argument, args)
+        return None
+
+    def kind(self, command: str) -> Optional[str]:
+        match = self.match(command)
+        return match.spec.kind if match else None
+
+    def prefixes(self, kind: Optional[str] = None) -> List[str]:
+        return [prefix for spec in self._specs.values() if kind is None or spec.kind == kind
+                for prefix in spec.prefixes]
+
+
+def _navigation(*phrases: str) -> List[CommandSpec]:
+    return [CommandSpec(phrase, (phrase,), NAVIGATION, Amount, UI_LANE, 10, 0.2) for phrase in phrases]
+
+
+COMMANDS = [
+    # Decision categories answered by the chat modules
+    CommandSpec("general", ("general",), CHAT, OptionalText("")),
+    CommandSpec("realtime", ("realtime",), CHAT, OptionalText("")),
+    CommandSpec("exit", ("exit",), EXIT, NoArguments),
+    CommandSpec("reminder", ("reminder",), REMINDER, OptionalText("")),
+    CommandSpec("generate image", ("generate image",), IMAGE, RequiredText, IO_LANE, 300, 30),
+    # Apps, media and web
+    CommandSpec("open", ("open",), AUTOMATION, RequiredText, UI_LANE, 20, 2),
+    CommandSpec("close", ("close",), AUTOMATION, RequiredText, UI_LANE, 15, 1),
+    CommandSpec("play", ("play",), AUTOMATION, RequiredText, IO_LANE, 30, 3),
+    CommandSpec("google search", ("google search",), AUTOMATION, RequiredText, IO_LANE, 15, 1),
+    CommandSpec("youtube search", ("youtube search",), AUTOMATION, RequiredText, IO_LANE, 15, 1),
+    CommandSpec("system", ("system",), AUTOMATION, RequiredText, UI_LANE, 10, 0.2),
+    CommandSpec("send mail", ("send mail",), AUTOMATION, MailArguments, IO_LANE, 30, 3),
+    # Generated content
+    CommandSpec("content", ("content", "write"), AUTOMATION, RequiredText, IO_LANE, 120, 10),
+    CommandSpec("create presentation", ("create presentation",), AUTOMATION, RequiredText, IO_LANE, 180, 30),
+    # Typing, clipboard, windows and files
+    CommandSpec("voice type", ("voice type", "type"), AUTOMATION, RequiredText, UI_LANE, 60, 1),
+    CommandSpec("read clipboard", ("read clipboard",), AUTOMATION, NoArguments, IO_LANE, 5, 0.1),
+    CommandSpec("write to clipboard", ("copy to clipboard", "write to clipboard"), AUTOMATION, RequiredText,
+                IO_LANE, 5, 0.1),
+    CommandSpec("minimize window", ("minimize window",), AUTOMATION, NoArguments, UI_LANE, 5, 0.2),
+    CommandSpec("maximize window", ("maximize window",), AUTOMATION, NoArguments, UI_LANE, 5, 0.2),
+    CommandSpec("switch window", ("switch window",), AUTOMATION, NoArguments, UI_LANE, 5, 0.4),
+    CommandSpec("create file", ("create file",), AUTOMATION, FileArguments, IO_LANE, 10, 0.1),
+    CommandSpec("read file", ("read file",), AUTOMATION, RequiredText, IO_LANE, 10, 0.1),
+    # Screen
+    CommandSpec("screenshot", ("screenshot", "take screenshot"), AUTOMATION, ScreenshotArguments,
+                SCREEN_LANE, 15, 0.3),
+    CommandSpec("screen info", ("screen info", "get screen info"), AUTOMATION, NoArguments, IO_LANE, 5, 0.1),
+    CommandSpec("analyze screen", ("analyze screen", "screen analysis"), AUTOMATION, NoArguments,
+                SCREEN_LANE, 60, 3),
+    CommandSpec("read screen", ("read screen", "read screen text"), AUTOMATION, NoArguments, SCREEN_LANE, 60, 3),
+    CommandSpec("find text", ("find text", "click on"), AUTOMATION, RequiredText, UI_LANE, 60, 3),
+    CommandSpec("observe screen", ("observe screen", "what's on screen"), AUTOMATION,
+                OptionalText("analyze screen"), SCREEN_LANE, 90, 5),
+] + _navigation(
+    "scroll up", "scroll down",
+    "swipe left", "swipe right", "swipe up", "swipe down",
+    "zoom in", "zoom out", "zoom reset",
+    "page up", "page down", "home", "end",
+    "left", "right", "up", "down",
+    "enter", "escape", "tab", "backspace", "delete",
+    "select all", "copy", "paste", "cut", "undo", "redo",
+    "save", "refresh", "fullscreen", "find",
+    "close tab", "new tab", "next tab", "previous tab",
+    "go to page",
+)
+
+# Global registry
+registry = CommandRegistry(COMMANDS)
@@ -0,0 +1,188 @@
+import sys
+import os
+# Patch sys.path to the project root if run directly (so "from Backend..." imports work)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import re
+import json
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
+from dotenv import dotenv_values
+
+# Groq document generation for the content and presentation commands. Every request is built
+# from its own message list (no shared conversation state), several topics can be generated
+# concurrently on a bounded pool, and finished documents are cached on disk by a hash of
+# (topic, template, model) so regenerating the same essay or deck does not call the API again.
+
+env_vars = dotenv_values(".env")
+CONTENT_MODEL = "llama-3.3-70b-versatile"
+CONTENT_CACHE_DIR = os.path.join("Data", "ContentCache")
+CONTENT_WORKERS = int(env_vars.get("ContentWorkers", 4))
+
+SYSTEM_PROMPT = {
+    "role": "system",
+    "content": "You are a professional writing assistant. Generate high-quality content in clear, concise English."
+}
+
+TEMPLATES = {
+    "essay": "{topic}",
+    "presentation": (
+        "Create a presentation outline about {topic} with 6 slides: Title, Purpose, Key Features, How It Works, "
+        "Example Usage, and Conclusion. For each slide, provide a title and 3-5 concise bullet points. Format as "
+        "plain text with slide titles prefixed by 'Slide X: ' and bullet points prefixed by '- '. Separate slides "
+        "with a blank line."
+    ),
+}
+
+_SLIDE_PREFIX = re.compile(r"^Slide\s*\d*\s*:\s*")
+logger = logging.getLogger(__name__)
+
+
+class DocumentCache:
+    """One JSON file per generated document, named by the hash of what produced it."""
+
+    def __init__(self, directory: str = CONTENT_CACHE_DIR):
+        self.directory = directory
+
+    @staticmethod
+    def key(topic: str, template: str, model: str) -> str:
+        payload = json.dumps([topic.strip().lower(), TEMPLATES.get(template, template), model])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)["content"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, topic: str, template: str, content: str) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(key)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"topic": topic, "template": template, "content": content}, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not cache generated {template} for '{topic}': {e}")
+
+
+document_cache = DocumentCache()
+
+
+def GenerateDocument(groq_client: Any, topic: str, template: str = "essay", model: str = CONTENT_MODEL,
+                     use_cache: bool = True) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Generate one document from a template with an isolated message list.
+    Returns: (content or None, error_message or None)
+    """
+    key = DocumentCache.key(topic, template, model)
+    if use_cache:
+        cached = document_cache.get(key)
+        if cached is not None:
+            logger.info(f"Using cached {template} for: {topic[:50]}")
+            return cached, None
+    if groq_client is None:
+        return None, "Groq client not initialized"
+    messages = [SYSTEM_PROMPT, {"role": "user", "content": TEMPLATES.get(template, template).format(topic=topic)}]
+    try:
+        response = groq_client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=2000,
+            top_p=1.0
+        )
+        content = response.choices[0].message.content.strip()
+    except Exception as e:
+        logger.error(f"{template.capitalize()} generation failed: {e}")
+        return None, f"Error: {e}"
+    logger.info(f"Generated {template} for: {topic[:50]}...")
+    document_cache.put(key, topic, template, content)
+    return content, None
+
+
+_content_pool = None
+_content_pool_lock = threading.Lock()
+
+def get_content_pool() -> ThreadPoolExecutor:
+    global _content_pool
+    with _content_pool_lock:
+        if _content_pool is None:
+            _content_pool = ThreadPoolExecutor(max_workers=CONTENT_WORKERS, thread_name_prefix="content")
+        return _content_pool
+
+
+def SubmitDocuments(groq_client: Any, topics: List[str], template: str = "essay",
+                    model: str = CONTENT_MODEL) -> List[Future]:
+    """Queue several topics on the content pool; each future resolves to (content, error)."""
+    pool = get_content_pool()
+    return [pool.submit(GenerateDocument, groq_client, topic, template, model) for topic in topics]
+
+
+def GenerateDocuments(groq_client: Any, topics: List[str], template: str = "essay",
+                      model: str = CONTENT_MODEL) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Generate several topics concurrently; results keep the order of `topics`."""
+    return [future.result() for future in SubmitDocuments(groq_client, topics, template, model)]
+
+
+def ParseSlides(content: str) -> List[Tuple[str, List[str]]]:
+    """Split an outline into (title, bullets) pairs; blocks not starting with 'Slide' are skipped."""
+    slides = []
+    for block in content.split("\n\n"):
+        lines = [line.strip() for line in block.strip().split("\n") if line.strip()]
+        if not lines or not lines[0].startswith("Slide"):
+            continue
+        title = _SLIDE_PREFIX.sub("", lines[0]) or lines[0]
+        bullets = [line[2:].strip() for line in lines[1:] if line.startswith("- ")]
+        slides.append((title, bullets))
+    return slides
+
+
+def WritePresentation(slides: List[Tuple[str, List[str]]], filepath: str) -> None:
+    """Build every slide of a parsed outline in one pass and save the deck."""
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+    from pptx.enum.text import PP_ALIGN
+    prs = Presentation()
+    slide_layout = prs.slide_layouts[6]
+    title_size, bullet_size = Pt(32), Pt(18)
+    title_box_geometry = (Inches(0.5), Inches(0.5), Inches(9), Inches(1))
+    content_box_geometry = (Inches(0.5), Inches(1.5), Inches(9), Inches(5))
+    for title, bullets in slides:
+        slide = prs.slides.add_slide(slide_layout)
+        title_frame = slide.shapes.add_textbox(*title_box_geometry).text_frame
+        title_frame.text = title
+        title_frame.paragraphs[0].font.size = title_size
+        text_frame = slide.shapes.add_textbox(*content_box_geometry).text_frame
+        for index, bullet in enumerate(bullets):
+            # The text frame starts with one empty paragraph; use it for the first bullet
+            p = text_frame.paragraphs[0] if index == 0 else text_frame.add_paragraph()
+            p.text = bullet
+            p.level = 0
+            p.font.size = bullet_size
+            p.alignment = PP_ALIGN.LEFT
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    prs.save(filepath)
+
+
+if __name__ == "__main__":
+    # python Backend/ContentGenerator.py [--presentation] topic [topic ...]
+    from Backend.Automation import client
+    args = sys.argv[1:]
+    template = "presentation" if "--presentation" in args else "essay"
+    topics = [a for a in args if a != "--presentation"]
+    for topic, (content, error) in zip(topics, GenerateDocuments(client.get(), topics, template)):
+        print(f"=== {topic} ===")
+        print(error or content)
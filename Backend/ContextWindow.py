@@ -0,0 +1,137 @@
+import sys
+import os
+# Patch sys.path to the project root if run directly (so "from Backend..." imports work)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import re
+import math
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from dotenv import dotenv_values
+
+# Token-budgeted conversation window for the Groq chat modules. Recent turns are sent verbatim;
+# once they no longer fit the budget the oldest turns are folded into a rolling summary that is
+# sent as a single system message, so prompt size stays bounded however long the session runs.
+
+env_vars = dotenv_values(".env")
+CONTEXT_TOKEN_BUDGET = int(env_vars.get("ContextTokenBudget", 3000))
+SUMMARY_TOKEN_BUDGET = int(env_vars.get("ContextSummaryTokens", 400))
+CHARS_PER_TOKEN = 4          # rough average for English text with the llama tokenizer
+MESSAGE_TOKEN_OVERHEAD = 4   # role and separator tokens added per chat message
+SUMMARY_LINE_CHARS = 160
+
+_FIRST_SENTENCE = re.compile(r"^(.+?[.!?])(?:\s|$)", re.S)
+
+
+def EstimateTokens(text: str) -> int:
+    """Cheap token estimate (no tokenizer dependency)."""
+    return math.ceil(len(text or "") / CHARS_PER_TOKEN)
+
+
+def EstimateMessageTokens(messages: List[Dict[str, str]]) -> int:
+    return sum(EstimateTokens(m.get("content", "")) + MESSAGE_TOKEN_OVERHEAD for m in messages)
+
+
+def ExtractiveSummary(summary: str, folded: List[Dict[str, str]], max_tokens: int) -> str:
+    """
+    Default summarizer: keep the first sentence of each folded message and drop the oldest
+    summary lines once the summary exceeds its own budget. Needs no extra LLM call.
+    """
+    lines = summary.split("\n") if summary else []
+    for message in folded:
+        content = " ".join(str(message.get("content", "")).split())
+        if not content:
+            continue
+        match = _FIRST_SENTENCE.match(content)
+        gist = match.group(1) if match else content
+        if len(gist) > SUMMARY_LINE_CHARS:
+            gist = gist[:SUMMARY_LINE_CHARS - 3].rstrip() + "..."
+        lines.append(f"{message.get('role', 'user')}: {gist}")
+    while len(lines) > 1 and EstimateTokens("\n".join(lines)) > max_tokens:
+        lines.pop(0)
+    return "\n".join(lines)
+
+
+class ConversationWindow:
+    """Sliding window of chat messages kept under a token budget, with a rolling summary."""
+
+    def __init__(self, budget: int = CONTEXT_TOKEN_BUDGET, summary_budget: int = SUMMARY_TOKEN_BUDGET,
+                 summarizer: Callable[[str, List[Dict[str, str]], int], str] = ExtractiveSummary):
+        self.budget = budget
+        self.summary_budget = summary_budget
+        self.summarizer = summarizer
+        self.summary = ""
+        self.turns: List[Dict[str, str]] = []
+        self.last_prompt_tokens = 0
+        self.folded_count = 0
+        self._lock = threading.Lock()
+
+    def add(self, role: str, content: str) -> None:
+        with self._lock:
+            self.turns.append({"role": role, "content": content})
+            self._fit(0)
+
+    def extend(self, messages: List[Dict[str, str]]) -> None:
+        """Add several messages, e.g. to seed the window from the saved chat log."""
+        with self._lock:
+            self.turns.extend({"role": m["role"], "content": m.get("content", "")} for m in messages)
+            self._fit(0)
+
+    @staticmethod
+    def _summary_message(summary: str) -> Optional[Dict[str, str]]:
+        if not summary:
+            return None
+        return {"role": "system", "content": f"Summary of the earlier conversation:\n{summary}"}
+
+    def _folded(self, turns: List[Dict[str, str]], summary: str, reserved: int) -> Tuple[List[Dict[str, str]], str, int]:
+        """
+        Fold the oldest of `turns` into `summary` until they fit the budget next to `reserved`
+        tokens. Works on copies; returns (turns, summary, number of folded messages).
+        """
+        turns = list(turns)
+        folded = 0
+        def used():
+            summary_message = self._summary_message(summary)
+            summary_tokens = EstimateMessageTokens([summary_message]) if summary_message else 0
+            return reserved + summary_tokens + EstimateMessageTokens(turns)
+        # The newest message is always kept, even if it alone exceeds the budget
+        while len(turns) > 1 and used() > self.budget:
+            batch = [turns.pop(0)]
+            # Keep user/assistant pairs together where possible
+            if len(turns) > 1 and turns[0]["role"] == "assistant":
+                batch.append(turns.pop(0))
+            summary = self.summarizer(summary, batch, self.summary_budget)
+            folded += len(batch)
+        return turns, summary, folded
+
+    def _fit(self, reserved: int) -> None:
+        """Fold the oldest stored turns into the summary until the window fits the budget."""
+        self.turns, self.summary, folded = self._folded(self.turns, self.summary, reserved)
+        self.folded_count += folded
+
+    def build(self, system_messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Messages for one request: system messages, the rolling summary, then the recent turns.
+        Room for this request's system messages (e.g. search results) is made in a copy, so a
+        large one-off prompt does not fold stored history that later requests could still send.
+        """
+        with self._lock:
+            turns, summary, _ = self._folded(self.turns, self.summary, EstimateMessageTokens(system_messages))
+            summary_message = self._summary_message(summary)
+            prompt = list(system_messages) + ([summary_message] if summary_message else []) + [dict(t) for t in turns]
+            self.last_prompt_tokens = EstimateMessageTokens(prompt)
+            return prompt
+
+    def stats(self) -> Dict[str, int]:
+        """Prompt size of the last request and current window occupancy."""
+        with self._lock:
+            return {
+                "last_prompt_tokens": self.last_prompt_tokens,
+                "window_messages": len(self.turns),
+                "window_tokens": EstimateMessageTokens(self.turns),
+                "summary_tokens": EstimateTokens(self.summary),
+                "folded_messages": self.folded_count,
+                "budget": self.budget,
+            }
@@ -0,0 +1,169 @@
+import sys
+import os
+# Patch sys.path to the project root if run directly (so "from Backend..." imports work)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import json
+import sqlite3
+import threading
+import time
+import logging
+from typing import Dict, List, Optional
+from dotenv import dotenv_values
+from Backend.utils import QueryModifier
+
+# Persistent cache of FirstLayerDMM decisions so repeated phrasings route without a network call.
+# Stored in SQLite under Data/ so it survives restarts; entries expire after a TTL and the least
+# recently used rows are evicted once the cache grows past its maximum size.
+
+env_vars = dotenv_values(".env")
+DECISION_CACHE_PATH = os.path.join("Data", "DecisionCache.db")
+DECISION_CACHE_MAX_ENTRIES = int(env_vars.get("DecisionCacheMaxEntries", 2000))
+DECISION_CACHE_TTL = float(env_vars.get("DecisionCacheTTL", 7 * 24 * 3600))  # seconds
+
+
+class DecisionCache:
+    """SQLite-backed LRU/TTL cache mapping normalized prompts to DMM decision lists."""
+
+    def __init__(self, path: str = DECISION_CACHE_PATH, max_entries: int = DECISION_CACHE_MAX_ENTRIES,
+                 ttl: float = DECISION_CACHE_TTL):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # Counter increments not written yet; flushed with the next write transaction, so a miss
+        # (which is followed by a put once Cohere answers) does not cost a commit of its own
+        self._pending: Dict[str, int] = {}
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS decisions ("
+            " query TEXT PRIMARY KEY,"
+            " decision TEXT NOT NULL,"
+            " created REAL NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS decisions_last_used ON decisions(last_used)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._conn.commit()
+
+    @staticmethod
+    def normalize(prompt: str) -> str:
+        """Cache key: the QueryModifier form of the prompt, case-folded."""
+        return QueryModifier(prompt or "").lower()
+
+    def _bump(self, name: str, amount: int = 1) -> None:
+        self._pending[name] = self._pending.get(name, 0) + amount
+
+    def _commit(self) -> None:
+        """Write pending counter increments and commit the current transaction."""
+        self._conn.executemany(
+            "INSERT INTO counters(name, value) VALUES(?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            list(self._pending.items())
+        )
+        self._conn.commit()
+        self._pending.clear()
+
+    def get(self, prompt: str) -> Optional[List[str]]:
+        """Return the cached decision list for a prompt, or None on a miss/expired entry."""
+        key = self.normalize(prompt)
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute("SELECT decision, created FROM decisions WHERE query = ?", (key,)).fetchone()
+                if row is None:
+                    self._bump("misses")
+                    return None
+                decision, created = row
+                if self.ttl and now - created > self.ttl:
+                    self._conn.execute("DELETE FROM decisions WHERE query = ?", (key,))
+                    self._bump("misses")
+                    self._bump("expired")
+                    self._commit()
+                    return None
+                self._conn.execute("UPDATE decisions SET last_used = ?, hits = hits + 1 WHERE query = ?", (now, key))
+                self._bump("hits")
+                self._commit()
+                return json.loads(decision)
+            except (sqlite3.Error, ValueError) as e:
+                logging.error(f"Decision cache read failed: {e}")
+                return None
+
+    def put(self, prompt: str, decision: List[str]) -> None:
+        """Store a decision list and evict the least recently used rows beyond max_entries."""
+        key = self.normalize(prompt)
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO decisions(query, decision, created, last_used, hits) VALUES(?, ?, ?, ?, 0)",
+                    (key, json.dumps(decision), now, now)
+                )
+                count = self._conn.execute("SELECT COUNT(*) FROM decisions").fetchone()[0]
+                overflow = count - self.max_entries
+                if overflow > 0:
+                    self._conn.execute(
+                        "DELETE FROM decisions WHERE query IN "
+                        "(SELECT query FROM decisions ORDER BY last_used ASC LIMIT ?)",
+                        (overflow,)
+                    )
+                    self._bump("evictions", overflow)
+                self._commit()
+            except sqlite3.Error as e:
+                logging.error(f"Decision cache write failed: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM decisions")
+            self._conn.execute("DELETE FROM counters")
+            self._conn.commit()
+            self._pending.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters (persisted across restarts) plus the current entry count."""
+        with self._lock:
+            counters = dict(self._conn.execute("SELECT name, value FROM counters").fetchall())
+            for name, amount in self._pending.items():
+                counters[name] = counters.get(name, 0) + amount
+            entries = self._conn.execute("SELECT COUNT(*) FROM decisions").fetchone()[0]
+        stats = {name: counters.get(name, 0) for name in ("hits", "misses", "expired", "evictions")}
+        stats["entries"] = entries
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._commit()
+            except sqlite3.Error as e:
+                logging.error(f"Decision cache counter flush failed: {e}")
+            self._conn.close()
+
+
+# Global instance
+_decision_cache = None
+_decision_cache_lock = threading.Lock()
+
+def get_decision_cache() -> Optional[DecisionCache]:
+    """Get or create the global decision cache instance."""
+    global _decision_cache
+    with _decision_cache_lock:
+        if _decision_cache is None:
+            try:
+                _decision_cache = DecisionCache()
+            except Exception as e:
+                logging.error(f"Failed to open decision cache: {e}")
+                return None
+        return _decision_cache
+
+
+if __name__ == "__main__":
+    cache = get_decision_cache()
+    print(cache.stats() if cache else "Decision cache unavailable")
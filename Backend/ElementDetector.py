@@ -0,0 +1,116 @@
+import cv2
+import numpy as np
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+# Batched UI element detection for screen analysis. All contour bounding boxes are computed in
+# one NumPy pass, filtered with vectorized masks, scored by edge density (via an integral image)
+# and de-duplicated with non-max suppression, instead of looping over contours in Python.
+
+
+@dataclass
+class UIElement:
+    type: str
+    x: int
+    y: int
+    width: int
+    height: int
+    score: float
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        return self.x + self.width // 2, self.y + self.height // 2
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Same keys analyze_screen_content has always reported, plus the ranking score."""
+        return {
+            "type": self.type,
+            "x": self.x,
+            "y": self.y,
+            "width": self.width,
+            "height": self.height,
+            "center": self.center,
+            "score": round(self.score, 4)
+        }
+
+
+def ContourBoxes(contours) -> np.ndarray:
+    """(N, 4) int array of x, y, w, h for every contour, matching cv2.boundingRect."""
+    if len(contours) == 0:
+        return np.empty((0, 4), dtype=np.int32)
+    lengths = np.fromiter((len(c) for c in contours), dtype=np.intp, count=len(contours))
+    points = np.concatenate(contours).reshape(-1, 2)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    low = np.minimum.reduceat(points, starts, axis=0)
+    high = np.maximum.reduceat(points, starts, axis=0)
+    return np.column_stack((low, high - low + 1)).astype(np.int32)
+
+
+def NonMaxSuppression(boxes: np.ndarray, scores: np.ndarray, iou_threshold: float, limit: int) -> np.ndarray:
+    """Indices of the highest-scoring boxes that overlap no better box by more than iou_threshold."""
+    x0, y0 = boxes[:, 0], boxes[:, 1]
+    x1, y1 = x0 + boxes[:, 2], y0 + boxes[:, 3]
+    areas = boxes[:, 2] * boxes[:, 3]
+    order = np.argsort(-scores, kind="stable")
+    keep = []
+    while order.size and len(keep) < limit:
+        best = order[0]
+        keep.append(best)
+        rest = order[1:]
+        width = np.clip(np.minimum(x1[best], x1[rest]) - np.maximum(x0[best], x0[rest]), 0, None)
+        height = np.clip(np.minimum(y1[best], y1[rest]) - np.maximum(y0[best], y0[rest]), 0, None)
+        intersection = width * height
+        iou = intersection / (areas[best] + areas[rest] - intersection)
+        order = rest[iou <= iou_threshold]
+    return np.array(keep, dtype=np.intp)
+
+
+class ElementDetector:
+    """Finds button-like rectangles (reasonable size and aspect ratio) in a screen frame."""
+
+    def __init__(self, min_area: int = 100, max_area: int = 50000, min_aspect: float = 0.2,
+                 max_aspect: float = 5.0, iou_threshold: float = 0.3, max_elements: int = 10):
+        self.min_area = min_area
+        self.max_area = max_area
+        self.min_aspect = min_aspect
+        self.max_aspect = max_aspect
+        self.iou_threshold = iou_threshold
+        self.max_elements = max_elements
+
+    @staticmethod
+    def _contours(edges: np.ndarray):
+        # Handle different OpenCV versions (3.x returns 3 values, 4.x returns 2)
+        result = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        return result[0] if len(result) == 2 else result[1]
+
+    def detect(self, frame: np.ndarray, max_elements: int = None) -> List[UIElement]:
+        """Button candidates from a BGR (or grayscale) frame, best edge-density score first."""
+        gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        edges = cv2.Canny(gray, 50, 150)
+        boxes = ContourBoxes(self._contours(edges))
+        if not len(boxes):
+            return []
+
+        widths, heights = boxes[:, 2], boxes[:, 3]
+        areas = widths * heights
+        aspect = widths / np.maximum(heights, 1)
+        mask = ((heights > 0) & (areas > self.min_area) & (areas < self.max_area)
+                & (aspect > self.min_aspect) & (aspect < self.max_aspect))
+        boxes, areas = boxes[mask], areas[mask]
+        if not len(boxes):
+            return []
+
+        # Edge density inside each box, from a summed-area table of edge pixels
+        integral = cv2.integral((edges > 0).astype(np.uint8))
+        x0, y0 = boxes[:, 0], boxes[:, 1]
+        x1, y1 = x0 + boxes[:, 2], y0 + boxes[:, 3]
+        edge_pixels = integral[y1, x1] - integral[y0, x1] - integral[y1, x0] + integral[y0, x0]
+        scores = edge_pixels / areas
+
+        keep = NonMaxSuppression(boxes, scores, self.iou_threshold, max_elements or self.max_elements)
+        return [UIElement("button_candidate", int(x), int(y), int(w), int(h), float(scores[i]))
+                for i, (x, y, w, h) in zip(keep, boxes[keep])]
+
+
+# Global convenience instance
+element_detector = ElementDetector()
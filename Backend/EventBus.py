@@ -0,0 +1,63 @@
+import threading
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+# In-process publish/subscribe channel between the assistant threads and the GUI.
+# Publishing is thread-safe; callbacks run on the publisher's thread, so Qt consumers
+# should re-emit through a signal (queued connection) to reach the GUI thread.
+
+STATUS_TOPIC = "status"
+MESSAGE_TOPIC = "message"
+IMAGE_TOPIC = "image"      # path of a generated image to show in the chat
+
+
+class EventBus:
+    """Thread-safe topic-based publish/subscribe with a last-value cache per topic."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, List[Callable[[Any], None]]] = defaultdict(list)
+        self._last: Dict[str, Any] = {}
+
+    def subscribe(self, topic: str, callback: Callable[[Any], None], replay: bool = True) -> Callable[[], None]:
+        """
+        Register a callback for a topic. With replay=True the most recent payload (if any) is
+        delivered immediately, so late subscribers such as the GUI start in the current state.
+        Returns a function that removes the subscription.
+        """
+        with self._lock:
+            self._subscribers[topic].append(callback)
+            has_last = topic in self._last
+            last = self._last.get(topic)
+        if replay and has_last:
+            self._deliver(callback, topic, last)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers[topic]:
+                    self._subscribers[topic].remove(callback)
+        return unsubscribe
+
+    def publish(self, topic: str, payload: Any) -> None:
+        with self._lock:
+            self._last[topic] = payload
+            subscribers = list(self._subscribers[topic])
+        for callback in subscribers:
+            self._deliver(callback, topic, payload)
+
+    def last(self, topic: str, default: Any = None) -> Any:
+        """Most recent payload published on a topic."""
+        with self._lock:
+            return self._last.get(topic, default)
+
+    @staticmethod
+    def _deliver(callback: Callable[[Any], None], topic: str, payload: Any) -> None:
+        try:
+            callback(payload)
+        except Exception as e:
+            logging.error(f"Event bus subscriber for '{topic}' failed: {e}")
+
+
+# Global convenience instance
+event_bus = EventBus()
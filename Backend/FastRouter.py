@@ -0,0 +1,128 @@
+import sys
+import os
+# Patch sys.path to the project root if run directly (so "from Backend..." imports work)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import re
+from typing import List, Optional, Tuple
+from Backend.utils import ASSISTANT_NAME
+from Backend.Commands import registry, AUTOMATION, NAVIGATION, IMAGE
+
+# Deterministic, local routing stage that sits in front of the Cohere DMM.
+# Every clause is resolved through the shared command registry (Backend.Commands), so the fast
+# path accepts exactly the commands Automation and Navigator execute. Only unambiguous command
+# phrasings are matched here; anything else returns an empty decision list so FirstLayerDMM falls
+# back to the remote model.
+
+# Registry kinds the fast path may decide on its own; chat and reminders always go to Cohere
+ROUTED_KINDS = (AUTOMATION, NAVIGATION, IMAGE)
+
+EXIT_PHRASES = {"exit", "bye", "goodbye", "good bye", "bye bye", f"bye {ASSISTANT_NAME.lower()}", "bye jarvis"}
+
+# Commands whose argument is free text; "and" inside it belongs to the argument. When the
+# utterance is phrased as a question ("can you play some music for me") these are left to Cohere.
+FREE_TEXT_COMMANDS = ("play", "generate image", "content", "google search", "youtube search",
+                      "find text", "observe screen", "voice type", "send mail", "create presentation",
+                      "write to clipboard", "create file")
+
+# Commands whose argument is a list of targets ("open chrome and firefox")
+LIST_COMMANDS = ("open", "close")
+# A bare clause is only treated as another target if it is short and does not read like a request
+MAX_TARGET_WORDS = 3
+NON_TARGET_WORDS = {"tell", "what", "what's", "who", "how", "why", "when", "where", "is", "are", "do", "does",
+                    "can", "could", "give", "show", "set", "remind", "search", "write", "i", "me", "my"}
+
+_QUESTION_PREFIX = r"(?:can you|could you|would you|will you)"
+_FILLER_PREFIX = re.compile(
+    r"^(?:(?:hey|ok|okay)\s+)?(?:(?:jarvis|" + re.escape(ASSISTANT_NAME.lower()) + r")[\s,]+)?"
+    r"(?:(?:please|" + _QUESTION_PREFIX + r")\s+)*"
+)
+_ASKED = re.compile(r"\b" + _QUESTION_PREFIX + r"\b")
+_FILLER_SUFFIX = re.compile(r"(?:[\s,]+(?:please|jarvis|" + re.escape(ASSISTANT_NAME.lower()) + r"|for me|now))+$")
+_SEPARATOR = re.compile(r"\s*,\s*(?:and\s+|then\s+)?|\s+and\s+(?:then\s+)?|\s+then\s+")
+_TIME_QUERY = re.compile(r"^(?:what's|what is|tell me)\s+(?:the\s+)?(?:current\s+)?(time|date|day)(?:\s+(?:today|now|is it))?$")
+
+# Everyday phrasings rewritten to the registry's command prefix before matching
+_REWRITES = [
+    (re.compile(r"^(mute|unmute|volume up|volume down)$"), r"system \1"),
+    (re.compile(r"^(?:generate|create|make)\s+(?:an?\s+)?(?:image|picture)s?\s+(?:of\s+)?(.+)$"), r"generate image \1"),
+    (re.compile(r"^(google|youtube) search\s+for\s+(.+)$"), r"\1 search \2"),
+    (re.compile(r"^search\s+(?:google\s+for\s+|for\s+)?(.+?)\s+on\s+(google|youtube)$"), r"\2 search \1"),
+]
+
+
+def _normalize(prompt: str) -> Tuple[str, bool]:
+    """
+    Lower-case, strip punctuation added by QueryModifier and polite filler words.
+    Returns the text and whether it was phrased as a question ("can you ...").
+    """
+    text = " ".join(prompt.lower().replace("’", "'").split())
+    text = text.rstrip(" .?!")
+    filler = _FILLER_PREFIX.match(text)
+    asked = bool(filler and _ASKED.search(filler.group(0)))
+    text = text[filler.end():] if filler else text
+    text = _FILLER_SUFFIX.sub("", text)
+    return text.strip(" ,.?!"), asked
+
+
+def _classify(segment: str) -> Optional[Tuple[str, str]]:
+    """Return (command, decision) for a single clause, or None if it is not a known command."""
+    if segment in EXIT_PHRASES:
+        return "exit", "exit"
+    if _TIME_QUERY.match(segment):
+        return "general", f"general {segment}?"
+    for pattern, replacement in _REWRITES:
+        if pattern.match(segment):
+            segment = pattern.sub(replacement, segment, count=1)
+            break
+    match = registry.match(segment)
+    if match is None or match.spec.kind not in ROUTED_KINDS:
+        return None
+    return match.spec.name, match.text
+
+
+def _is_target(segment: str) -> bool:
+    words = segment.split()
+    return len(words) <= MAX_TARGET_WORDS and words[0] not in NON_TARGET_WORDS
+
+
+def FastPathDMM(prompt: str) -> Tuple[List[str], Optional[str]]:
+    """
+    Route simple command utterances locally without calling the remote DMM.
+    Returns: (decision_list, error_message or None). An empty decision list means
+    the input is ambiguous and must be classified by FirstLayerDMM's Cohere path.
+    """
+    text, asked = _normalize(prompt or "")
+    if not text:
+        return [], None
+
+    decisions: List[str] = []
+    last_command = None
+    for segment in _SEPARATOR.split(text):
+        segment = segment.strip()
+        if not segment:
+            continue
+        classified = _classify(segment)
+        if classified:
+            last_command, decision = classified
+            if asked and last_command in FREE_TEXT_COMMANDS:
+                # A question that merely contains a command word reads like chat; let Cohere decide
+                return [], None
+            decisions.append(decision)
+        elif last_command in LIST_COMMANDS and _is_target(segment):
+            # "open chrome and firefox" -> "open chrome", "open firefox"
+            decisions.append(f"{last_command} {segment}")
+        elif last_command in FREE_TEXT_COMMANDS and segment.split()[0] not in NON_TARGET_WORDS:
+            # "google search salt and pepper" -> keep "and" inside the argument
+            decisions[-1] = f"{decisions[-1]} and {segment}"
+        else:
+            return [], None
+    return decisions, None
+
+
+if __name__ == "__main__":
+    while True:
+        r, err = FastPathDMM(input("--->"))
+        print(r, "Error:", err)
@@ -0,0 +1,122 @@
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+import numpy as np
+from dotenv import dotenv_values
+
+# Shared screen-frame cache for the screen analyzers. Analyses triggered by one command (screen
+# analysis, OCR, text search) reuse a single capture while it is younger than the TTL, and a
+# per-region tile-hash grid tells the OCR which parts of the screen changed since last time.
+
+env_vars = dotenv_values(".env")
+FRAME_CACHE_TTL = float(env_vars.get("FrameCacheTTL", 0.75))  # seconds a capture may be reused
+TILE_SIZE = 128  # pixels per side of a dirty-tracking tile
+
+
+def RegionKey(region: Optional[Dict[str, int]]) -> Tuple[int, int, int, int]:
+    """Hashable cache key for a capture region (None = full screen)."""
+    if not region:
+        return (0, 0, 0, 0)
+    return (region.get("top", 0), region.get("left", 0), region.get("width", 0), region.get("height", 0))
+
+
+class FrameCache:
+    """Thread-safe TTL cache of captured frames (arrays or CapturedFrame objects) keyed by region."""
+
+    def __init__(self, ttl: float = FRAME_CACHE_TTL):
+        self.ttl = ttl
+        self._frames: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= self.ttl:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, frame: Any) -> Any:
+        # Cached frames are shared between callers, so arrays are made read-only
+        if isinstance(frame, np.ndarray):
+            frame.setflags(write=False)
+        with self._lock:
+            self._frames[key] = (time.monotonic(), frame)
+        return frame
+
+    def get_or_capture(self, key: Hashable, capture: Callable[[], Optional[Any]]) -> Optional[Any]:
+        frame = self.get(key)
+        if frame is None:
+            frame = capture()
+            if frame is not None:
+                self.put(key, frame)
+        return frame
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one region (or everything), e.g. after a click changed the screen."""
+        with self._lock:
+            if key is None:
+                self._frames.clear()
+            else:
+                self._frames.pop(key, None)
+
+
+class TileTracker:
+    """Remembers a CRC per tile for each region and reports which tiles changed."""
+
+    def __init__(self, tile_size: int = TILE_SIZE):
+        self.tile_size = tile_size
+        self._hashes: Dict[Hashable, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def tile_hashes(self, frame: np.ndarray) -> np.ndarray:
+        size = self.tile_size
+        rows = -(-frame.shape[0] // size)
+        cols = -(-frame.shape[1] // size)
+        hashes = np.empty((rows, cols), dtype=np.uint32)
+        for row in range(rows):
+            band = frame[row * size:(row + 1) * size]
+            for col in range(cols):
+                hashes[row, col] = zlib.crc32(np.ascontiguousarray(band[:, col * size:(col + 1) * size]))
+        return hashes
+
+    def update(self, key: Hashable, frame: np.ndarray) -> np.ndarray:
+        """
+        Hash the frame's tiles and return a boolean (rows, cols) mask of tiles that differ from
+        the previous frame seen for this key. Everything is dirty the first time.
+        """
+        hashes = self.tile_hashes(frame)
+        with self._lock:
+            previous = self._hashes.get(key)
+            self._hashes[key] = hashes
+        if previous is None or previous.shape != hashes.shape:
+            return np.ones(hashes.shape, dtype=bool)
+        return hashes != previous
+
+    def reset(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._hashes.clear()
+            else:
+                self._hashes.pop(key, None)
+
+
+def DirtyRowRuns(mask: np.ndarray) -> List[Tuple[int, int]]:
+    """Merge the tile rows that contain a dirty tile into (first_row, last_row) runs."""
+    runs = []
+    for row in np.flatnonzero(mask.any(axis=1)):
+        row = int(row)
+        if runs and runs[-1][1] == row - 1:
+            runs[-1] = (runs[-1][0], row)
+        else:
+            runs.append((row, row))
+    return runs
+
+
+# Global instances
+frame_cache = FrameCache()
+tile_tracker = TileTracker()
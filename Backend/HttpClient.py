@@ -0,0 +1,254 @@
+import sys
+import os
+# Patch sys.path to the project root if run directly (so "from Backend..." imports work)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import asyncio
+import random
+import threading
+import time
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+from dotenv import dotenv_values
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = HTTPX_AVAILABLE
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+import requests
+
+# One HTTP layer for every backend. A single keep-alive connection pool (httpx, with HTTP/2 when
+# the h2 package is installed; requests otherwise) is shared by web search, image generation,
+# website lookup and the Groq/Cohere SDK clients, so repeated calls skip the TCP and TLS
+# handshakes. Requests to one host are capped by a semaphore, transient failures (connection
+# errors, timeouts, 429 and 5xx) are retried with jittered exponential backoff, and per-host
+# counters are kept for stats().
+
+env_vars = dotenv_values(".env")
+HTTP_MAX_CONNECTIONS = int(env_vars.get("HttpMaxConnections", 20))
+HTTP_HOST_CONCURRENCY = int(env_vars.get("HttpHostConcurrency", 6))
+HTTP_RETRIES = int(env_vars.get("HttpRetries", 2))
+HTTP_TIMEOUT = float(env_vars.get("HttpTimeout", 15))
+BACKOFF_BASE = 0.5   # seconds; attempt n sleeps uniform(0, BACKOFF_BASE * 2**n)
+BACKOFF_MAX = 8.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Exceptions callers should catch for any transport or status error, whichever backend is active
+HTTP_ERRORS = (requests.RequestException, httpx.HTTPError) if HTTPX_AVAILABLE else (requests.RequestException,)
+
+logger = logging.getLogger(__name__)
+
+
+def BackoffDelay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retry `attempt` (0-based); a numeric Retry-After header wins."""
+    if retry_after:
+        try:
+            return min(float(retry_after), BACKOFF_MAX * 4)
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+class HttpClient:
+    """Pooled, retrying, per-host-limited HTTP client (sync, with an awaitable wrapper)."""
+
+    def __init__(self, max_connections: int = HTTP_MAX_CONNECTIONS, host_concurrency: int = HTTP_HOST_CONCURRENCY,
+                 retries: int = HTTP_RETRIES, timeout: float = HTTP_TIMEOUT):
+        self.retries = retries
+        self.timeout = timeout
+        self.host_concurrency = host_concurrency
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "retries": 0, "failures": 0}
+        self._hosts: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"requests": 0, "in_flight": 0, "errors": 0, "total_ms": 0.0})
+        if HTTPX_AVAILABLE:
+            self.backend = "httpx/http2" if HTTP2_AVAILABLE else "httpx"
+            self.httpx_client = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+                timeout=timeout,
+                headers={"User-Agent": USER_AGENT},
+                follow_redirects=True
+            )
+            self._session = None
+        else:
+            self.backend = "requests"
+            self.httpx_client = None
+            self._session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+            self._session.headers.update({"User-Agent": USER_AGENT})
+
+    def _host_limit(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = self._host_limits[host] = threading.BoundedSemaphore(self.host_concurrency)
+            return limit
+
+    def _send(self, method: str, url: str, **kwargs) -> Any:
+        kwargs.setdefault("timeout", self.timeout)
+        if self.httpx_client is not None:
+            # httpx spells these differently from requests
+            if "data" in kwargs and isinstance(kwargs["data"], (bytes, str)):
+                kwargs["content"] = kwargs.pop("data")
+            kwargs.pop("allow_redirects", None)
+            return self.httpx_client.request(method, url, **kwargs)
+        return self._session.request(method, url, **kwargs)
+
+    def request(self, method: str, url: str, retries: Optional[int] = None, **kwargs) -> Any:
+        """
+        Send a request through the shared pool. Retries transient failures; returns the final
+        response (check status_code / raise_for_status()) or raises the last transport error.
+        """
+        retries = self.retries if retries is None else retries
+        host = urlsplit(url).netloc
+        limit = self._host_limit(host)
+        attempt = 0
+        while True:
+            with limit:
+                with self._lock:
+                    self._stats["requests"] += 1
+                    self._hosts[host]["requests"] += 1
+                    self._hosts[host]["in_flight"] += 1
+                start = time.perf_counter()
+                response, error = None, None
+                try:
+                    response = self._send(method, url, **kwargs)
+                except HTTP_ERRORS as e:
+                    error = e
+                finally:
+                    with self._lock:
+                        entry = self._hosts[host]
+                        entry["in_flight"] -= 1
+                        entry["total_ms"] += (time.perf_counter() - start) * 1000
+                        if response is None or response.status_code >= 400:
+                            entry["errors"] += 1
+            retryable = error is not None or response.status_code in RETRY_STATUSES
+            if not retryable or attempt >= retries:
+                if error is not None:
+                    with self._lock:
+                        self._stats["failures"] += 1
+                    raise error
+                return response
+            delay = BackoffDelay(attempt, response.headers.get("Retry-After") if response is not None else None)
+            logger.warning(f"{method} {host} failed ({error or response.status_code}); retry {attempt + 1} in {delay:.1f}s")
+            with self._lock:
+                self._stats["retries"] += 1
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, url: str, **kwargs) -> Any:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Any:
+        return self.request("POST", url, **kwargs)
+
+    async def arequest(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Awaitable request. The pool lives in the sync client on purpose: callers that run their
+        own short-lived event loops (asyncio.run) would otherwise lose an async client's connections.
+        """
+        return await asyncio.to_thread(self.request, method, url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Totals, retries and per-host request counts, errors and mean latency."""
+        with self._lock:
+            hosts = {host: {"requests": int(entry["requests"]), "in_flight": int(entry["in_flight"]),
+                            "errors": int(entry["errors"]),
+                            "mean_ms": round(entry["total_ms"] / entry["requests"], 1) if entry["requests"] else 0.0}
+                     for host, entry in self._hosts.items()}
+            stats = dict(self._stats, backend=self.backend, hosts=hosts)
+        stats["open_connections"] = self._open_connections()
+        return stats
+
+    def _open_connections(self) -> Optional[int]:
+        # Best effort: httpx does not expose pool occupancy publicly (None with the requests fallback)
+        try:
+            return len(self.httpx_client._transport._pool.connections)
+        except Exception:
+            return None
+
+    def close(self) -> None:
+        if self.httpx_client is not None:
+            self.httpx_client.close()
+        if self._session is not None:
+            self._session.close()
+
+
+# Global instance
+_http_client = None
+_http_client_lock = threading.Lock()
+
+def get_http_client() -> HttpClient:
+    """Get or create the shared HTTP client."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HttpClient()
+            logger.info(f"HTTP client ready ({_http_client.backend})")
+        return _http_client
+
+
+# --------------------------------------------------------------------------- #
+# Shared API SDK clients: one instance per key, riding on the shared pool
+# --------------------------------------------------------------------------- #
+_sdk_clients: Dict[tuple, Any] = {}
+_sdk_clients_lock = threading.Lock()
+
+def _shared_sdk_client(kind: str, api_key: str, factory) -> Any:
+    with _sdk_clients_lock:
+        key = (kind, api_key)
+        if key not in _sdk_clients:
+            _sdk_clients[key] = factory()
+        return _sdk_clients[key]
+
+
+def CreateGroqClient(api_key: str) -> Any:
+    """Groq client shared by the chatbot, realtime search and automation modules."""
+    def factory():
+        from groq import Groq  # deferred: the SDK import is a noticeable part of startup
+        http = get_http_client().httpx_client
+        return Groq(api_key=api_key, http_client=http) if http is not None else Groq(api_key=api_key)
+    return _shared_sdk_client("groq", api_key, factory)
+
+
+def CreateCohereClient(api_key: str) -> Any:
+    """Cohere client on the shared pool (SDKs without httpx_client support get their own)."""
+    def factory():
+        import cohere
+        http = get_http_client().httpx_client
+        if http is not None:
+            try:
+                return cohere.Client(api_key=api_key, httpx_client=http)
+            except TypeError:
+                pass
+        return cohere.Client(api_key=api_key)
+    return _shared_sdk_client("cohere", api_key, factory)
+
+
+if __name__ == "__main__":
+    # Compare cold vs pooled request latency against a host
+    from rich import print
+    url = sys.argv[1] if len(sys.argv) > 1 else "https://www.googleapis.com/discovery/v1/apis"
+    client = get_http_client()
+    for i in range(5):
+        start = time.perf_counter()
+        status = client.get(url).status_code
+        print(f"request {i + 1}: {status} in {(time.perf_counter() - start) * 1000:.0f} ms")
+    print(client.stats())
@@ -5,33 +5,31 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-import asyncio
+import json
+import time
+import shutil
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from dataclasses import dataclass
 from random import randint
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from PIL import Image
-import requests
-from dotenv import get_key
+from dotenv import get_key, dotenv_values
 import logging
 from time import sleep
 from Backend.utils import TempDirectoryPath
+from Backend.HttpClient import get_http_client, BackoffDelay, HTTP_ERRORS
 
 # Setup logging
 logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
 
-def open_images(prompt):
-    """Open generated images."""
-    folder_path = r"Data"
-    prompt = prompt.replace(" ", "_")
-    files = [f"{prompt}{i}.jpg" for i in range(1, 5)]
-
-    for jpg_file in files:
-        image_path = os.path.join(folder_path, jpg_file)
-        try:
-            img = Image.open(image_path)
-            logging.info(f"Opening image: {image_path}")
-            img.show()
-            sleep(1)
-        except IOError as e:
-            logging.error(f"Error opening image {image_path}: {e}")
+# Images are produced by a bounded job queue: each image of a prompt is its own request, written
+# and reported (on_image callback) as soon as it lands instead of after the slowest one. Cold-model
+# 503s are retried after the server's estimated_time, 429/5xx/network errors with jittered backoff,
+# and finished images are cached by (prompt, seed, params) in Data/ImageCache. Every request picks
+# random seeds, as before; replaying a job's seeds (or fresh=False, which derives them from the
+# prompt) is served from the cache.
 
 API_URL = "https://api-inference.huggingface.co/models/stabilityai/stable-diffusion-xl-base-1.0"
 HF_API_KEY = get_key('.env', 'HuggingFaceAPIKey')
@@ -39,56 +37,260 @@ if not HF_API_KEY:
     logging.error("HuggingFaceAPIKey not found in .env")
 headers = {"Authorization": f"Bearer {HF_API_KEY}"}
 
-async def query(payload):
-    """Query the Hugging Face API for image generation."""
-    try:
-        response = await asyncio.to_thread(requests.post, API_URL, headers=headers, json=payload)
-        response.raise_for_status()
-        return response.content
-    except requests.RequestException as e:
-        logging.error(f"API query failed: {e}")
-        return None
-
-async def generate_images(prompt: str):
-    """Generate multiple images concurrently."""
-    os.makedirs("Data", exist_ok=True)
-    tasks = []
-    for i in range(4):
-        payload = {
-            "inputs": f"{prompt}, quality=4k, sharpness=maximum, Ultra High details, high resolution, seed={randint(1, 1000000)}",
-        }
-        task = asyncio.create_task(query(payload))
-        tasks.append(task)
-
-    image_bytes_list = await asyncio.gather(*tasks)
-    for i, image_bytes in enumerate(image_bytes_list):
-        if image_bytes:
-            file_path = f"Data/{prompt.replace(' ', '_')}{i+1}.jpg"
+env_vars = dotenv_values(".env")
+IMAGE_WORKERS = int(env_vars.get("ImageWorkers", 4))    # concurrent inference requests
+IMAGE_RETRIES = int(env_vars.get("ImageRetries", 4))    # retries per image on 503/429/5xx/network errors
+IMAGES_PER_PROMPT = 4
+IMAGE_CACHE_DIR = os.path.join("Data", "ImageCache")
+MAX_MODEL_LOAD_WAIT = 60.0  # longest single wait for a cold model, whatever estimated_time says
+# The GUI shows thumbnails of every image; set OpenImageViewer=True to also open the system viewer
+OPEN_IMAGE_VIEWER = env_vars.get("OpenImageViewer", "False").lower() == "true"
+PROMPT_SUFFIX = ", quality=4k, sharpness=maximum, Ultra High details, high resolution"
+
+
+def ImagePath(prompt: str, index: int) -> str:
+    """Where image `index` (1-based) of a prompt is written; other modules look for these names."""
+    return os.path.join("Data", f"{prompt.replace(' ', '_')}{index}.jpg")
+
+
+def ImageSeeds(prompt: str, count: int, fresh: bool = True) -> List[int]:
+    """Seeds for a prompt: random, or derived from the prompt with fresh=False (so it hits the cache)."""
+    if fresh:
+        return [randint(1, 1000000) for _ in range(count)]
+    digest = hashlib.sha256(prompt.strip().lower().encode("utf-8")).digest()
+    return [int.from_bytes(digest[i * 4:i * 4 + 4], "big") % 1000000 + 1 for i in range(count)]
+
+
+def ImageCacheKey(prompt: str, seed: int, params: Optional[Dict[str, Any]] = None) -> str:
+    payload = json.dumps([API_URL, prompt.strip().lower(), seed, params or {}], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ImageResult:
+    prompt: str
+    index: int                  # 1-based position within the job
+    seed: int
+    path: Optional[str] = None
+    error: Optional[str] = None
+    cached: bool = False
+    attempts: int = 0
+    seconds: float = 0.0
+
+
+class ImageJob:
+    """One prompt's images; results fill in as each image lands."""
+
+    def __init__(self, prompt: str, seeds: List[int], params: Dict[str, Any],
+                 on_image: Optional[Callable[[ImageResult], None]] = None,
+                 on_done: Optional[Callable[["ImageJob"], None]] = None):
+        self.prompt = prompt
+        self.seeds = seeds
+        self.params = params
+        self.on_image = on_image
+        self.on_done = on_done
+        self.results: List[Optional[ImageResult]] = [None] * len(seeds)
+        self.futures: List[Future] = []
+        self.submitted = time.perf_counter()
+        self.first_image_seconds: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _complete(self, result: ImageResult) -> None:
+        with self._lock:
+            self.results[result.index - 1] = result
+            if result.path and self.first_image_seconds is None:
+                self.first_image_seconds = time.perf_counter() - self.submitted
+            finished = all(r is not None for r in self.results)
+        callbacks = [(self.on_image, result)]
+        if finished:
+            callbacks.append((self.on_done, self))
+        for callback, argument in callbacks:
+            if callback is not None:
+                try:
+                    callback(argument)
+                except Exception as e:
+                    logging.error(f"Image callback failed: {e}")
+
+    @property
+    def progress(self) -> Tuple[int, int]:
+        """(finished images, total images)"""
+        with self._lock:
+            return sum(r is not None for r in self.results), len(self.results)
+
+    def wait(self, timeout: Optional[float] = None) -> List[ImageResult]:
+        wait_futures(self.futures, timeout=timeout)
+        return [r for r in self.results if r is not None]
+
+    def cancel(self) -> None:
+        for future in self.futures:
+            future.cancel()
+
+    @property
+    def done(self) -> bool:
+        return all(future.done() for future in self.futures)
+
+    @property
+    def paths(self) -> List[str]:
+        return [r.path for r in self.results if r is not None and r.path]
+
+    @property
+    def errors(self) -> List[str]:
+        return [r.error for r in self.results if r is not None and r.error]
+
+
+class ImageJobQueue:
+    """Bounded pool of inference requests with retries and a content-addressed image cache."""
+
+    def __init__(self, workers: int = IMAGE_WORKERS, retries: int = IMAGE_RETRIES, cache_dir: str = IMAGE_CACHE_DIR):
+        self.retries = retries
+        self.cache_dir = cache_dir
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image")
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """Images submitted but not finished yet."""
+        with self._lock:
+            return self._pending
+
+    def submit(self, prompt: str, count: int = IMAGES_PER_PROMPT,
+               on_image: Optional[Callable[[ImageResult], None]] = None,
+               on_done: Optional[Callable[[ImageJob], None]] = None,
+               seeds: Optional[List[int]] = None, params: Optional[Dict[str, Any]] = None,
+               fresh: bool = True) -> ImageJob:
+        """
+        Queue `count` images for a prompt. on_image(result) runs in a worker as each one finishes,
+        on_done(job) after the last one. New random seeds are used unless `seeds` is given or
+        fresh=False.
+        """
+        job = ImageJob(prompt, seeds or ImageSeeds(prompt, count, fresh), dict(params or {}), on_image, on_done)
+        with self._lock:
+            self._pending += len(job.seeds)
+        job.futures = [self._executor.submit(self._run, job, index, seed)
+                       for index, seed in enumerate(job.seeds, 1)]
+        return job
+
+    def _run(self, job: ImageJob, index: int, seed: int) -> ImageResult:
+        start = time.perf_counter()
+        result = ImageResult(job.prompt, index, seed)
+        try:
+            cache_path = os.path.join(self.cache_dir, f"{ImageCacheKey(job.prompt, seed, job.params)}.jpg")
+            if os.path.exists(cache_path):
+                result.cached = True
+            else:
+                image_bytes, result.attempts, result.error = self._request(job.prompt, seed, job.params)
+                if image_bytes is not None:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+                    with open(temp_path, "wb") as f:
+                        f.write(image_bytes)
+                    os.replace(temp_path, cache_path)
+            if result.error is None:
+                output_path = ImagePath(job.prompt, index)
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                shutil.copyfile(cache_path, output_path)
+                result.path = output_path
+                logging.debug(f"Image saved: {output_path}{' (cached)' if result.cached else ''}")
+        except Exception as e:
+            result.error = f"Image {index} failed: {e}"
+        finally:
+            result.seconds = time.perf_counter() - start
+            with self._lock:
+                self._pending -= 1
+        if result.error:
+            logging.error(result.error)
+        job._complete(result)
+        return result
+
+    def _request(self, prompt: str, seed: int, params: Dict[str, Any]) -> Tuple[Optional[bytes], int, Optional[str]]:
+        """POST one image; returns (bytes or None, attempts, error or None)."""
+        payload: Dict[str, Any] = {"inputs": f"{prompt}{PROMPT_SUFFIX}, seed={seed}"}
+        if params:
+            payload["parameters"] = params
+        http = get_http_client()
+        error = None
+        for attempt in range(self.retries + 1):
+            delay = None
             try:
-                with open(file_path, "wb") as f:
-                    f.write(image_bytes)
-                logging.debug(f"Image saved: {file_path}")
-            except Exception as e:
-                logging.error(f"Failed to save image {file_path}: {e}")
+                # Retries are handled here so a cold model's estimated_time can be honored
+                response = http.post(API_URL, headers=headers, json=payload, timeout=120, retries=0)
+            except HTTP_ERRORS as e:
+                error = f"Image request failed: {e}"
+            else:
+                if response.status_code == 200:
+                    return response.content, attempt + 1, None
+                error = f"Image request failed: HTTP {response.status_code} {response.text[:200]}"
+                if response.status_code == 503:
+                    try:
+                        delay = min(float(response.json().get("estimated_time", 0)), MAX_MODEL_LOAD_WAIT) or None
+                    except ValueError:
+                        delay = None
+                    if delay:
+                        logging.info(f"Image model loading, waiting {delay:.1f}s")
+                elif response.status_code == 429:
+                    delay = BackoffDelay(attempt, response.headers.get("Retry-After"))
+                elif response.status_code < 500:
+                    return None, attempt + 1, error  # bad request / auth: retrying will not help
+            if attempt < self.retries:
+                sleep(delay if delay is not None else BackoffDelay(attempt))
+        return None, self.retries + 1, error
+
+
+_image_queue = None
+_image_queue_lock = threading.Lock()
+
+def get_image_queue() -> ImageJobQueue:
+    """Get or create the global image job queue."""
+    global _image_queue
+    with _image_queue_lock:
+        if _image_queue is None:
+            _image_queue = ImageJobQueue()
+        return _image_queue
+
 
-def GenerateImages(prompt: str):
+def open_image(path: str) -> None:
+    """Show one generated image in the system viewer."""
+    try:
+        logging.info(f"Opening image: {path}")
+        Image.open(path).show()
+    except IOError as e:
+        logging.error(f"Error opening image {path}: {e}")
+
+def GenerateImages(prompt: str, on_image: Optional[Callable[[ImageResult], None]] = None,
+                   open_viewer: bool = True):
     """
-    Generate and open images for the given prompt. Returns (success, error_msg_or_None)
+    Generate images for the given prompt, opening each one as soon as it is ready (unless
+    open_viewer is False, e.g. when the GUI shows thumbnails instead).
+    Returns (success, error_msg_or_None); success means at least one image was produced.
     """
     if not HF_API_KEY:
         logging.error("HuggingFaceAPIKey not found in .env")
         return False, "HuggingFace API key missing"
+
+    def show(result: ImageResult) -> None:
+        if result.path and open_viewer:
+            open_image(result.path)
+        if on_image is not None:
+            on_image(result)
+
     try:
-        asyncio.run(generate_images(prompt))
-        open_images(prompt)
-        return True, None
+        job = get_image_queue().submit(prompt, on_image=show)
+        job.wait()
+        if not job.paths:
+            return False, "; ".join(job.errors) or "No images were generated"
+        return True, "; ".join(job.errors) or None
     except Exception as e:
         logging.error(f"Image generation failed: {e}")
         return False, str(e)
 
-def main():
-    """Monitor ImageGeneration.data and generate images when triggered."""
-    data_file = r"C:\Users\Dell\OneDrive\Desktop\my coding practices\python practice\JARVIS-AI 2.0\Frontend\Files\ImageGeneration.data"
+IMAGE_TRIGGER_FILE = os.path.join(project_root, "Frontend", "Files", "ImageGeneration.data")
+
+def main(data_file: str = IMAGE_TRIGGER_FILE):
+    """
+    Monitor ImageGeneration.data and generate images when triggered. Only needed by external
+    tools; the assistant itself submits jobs to the in-process queue.
+    """
     ensure_file_exists(data_file, "None,False")  # Ensure file exists initially
 
     while True:
@@ -109,7 +311,6 @@ def main():
                 with open(data_file, "w") as f:
                     f.write(f"{prompt},False" if success else "None,False")
                 logging.info("Image generation completed" if success else "Image generation failed")
-                break  # Exit after one successful run (adjust as needed)
             else:
                 logging.debug(f"Status is {status}, waiting...")
                 sleep(1)
@@ -132,7 +333,50 @@ def ensure_file_exists(path, default_content=""):
     except Exception as e:
         logging.error(f"Failed to ensure file exists at {path}: {e}")
 
+def BenchmarkFirstImage(prompt: str) -> Dict[str, float]:
+    """
+    Seconds from request to first usable image:
+      - old path: spawn a fresh interpreter that imports this module and generates all images
+        (nothing was shown until the whole batch was written)
+      - warm worker: a job on the already-running in-process queue
+      - cached: the same prompt again, served from Data/ImageCache
+    """
+    import subprocess
+    results = {}
+    script = ("import sys; sys.path.insert(0, '.'); import Backend.ImageGeneration as m; "
+              f"m.get_image_queue().submit({prompt!r}).wait()")
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", script], cwd=project_root, capture_output=True)
+    results["old: subprocess + import + whole batch"] = time.perf_counter() - start
+
+    queue = get_image_queue()
+    first = threading.Event()
+    start = time.perf_counter()
+    job = queue.submit(prompt, on_image=lambda result: result.path and first.set())
+    first.wait(timeout=600)
+    results["new: warm worker, first image"] = time.perf_counter() - start
+    job.wait()
+
+    start = time.perf_counter()
+    queue.submit(prompt, seeds=job.seeds).wait()
+    results["new: cached prompt, whole batch"] = time.perf_counter() - start
+    return results
+
 if __name__ == "__main__":
-    prompt = input("Enter prompt for image generation: ")
-    result, err = GenerateImages(prompt)
-    print("Success:", result, "Error:", err)
\ No newline at end of file
+    # python Backend/ImageGeneration.py [prompt] | --watch | --benchmark [prompt]
+    args = sys.argv[1:]
+    if args and args[0] == "--watch":
+        main()
+    elif args and args[0] == "--benchmark":
+        from rich import print
+        from rich.table import Table
+        table = Table(title="Request to first image (seconds)")
+        table.add_column("Path")
+        table.add_column("Seconds", justify="right")
+        for path, seconds in BenchmarkFirstImage(" ".join(args[1:]) or "a lighthouse at dusk").items():
+            table.add_row(path, f"{seconds:.2f}")
+        print(table)
+    else:
+        prompt = " ".join(args) or input("Enter prompt for image generation: ")
+        result, err = GenerateImages(prompt)
+        print("Success:", result, "Error:", err)
\ No newline at end of file
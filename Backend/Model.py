@@ -9,29 +9,30 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-import cohere
 from rich import print
 from dotenv import dotenv_values
 from Backend.utils import AnswerModifier, QueryModifier, TempDirectoryPath
+from Backend.FastRouter import FastPathDMM
+from Backend.Commands import registry
+from Backend.DecisionCache import get_decision_cache
+from Backend.Startup import LazyResource
+from Backend.HttpClient import CreateCohereClient
 
 # Load environment variables
 env_vars = dotenv_values(".env")
 CohereAPIKey = env_vars.get("CohereAPIKey")
 CohereModel = env_vars.get("CohereModel", "command-light")  # <-- default to free/cheap option
 
-# Initialize Cohere Client (fail gracefully if missing key)
-co = None
-if CohereAPIKey:
-    try:
-        co = cohere.Client(api_key=CohereAPIKey)
-    except Exception as api_error:
-        print(f"[red]Cohere initialization error: {api_error}[/red]")
+# Cohere client, created on first use; a failure is logged by LazyResource and retried next time
+def _CreateCohereClient():
+    if not CohereAPIKey:
+        raise RuntimeError("CohereAPIKey not found in .env")
+    return CreateCohereClient(CohereAPIKey)  # the cohere import is deferred until first use
+
+cohere_client = LazyResource("Cohere", _CreateCohereClient)
 
 # List of valid functions
-funcs = [
-    "exit", "general", "realtime", "open", "close", "play", "generate image", "system", "content", "google search", "youtube search", "reminder",
-    "analyze screen", "screen analysis", "read screen", "read screen text", "find text", "click on", "observe screen", "what's on screen"
-]
+# Valid decision prefixes come from the shared command registry (Backend/Commands.py)
 
 # Initialize messages and preamble prompt
 messages = []
@@ -80,8 +81,23 @@ def FirstLayerDMM(prompt: str = "test"):
     Classifies a query into decision categories for downstream routing.
     Returns: (decision_list, error_message or None)
     """
+    # Simple commands are routed locally; only ambiguous input goes to Cohere
+    fast_decision, _ = FastPathDMM(prompt)
+    if fast_decision:
+        print(f"[green]DMM Fast-path: {fast_decision}[/green]")
+        return fast_decision, None
+
+    # Repeated phrasings are answered from the on-disk decision cache
+    cache = get_decision_cache()
+    if cache is not None:
+        cached_decision = cache.get(prompt)
+        if cached_decision:
+            print(f"[green]DMM Cache hit: {cached_decision}[/green]")
+            return cached_decision, None
+
     messages.append({"role": "user", "content": f"{prompt}"})
     stream = None
+    co = cohere_client.get()
     if co is None:
         error = "Cohere API key missing or initialization failed."
         print(f"[yellow]{error}[/yellow]")
@@ -112,7 +128,7 @@ def FirstLayerDMM(prompt: str = "test"):
         # Filter valid tasks
         filtered_response = [
             task for task in response
-            if any(task.startswith(func) for func in funcs)
+            if registry.match(task) is not None
         ]
 
         # Handle recursive case for "(query)"
@@ -121,6 +137,8 @@ def FirstLayerDMM(prompt: str = "test"):
             return ["general (query)"], None
         else:
             print(f"[green]DMM Output: {filtered_response}[/green]")
+            if cache is not None and filtered_response:
+                cache.put(prompt, filtered_response)
             return filtered_response, None
 
     except Exception as e:
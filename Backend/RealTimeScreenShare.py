@@ -1,16 +1,27 @@
+import sys
+import os
+# Patch sys.path to the project root if run directly (so "from Backend..." imports work)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
 import cv2
 import numpy as np
 import time
 import logging
 import pyautogui
 from typing import Optional, Tuple, List, Dict, Any
-from PIL import Image
 import pyperclip
-import os
+import threading
+from Backend.FrameCache import tile_tracker, RegionKey, DirtyRowRuns, TILE_SIZE
+from Backend.CaptureService import get_capture_service, CapturedFrame
+from Backend.ScreenOCR import OcrIndex, ReadWords
+from Backend.ElementDetector import element_detector
+from Backend.ScreenStream import ScreenStream
 
 # Try to import mss for screen capture (optional)
 try:
-    import mss
+    import mss  # noqa: F401  (availability probe; capture goes through CaptureService)
     MSS_AVAILABLE = True
 except ImportError:
     MSS_AVAILABLE = False
@@ -18,7 +29,7 @@ except ImportError:
 
 # Try to import pytesseract for OCR (optional)
 try:
-    import pytesseract
+    import pytesseract  # noqa: F401  (availability probe; OCR goes through ScreenOCR)
     OCR_AVAILABLE = True
 except ImportError:
     OCR_AVAILABLE = False
@@ -32,6 +43,12 @@ logger = logging.getLogger(__name__)
 pyautogui.FAILSAFE = True
 pyautogui.PAUSE = 0.1
 
+# Incremental OCR: only tile rows that changed since the last read are OCR'd again, unless
+# more than this fraction of rows changed (then one full-frame pass is cheaper).
+FULL_OCR_FRACTION = 0.5
+OCR_BAND_OVERLAP = 24  # extra pixels above/below a band so text cut by the band edge is read whole
+LIVE_VIEW_FPS = 30
+
 
 class RealTimeScreenAnalyzer:
     """Real-time screen analysis and observation for automation assistance."""
@@ -39,85 +56,114 @@ class RealTimeScreenAnalyzer:
     def __init__(self):
         if not MSS_AVAILABLE:
             raise ImportError("mss module is not available. Please install it with: pip install mss")
-        self.sct = mss.mss()
-        self.monitor = self.sct.monitors[0]  # Primary monitor
+        self.capture = get_capture_service()
+        if self.capture is None:
+            raise RuntimeError("Screen capture service could not be started")
+        self.monitor = self.capture.monitor  # Primary monitor
         self.screen_width = self.monitor["width"]
         self.screen_height = self.monitor["height"]
+        self._ocr_cache: Dict[Tuple[int, int, int, int], Dict[str, Any]] = {}
+        self._ocr_lock = threading.Lock()
         logger.info(f"Screen analyzer initialized: {self.screen_width}x{self.screen_height}")
     
-    def capture_screen(self, region: Optional[Dict[str, int]] = None) -> np.ndarray:
-        """Capture screen or specific region."""
-        try:
-            if region:
-                monitor = {
-                    "top": region.get("top", 0),
-                    "left": region.get("left", 0),
-                    "width": region.get("width", self.screen_width),
-                    "height": region.get("height", self.screen_height)
-                }
+    def capture_frame(self, region: Optional[Dict[str, int]] = None, fresh: bool = False) -> Optional[CapturedFrame]:
+        """Grab from the shared capture service (reused within the frame cache TTL unless fresh=True)."""
+        return self.capture.grab(region, fresh=fresh)
+
+    def capture_screen(self, region: Optional[Dict[str, int]] = None, fresh: bool = False) -> np.ndarray:
+        """
+        Capture screen or specific region as a read-only BGR array. Captures younger than the
+        frame cache TTL are shared between callers; fresh=True always grabs a new frame.
+        """
+        captured = self.capture_frame(region, fresh)
+        return captured.bgr if captured is not None else None
+    
+    def get_screen_words(self, region: Optional[Dict[str, int]] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        OCR words for the current (cached) frame. Words are kept per tile row; on a new frame
+        only the rows containing changed tiles are OCR'd again. Returns None if capture failed.
+        """
+        frame = self.capture_screen(region)
+        if frame is None:
+            return None
+        key = RegionKey(region)
+        with self._ocr_lock:
+            cached = self._ocr_cache.get(key)
+            if cached is not None and cached["frame"] is frame:
+                return cached["words"]
+            dirty = tile_tracker.update(key, frame)
+            rows = dirty.shape[0]
+            # Work on a copy so a failed OCR pass leaves the cached rows intact
+            row_words = list(cached["rows"]) if cached is not None and len(cached["rows"]) == rows else None
+            if row_words is None or dirty.any(axis=1).mean() > FULL_OCR_FRACTION:
+                row_words = [[] for _ in range(rows)]
+                runs = [(0, rows - 1)]
             else:
-                monitor = self.monitor
-            
-            img = np.array(self.sct.grab(monitor))
-            # Convert BGRA to BGR for OpenCV compatibility
-            frame = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-            return frame
-        except Exception as e:
-            logger.error(f"Screen capture failed: {e}")
+                runs = DirtyRowRuns(dirty)
+            height = frame.shape[0]
+            try:
+                for first, last in runs:
+                    crop_top = max(0, first * TILE_SIZE - OCR_BAND_OVERLAP)
+                    crop_bottom = min(height, (last + 1) * TILE_SIZE + OCR_BAND_OVERLAP)
+                    for row in range(first, last + 1):
+                        row_words[row] = []
+                    # Each word belongs to the tile row containing its vertical centre
+                    for word in ReadWords(frame[crop_top:crop_bottom], crop_top):
+                        row = (word['y'] + word['height'] // 2) // TILE_SIZE
+                        if first <= row <= last:
+                            row_words[row].append(word)
+            except Exception:
+                # The tracker already recorded this frame's tiles as seen; forget them so the
+                # rows that were not read are OCR'd again next time
+                tile_tracker.reset(key)
+                raise
+            logger.debug(f"OCR refreshed {sum(last - first + 1 for first, last in runs)}/{rows} tile rows")
+            words = [word for row in row_words for word in row]
+            self._ocr_cache[key] = {"frame": frame, "rows": row_words, "words": words, "index": None}
+            return words
+
+    def get_screen_index(self, region: Optional[Dict[str, int]] = None) -> Optional[OcrIndex]:
+        """OcrIndex for the current frame, built once and shared by every lookup on that frame."""
+        words = self.get_screen_words(region)
+        if words is None:
             return None
-    
+        with self._ocr_lock:
+            cached = self._ocr_cache.get(RegionKey(region))
+            if cached is None or cached["words"] is not words:
+                # Another thread refreshed the frame meanwhile; index the words we were given
+                return OcrIndex(words)
+            if cached["index"] is None:
+                cached["index"] = OcrIndex(words)
+            return cached["index"]
+
     def get_screen_text(self, region: Optional[Dict[str, int]] = None) -> Tuple[bool, str]:
         """Extract text from screen using OCR."""
         if not OCR_AVAILABLE:
             return False, "OCR not available. Install pytesseract."
         
         try:
-            frame = self.capture_screen(region)
-            if frame is None:
+            index = self.get_screen_index(region)
+            if index is None:
                 return False, "Failed to capture screen"
-            
-            # Convert to PIL Image for pytesseract
-            pil_image = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-            
-            # Perform OCR
-            text = pytesseract.image_to_string(pil_image)
-            return True, text.strip()
+            return True, index.text().strip()
         except Exception as e:
             logger.error(f"OCR failed: {e}")
             return False, str(e)
     
-    def find_text_on_screen(self, search_text: str, region: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
-        """Find text on screen and return locations."""
+    def find_text_on_screen(self, search_text: str, region: Optional[Dict[str, int]] = None,
+                            fuzzy: bool = True) -> List[Dict[str, Any]]:
+        """
+        Find a word or phrase on screen and return locations, best match first. Phrases match
+        adjacent words on a line; fuzzy=True also tolerates small OCR misreads.
+        """
         if not OCR_AVAILABLE:
             return []
         
         try:
-            frame = self.capture_screen(region)
-            if frame is None:
+            index = self.get_screen_index(region)
+            if index is None:
                 return []
-            
-            # Convert to PIL Image
-            pil_image = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-            
-            # Get text with bounding boxes
-            data = pytesseract.image_to_data(pil_image, output_type=pytesseract.Output.DICT)
-            
-            # Search for the text
-            matches = []
-            search_lower = search_text.lower()
-            
-            for i, text in enumerate(data['text']):
-                if search_lower in text.lower() and text.strip():
-                    matches.append({
-                        'text': text,
-                        'x': data['left'][i],
-                        'y': data['top'][i],
-                        'width': data['width'][i],
-                        'height': data['height'][i],
-                        'confidence': data['conf'][i]
-                    })
-            
-            return matches
+            return index.find(search_text, fuzzy=fuzzy)
         except Exception as e:
             logger.error(f"Text search failed: {e}")
             return []
@@ -125,9 +171,10 @@ class RealTimeScreenAnalyzer:
     def analyze_screen_content(self, region: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
         """Analyze screen content and return structured information."""
         try:
-            frame = self.capture_screen(region)
-            if frame is None:
+            captured = self.capture_frame(region)
+            if captured is None:
                 return {"error": "Failed to capture screen"}
+            frame = captured.bgr
             
             analysis = {
                 "screen_size": {"width": frame.shape[1], "height": frame.shape[0]},
@@ -155,36 +202,8 @@ class RealTimeScreenAnalyzer:
             
             # Detect buttons (rectangular regions with text)
             # This is a simple heuristic - can be enhanced with ML models
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            edges = cv2.Canny(gray, 50, 150)
-            # Handle different OpenCV versions (3.x vs 4.x)
-            try:
-                contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            except ValueError:
-                # OpenCV 3.x returns 3 values
-                _, contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            
-            button_candidates = []
-            for contour in contours:
-                try:
-                    x, y, w, h = cv2.boundingRect(contour)
-                    area = w * h
-                    # Filter for button-like shapes (reasonable size and aspect ratio)
-                    # Avoid division by zero
-                    if h > 0 and 100 < area < 50000 and 0.2 < (w/h) < 5:
-                        button_candidates.append({
-                            "type": "button_candidate",
-                            "x": x,
-                            "y": y,
-                            "width": w,
-                            "height": h,
-                            "center": (x + w//2, y + h//2)
-                        })
-                except Exception as e:
-                    logger.debug(f"Error processing contour: {e}")
-                    continue
-            
-            analysis["detected_elements"].extend(button_candidates[:10])  # Limit to top 10
+            buttons = element_detector.detect(captured.gray)  # top 10 by edge density, overlaps suppressed
+            analysis["detected_elements"].extend(button.to_dict() for button in buttons)
             
             return analysis
         except Exception as e:
@@ -204,6 +223,7 @@ class RealTimeScreenAnalyzer:
         
         try:
             pyautogui.click(center_x, center_y)
+            self.capture.invalidate()  # the click changes what's on screen
             logger.info(f"Clicked on '{search_text}' at ({center_x}, {center_y})")
             return True, f"Clicked on '{search_text}' at ({center_x}, {center_y})"
         except Exception as e:
@@ -253,72 +273,65 @@ class RealTimeScreenAnalyzer:
     def save_screenshot(self, filename: Optional[str] = None, region: Optional[Dict[str, int]] = None) -> Tuple[bool, str]:
         """Save screenshot to file."""
         try:
-            frame = self.capture_screen(region)
-            if frame is None:
+            # A saved screenshot must show the screen now, not a cached frame
+            captured = self.capture_frame(region, fresh=True)
+            if captured is None:
                 return False, "Failed to capture screen"
             
             if not filename:
                 timestamp = time.strftime("%Y%m%d_%H%M%S")
                 filename = f"screenshot_{timestamp}.png"
             
-            os.makedirs("Data", exist_ok=True)
             filepath = os.path.join("Data", filename)
-            cv2.imwrite(filepath, frame)
+            captured.save(filepath)
             logger.info(f"Screenshot saved to {filepath}")
             return True, filepath
         except Exception as e:
             logger.error(f"Screenshot save failed: {e}")
             return False, str(e)
     
-    def run_live_view(self, show_analysis: bool = False):
-        """Run live screen view with optional analysis overlay."""
+    def run_live_view(self, show_analysis: bool = False, target_fps: float = LIVE_VIEW_FPS):
+        """
+        Run live screen view with optional analysis overlay. Frames come from a paced
+        ScreenStream that downscales to 1920x1080 at capture time and drops stale frames.
+        """
         logger.info("Starting live screen view. Press 'q' to exit, 's' to save screenshot.")
         
-        while True:
-            frame = self.capture_screen()
-            if frame is None:
-                break
-            
-            display_frame = frame.copy()
-            
-            # Add analysis overlay if requested
-            if show_analysis and OCR_AVAILABLE:
-                try:
-                    # Draw mouse position
-                    mouse_x, mouse_y = pyautogui.position()
-                    cv2.circle(display_frame, (mouse_x, mouse_y), 10, (0, 255, 0), 2)
-                    cv2.putText(display_frame, f"Mouse: ({mouse_x}, {mouse_y})", 
-                              (mouse_x + 15, mouse_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-                except Exception as e:
-                    logger.debug(f"Analysis overlay failed: {e}")
-            
-            # Resize for display if too large
-            height, width = display_frame.shape[:2]
-            if width > 1920 or height > 1080:
-                scale = min(1920/width, 1080/height)
-                new_width = int(width * scale)
-                new_height = int(height * scale)
-                display_frame = cv2.resize(display_frame, (new_width, new_height))
-            
-            cv2.imshow("Real-Time Screen Analyzer", display_frame)
-            
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
-                break
-            elif key == ord('s'):
-                self.save_screenshot()
-                logger.info("Screenshot saved")
-        
-        cv2.destroyAllWindows()
-        logger.info("Live view stopped")
-    
-    def __del__(self):
-        """Cleanup."""
+        stream = ScreenStream(self.monitor, target_fps=target_fps).start()
         try:
-            if hasattr(self, 'sct'):
-                self.sct.close()
-        except Exception:
-            pass
+            while True:
+                display_frame = stream.read(timeout=1.0)
+                if display_frame is None:
+                    if stream.error:
+                        break
+                    continue
+                
+                # Add analysis overlay if requested (drawn straight into the ring slot we own until the next read)
+                if show_analysis and OCR_AVAILABLE:
+                    try:
+                        # Draw mouse position
+                        mouse_x, mouse_y = pyautogui.position()
+                        frame_x, frame_y = stream.to_frame_coords(mouse_x, mouse_y)
+                        cv2.circle(display_frame, (frame_x, frame_y), 10, (0, 255, 0), 2)
+                        cv2.putText(display_frame, f"Mouse: ({mouse_x}, {mouse_y})", 
+                                  (frame_x + 15, frame_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+                    except Exception as e:
+                        logger.debug(f"Analysis overlay failed: {e}")
+                
+                shown = time.perf_counter()
+                cv2.imshow("Real-Time Screen Analyzer", display_frame)
+                key = cv2.waitKey(1) & 0xFF
+                stream.record_stage("display", (time.perf_counter() - shown) * 1000)
+                if key == ord('q'):
+                    break
+                elif key == ord('s'):
+                    self.save_screenshot()
+                    logger.info("Screenshot saved")
+        finally:
+            stream.stop()
+            cv2.destroyAllWindows()
+        logger.info(f"Live view stopped. Stream stats: {stream.stats()}")
+    
 
 
 # Global instance
@@ -5,12 +5,13 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-import requests
 import datetime
-import json
 from dotenv import dotenv_values
-from groq import Groq
 from Backend.utils import AnswerModifier, TempDirectoryPath
+from Backend.ChatStore import get_chat_store
+from Backend.ContextWindow import ConversationWindow
+from Backend.Startup import LazyResource
+from Backend.HttpClient import get_http_client, CreateGroqClient, HTTP_ERRORS
 
 # Load environment variables
 env_vars = dotenv_values(".env")
@@ -27,23 +28,18 @@ if not GroqAPIKey or not Google_API_KEY:
     GroqAPIKey = None
     Google_API_KEY = None
 
-# Initialize Groq Client (if possible)
-client = None
-if GroqAPIKey:
-    try:
-        client = Groq(api_key=GroqAPIKey)
-    except Exception as e:
-        print(f"[red]Groq client init error: {e}[/red]")
+# Groq client, created on first use; a failure is logged by LazyResource and retried next time
+def _CreateGroqClient():
+    if not GroqAPIKey:
+        raise RuntimeError("GroqAPIKey or Google API keys not found in .env")
+    return CreateGroqClient(GroqAPIKey)
 
-CHAT_LOG_PATH = "Data/ChatLog.json"
-os.makedirs(os.path.dirname(CHAT_LOG_PATH), exist_ok=True)
+client = LazyResource("Groq (realtime)", _CreateGroqClient)
 
-# Load chat history
-try:
-    with open(CHAT_LOG_PATH, "r") as f:
-        messages = json.load(f)
-except (FileNotFoundError, json.JSONDecodeError):
-    messages = []
+# Token-budgeted conversation; recent chat history is loaded on the first search, not at import
+CONTEXT_SEED_MESSAGES = 20
+conversation = ConversationWindow()
+_conversation_seeded = False
 
 System = f"""Hello, I am {Username}, You are a very accurate AI chatbot named {Assistantname} with real-time web search.\n*** Always search the internet first before answering. ***\n*** Provide professional and well-structured answers using correct grammar. ***\n*** Never say \"I don't know\"—always attempt to find relevant information. ***"""
 
@@ -52,8 +48,11 @@ def GoogleSearch(query):
         return f"⚠️ Google Search unavailable (missing API key or CSE_ID)", ""
     try:
         print("🔎 Searching Google for:", query)
-        url = f"https://www.googleapis.com/customsearch/v1?q={query}&key={Google_API_KEY}&cx={CSE_ID}"
-        response = requests.get(url, timeout=10)
+        response = get_http_client().get(
+            "https://www.googleapis.com/customsearch/v1",
+            params={"q": query, "key": Google_API_KEY, "cx": CSE_ID},
+            timeout=10
+        )
         response.raise_for_status()
         data = response.json()
         results = data.get("items", [])
@@ -68,7 +67,8 @@ def GoogleSearch(query):
             extracted_texts.append(f"{title}: {snippet}")
             search_summary += f"🔹 **{title}**\n📄 {snippet}\n🔗 [Read more]({link})\n\n"
         return search_summary.strip(), "\n".join(extracted_texts)
-    except requests.exceptions.RequestException as e:
+    except (*HTTP_ERRORS, ValueError) as e:
+        # ValueError: a non-JSON body (httpx raises json.JSONDecodeError, not a transport error)
         return f"⚠️ Error fetching search results: {e}", ""
 
 def SystemInformation():
@@ -79,13 +79,16 @@ def RealtimeSearchEngine(prompt):
     """
     Returns (answer_string, error_message_or_None)
     """
-    global messages
-    if client is None or not GroqAPIKey:
+    global _conversation_seeded
+    if client.get() is None or not GroqAPIKey:
         msg = "Groq API unavailable for realtime search."
         print(f"[yellow]{msg}[/yellow]")
         return "Realtime search is unavailable.", msg
 
-    messages.append({"role": "user", "content": prompt})
+    if not _conversation_seeded:
+        conversation.extend(get_chat_store().tail(CONTEXT_SEED_MESSAGES))
+        _conversation_seeded = True
+    conversation.add("user", prompt)
     search_summary, extracted_search_text = GoogleSearch(prompt)
     # If Google API failed, surface that error for the UI
     if search_summary.startswith("⚠️"):
@@ -99,10 +102,11 @@ def RealtimeSearchEngine(prompt):
     ]
 
     try:
-        print("🧠 Processing AI response...")
-        completion = client.chat.completions.create(
+        prompt_messages = conversation.build(system_context)
+        print(f"🧠 Processing AI response... (~{conversation.last_prompt_tokens} prompt tokens)")
+        completion = client.get().chat.completions.create(
             model="llama-3.3-70b-versatile",
-            messages=system_context + messages,
+            messages=prompt_messages,
             temperature=0.7,
             max_tokens=2048,
             top_p=1,
@@ -115,9 +119,8 @@ def RealtimeSearchEngine(prompt):
         answer = f"⚠️ AI system error: {e}"
         error = str(e)
         print(f"[red]{answer}[/red]")
-    messages.append({"role": "assistant", "content": answer})
-    with open(CHAT_LOG_PATH, "w") as f:
-        json.dump(messages, f, indent=4)
+    conversation.add("assistant", answer)
+    get_chat_store().extend([{"role": "user", "content": prompt}, {"role": "assistant", "content": answer}])
     return AnswerModifier(answer), error
 
 if __name__ == "__main__":
@@ -0,0 +1,123 @@
+import asyncio
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Dependency-aware execution of one utterance's automation commands.
+# Every command is put on a lane:
+#   ui     - needs keyboard/mouse focus (open/close apps, typing, window keys, clicks); serialized
+#   screen - reads the screen (screenshots, OCR, analysis); must see the effect of earlier UI steps
+#   io     - network, disk, clipboard and generation work; runs in parallel with everything else
+# The decision order becomes a small DAG: a ui command waits for the previous ui command and for
+# screen reads queued before it, a screen read waits for the previous ui command, and io commands
+# have no dependencies. Each lane has its own concurrency limit and every command is timed.
+
+UI_LANE = "ui"
+SCREEN_LANE = "screen"
+IO_LANE = "io"
+LANE_LIMITS = {UI_LANE: 1, SCREEN_LANE: 2, IO_LANE: 4}
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduledCommand:
+    index: int
+    name: str
+    func: Callable[..., Any]
+    args: Tuple[Any, ...]
+    lane: str
+    timeout: Optional[float] = None
+    cost: float = 0.0      # expected seconds, for comparison in the timing log
+    depends_on: List[int] = field(default_factory=list)
+    waited: float = 0.0    # seconds spent waiting for dependencies and a lane slot
+    seconds: float = 0.0   # seconds spent running
+    error: Optional[str] = None
+
+
+class CommandScheduler:
+    """Builds the command DAG in decision order and runs it with per-lane limits."""
+
+    def __init__(self, lane_limits: Optional[Dict[str, int]] = None,
+                 after_ui: Optional[Callable[[], None]] = None):
+        self.lane_limits = dict(LANE_LIMITS, **(lane_limits or {}))
+        self.after_ui = after_ui  # e.g. drop cached screen frames once a UI step changed the screen
+        self.commands: List[ScheduledCommand] = []
+        self._last_ui: Optional[int] = None
+        self._screen_since_ui: List[int] = []
+
+    def add(self, name: str, func: Callable[..., Any], *args: Any, lane: str = IO_LANE,
+            timeout: Optional[float] = None, cost: float = 0.0) -> int:
+        """Queue a blocking call; returns its position in the result list."""
+        if lane not in self.lane_limits:
+            raise ValueError(f"Unknown lane: {lane}")
+        index = len(self.commands)
+        depends_on = []
+        if lane == UI_LANE:
+            if self._last_ui is not None:
+                depends_on.append(self._last_ui)
+            depends_on.extend(self._screen_since_ui)
+            self._last_ui = index
+            self._screen_since_ui = []
+        elif lane == SCREEN_LANE:
+            if self._last_ui is not None:
+                depends_on.append(self._last_ui)
+            self._screen_since_ui.append(index)
+        self.commands.append(ScheduledCommand(index, name, func, args, lane, timeout, cost, depends_on))
+        return index
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    async def _execute(self, command: ScheduledCommand, done: List[asyncio.Event],
+                       lanes: Dict[str, asyncio.Semaphore]) -> Any:
+        queued = time.perf_counter()
+        try:
+            for dependency in command.depends_on:
+                await done[dependency].wait()
+            async with lanes[command.lane]:
+                started = time.perf_counter()
+                command.waited = started - queued
+                try:
+                    call = asyncio.to_thread(command.func, *command.args)
+                    if command.timeout:
+                        return await asyncio.wait_for(call, command.timeout)
+                    return await call
+                except asyncio.TimeoutError:
+                    # The worker thread cannot be interrupted; the lane is released so later commands proceed
+                    raise TimeoutError(f"'{command.name}' timed out after {command.timeout:.0f}s")
+                finally:
+                    command.seconds = time.perf_counter() - started
+        except Exception as e:
+            command.error = str(e)
+            raise
+        finally:
+            if command.lane == UI_LANE and self.after_ui is not None:
+                self.after_ui()
+            done[command.index].set()
+
+    async def run(self) -> List[Any]:
+        """Run every command; results (or exceptions) come back in decision order."""
+        if not self.commands:
+            return []
+        lanes = {lane: asyncio.Semaphore(limit) for lane, limit in self.lane_limits.items()}
+        done = [asyncio.Event() for _ in self.commands]
+        start = time.perf_counter()
+        results = await asyncio.gather(*(self._execute(command, done, lanes) for command in self.commands),
+                                       return_exceptions=True)
+        total = time.perf_counter() - start
+        for command in self.commands:
+            status = f"failed: {command.error}" if command.error else "ok"
+            expected = f"expected ~{command.cost:g}s, " if command.cost else ""
+            logger.info(f"[{command.lane}] {command.name}: {command.seconds:.2f}s "
+                        f"({expected}waited {command.waited:.2f}s) {status}")
+        logger.info(f"{len(self.commands)} command(s) finished in {total:.2f}s "
+                    f"(serial sum {sum(c.seconds for c in self.commands):.2f}s)")
+        return results
+
+    def timings(self) -> List[Dict[str, Any]]:
+        """Per-command lane, dependencies and timings from the last run."""
+        return [{"command": c.name, "lane": c.lane, "depends_on": list(c.depends_on),
+                 "waited": round(c.waited, 3), "seconds": round(c.seconds, 3), "error": c.error}
+                for c in self.commands]
@@ -0,0 +1,309 @@
+import os
+import re
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from dotenv import dotenv_values
+
+# OCR engine and searchable index for screen frames.
+# ReadWords runs Tesseract on a frame: large frames are split into overlapping horizontal bands
+# that are OCR'd in parallel and merged back with seam de-duplication. pytesseract runs the
+# tesseract binary as a child process per call, so a thread pool is enough to keep one
+# Tesseract process busy per core.
+# OcrIndex is built once per frame, so every text lookup against the same screen (click on X,
+# find Y, observe ...) is a dictionary hit instead of another Tesseract pass plus a linear scan.
+
+env_vars = dotenv_values(".env")
+OCR_MODE = env_vars.get("OcrMode", "tiled").strip().lower()  # "tiled" or "single"
+OCR_WORKERS = int(env_vars.get("OcrWorkers", 0)) or (os.cpu_count() or 1)
+MIN_TILED_HEIGHT = 600   # smaller images are read in one pass; process overhead would dominate
+MIN_BAND_HEIGHT = 200
+BAND_OVERLAP = 48        # pixels shared by neighbouring bands so a line cut by a seam is read whole
+SEAM_OVERLAP_RATIO = 0.5 # boxes from neighbouring bands overlapping this much are the same word
+
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+logger = logging.getLogger(__name__)
+
+
+def OcrImageWords(image: np.ndarray, top_offset: int = 0) -> List[Dict[str, Any]]:
+    """Run Tesseract on a BGR image and return its words with boxes in frame coordinates."""
+    import pytesseract
+    from PIL import Image
+    pil_image = Image.fromarray(np.ascontiguousarray(image[:, :, 2::-1]))
+    data = pytesseract.image_to_data(pil_image, output_type=pytesseract.Output.DICT)
+    words = []
+    for i, text in enumerate(data['text']):
+        if text.strip():
+            words.append({
+                'text': text,
+                'x': data['left'][i],
+                'y': data['top'][i] + top_offset,
+                'width': data['width'][i],
+                'height': data['height'][i],
+                'confidence': data['conf'][i],
+                # Separate OCR runs number their lines independently, so the run offset is part of the key
+                'line': (top_offset, data['block_num'][i], data['par_num'][i], data['line_num'][i])
+            })
+    return words
+
+
+_ocr_pool = None
+_ocr_pool_lock = threading.Lock()
+
+def get_ocr_pool() -> ThreadPoolExecutor:
+    """Get or create the shared pool that drives the per-band Tesseract processes."""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            # Every band already gets its own core; stop Tesseract's OpenMP from oversubscribing the CPU
+            os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+            _ocr_pool = ThreadPoolExecutor(max_workers=OCR_WORKERS, thread_name_prefix="ocr")
+        return _ocr_pool
+
+
+def SplitBands(height: int, count: int, overlap: int = BAND_OVERLAP) -> List[Tuple[int, int, int, int]]:
+    """
+    Split [0, height) into `count` bands. Returns (crop_top, crop_bottom, core_top, core_bottom):
+    the crop includes the overlap, the core is the part of the frame the band owns.
+    """
+    count = max(1, min(count, height // MIN_BAND_HEIGHT))
+    edges = [round(height * i / count) for i in range(count + 1)]
+    return [(max(0, edges[i] - overlap), min(height, edges[i + 1] + overlap), edges[i], edges[i + 1])
+            for i in range(count)]
+
+
+def _overlap_ratio(a: Dict[str, Any], b: Dict[str, Any]) -> float:
+    width = min(a['x'] + a['width'], b['x'] + b['width']) - max(a['x'], b['x'])
+    height = min(a['y'] + a['height'], b['y'] + b['height']) - max(a['y'], b['y'])
+    if width <= 0 or height <= 0:
+        return 0.0
+    smaller = min(a['width'] * a['height'], b['width'] * b['height']) or 1
+    return width * height / smaller
+
+
+def MergeBandWords(bands: List[Tuple[int, int, int, int]], band_words: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Keep each word in the band whose core holds its vertical centre, then drop duplicates
+    across a seam (a word read whole by one band and clipped by the next) by box overlap,
+    keeping the larger box.
+    """
+    kept: List[List[Dict[str, Any]]] = []
+    for (_, _, core_top, core_bottom), words in zip(bands, band_words):
+        kept.append([w for w in words if core_top <= w['y'] + w['height'] // 2 < core_bottom])
+    for i in range(1, len(kept)):
+        seam = bands[i][2]
+        upper = [w for w in kept[i - 1] if w['y'] + w['height'] > seam - BAND_OVERLAP]
+        if not upper:
+            continue
+        survivors = []
+        for word in kept[i]:
+            if word['y'] < seam + BAND_OVERLAP:
+                twin = next((u for u in upper if _overlap_ratio(u, word) >= SEAM_OVERLAP_RATIO), None)
+                if twin is not None:
+                    if word['width'] * word['height'] > twin['width'] * twin['height']:
+                        kept[i - 1].remove(twin)
+                        upper.remove(twin)
+                    else:
+                        continue
+            survivors.append(word)
+        kept[i] = survivors
+    return [word for words in kept for word in words]
+
+
+def ReadWords(image: np.ndarray, top_offset: int = 0, mode: str = OCR_MODE) -> List[Dict[str, Any]]:
+    """
+    OCR words of a BGR image. In tiled mode, images taller than MIN_TILED_HEIGHT are read as
+    overlapping bands across the worker pool; the result has the same structure either way.
+    """
+    height = image.shape[0]
+    if mode != "tiled" or OCR_WORKERS < 2 or height < MIN_TILED_HEIGHT:
+        return OcrImageWords(image, top_offset)
+    bands = SplitBands(height, OCR_WORKERS)
+    try:
+        pool = get_ocr_pool()
+        futures = [pool.submit(OcrImageWords, image[crop_top:crop_bottom], top_offset + crop_top)
+                   for crop_top, crop_bottom, _, _ in bands]
+        band_words = [future.result() for future in futures]
+    except Exception as e:
+        logger.warning(f"Tiled OCR failed ({e}); falling back to a single pass")
+        return OcrImageWords(image, top_offset)
+    shifted = [(t + top_offset, b + top_offset, ct + top_offset, cb + top_offset) for t, b, ct, cb in bands]
+    return MergeBandWords(shifted, band_words)
+
+
+def NormalizeToken(text: str) -> str:
+    """Lowercase and strip punctuation so 'Save,' and 'save' index together."""
+    return _NON_WORD.sub("", text.lower())
+
+
+def EditDistance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, giving up (returning limit + 1) once it must exceed `limit`."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, char_b in enumerate(b, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def FuzzyLimit(token: str) -> int:
+    """Allowed typos for a token: none for very short words, then one per four characters."""
+    return 0 if len(token) <= 3 else max(1, len(token) // 4)
+
+
+@dataclass
+class OcrWord:
+    text: str
+    x: int
+    y: int
+    width: int
+    height: int
+    confidence: float
+    line: Tuple
+    token: str = ""
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        return self.x + self.width // 2, self.y + self.height // 2
+
+
+@dataclass
+class OcrLine:
+    words: List[int] = field(default_factory=list)  # indices into OcrIndex.words, in reading order
+    text: str = ""
+    x: int = 0
+    y: int = 0
+    width: int = 0
+    height: int = 0
+
+
+def _union_box(words: List[OcrWord]) -> Tuple[int, int, int, int]:
+    left = min(w.x for w in words)
+    top = min(w.y for w in words)
+    right = max(w.x + w.width for w in words)
+    bottom = max(w.y + w.height for w in words)
+    return left, top, right - left, bottom - top
+
+
+def _confidence(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return -1.0
+
+
+class OcrIndex:
+    """Word and line tables with an inverted index for exact, substring, fuzzy and phrase lookups."""
+
+    def __init__(self, words: List[Dict[str, Any]]):
+        self.words: List[OcrWord] = []
+        self.lines: List[OcrLine] = []
+        self._inverted: Dict[str, List[int]] = defaultdict(list)
+        self._next: List[int] = []  # index of the following word on the same line, or -1
+        line_of: Dict[Tuple, int] = {}
+        for word in words:
+            index = len(self.words)
+            entry = OcrWord(word['text'], word['x'], word['y'], word['width'], word['height'],
+                            _confidence(word.get('confidence')), tuple(word.get('line', (index,))),
+                            NormalizeToken(word['text']))
+            self.words.append(entry)
+            self._next.append(-1)
+            if entry.token:
+                self._inverted[entry.token].append(index)
+            line_index = line_of.get(entry.line)
+            if line_index is None:
+                line_index = line_of[entry.line] = len(self.lines)
+                self.lines.append(OcrLine())
+            line = self.lines[line_index]
+            if line.words:
+                self._next[line.words[-1]] = index
+            line.words.append(index)
+        for line in self.lines:
+            members = [self.words[i] for i in line.words]
+            line.text = " ".join(w.text for w in members)
+            line.x, line.y, line.width, line.height = _union_box(members)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def text(self) -> str:
+        """All lines in reading order."""
+        return "\n".join(line.text for line in self.lines)
+
+    def lookup(self, token: str, fuzzy: bool = True) -> List[Tuple[int, int]]:
+        """
+        Words matching one token as (word_index, distance). Exact hits come first; if there are
+        none, words containing the token, then words within the fuzzy edit-distance limit.
+        """
+        token = NormalizeToken(token)
+        if not token:
+            return []
+        exact = self._inverted.get(token)
+        if exact:
+            return [(i, 0) for i in exact]
+        matches = [(i, 1) for key, indices in self._inverted.items() if token in key for i in indices]
+        if matches or not fuzzy:
+            return matches
+        limit = FuzzyLimit(token)
+        if limit == 0:
+            return []
+        for key, indices in self._inverted.items():
+            distance = EditDistance(token, key, limit)
+            if distance <= limit:
+                matches.extend((i, distance + 1) for i in indices)
+        return matches
+
+    def _token_distance(self, word: OcrWord, token: str, fuzzy: bool) -> Optional[int]:
+        if word.token == token:
+            return 0
+        if not fuzzy:
+            return None
+        limit = FuzzyLimit(token)
+        distance = EditDistance(token, word.token, limit) if limit else limit + 1
+        return distance if distance <= limit else None
+
+    def find(self, phrase: str, fuzzy: bool = True, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Locate a word or a multi-word phrase. Phrases match runs of adjacent words on one line
+        and return the union of their boxes. Best matches (fewest edits, highest confidence) first.
+        """
+        tokens = [t for t in (NormalizeToken(part) for part in phrase.split()) if t]
+        if not tokens:
+            return []
+        results = []
+        for start, distance in self.lookup(tokens[0], fuzzy):
+            run = [start]
+            total = distance
+            current = start
+            for token in tokens[1:]:
+                current = self._next[current]
+                step = self._token_distance(self.words[current], token, fuzzy) if current >= 0 else None
+                if step is None:
+                    run = None
+                    break
+                run.append(current)
+                total += step
+            if run is None:
+                continue
+            members = [self.words[i] for i in run]
+            x, y, width, height = _union_box(members)
+            results.append({
+                'text': " ".join(w.text for w in members),
+                'x': x,
+                'y': y,
+                'width': width,
+                'height': height,
+                'confidence': min(w.confidence for w in members),
+                'distance': total
+            })
+        results.sort(key=lambda match: (match['distance'], -match['confidence']))
+        return results[:limit] if limit else results
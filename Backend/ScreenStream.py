@@ -0,0 +1,174 @@
+import threading
+import time
+import logging
+from typing import Any, Dict, Optional, Tuple
+import cv2
+import numpy as np
+
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+# Paced screen streaming for the live view. A producer thread grabs frames with mss at a target
+# FPS, downscales and converts them straight into a small ring of preallocated BGR buffers, and
+# the consumer always receives the newest frame; frames it was too slow to show are dropped.
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FPS = 30
+DEFAULT_MAX_SIZE = (1920, 1080)  # frames larger than this are downscaled at capture time
+RING_SIZE = 3
+
+
+class ScreenStream:
+    """Background mss capture into a ring buffer with frame pacing and latency stats."""
+
+    def __init__(self, monitor: Optional[Dict[str, int]] = None, target_fps: float = DEFAULT_FPS,
+                 max_size: Optional[Tuple[int, int]] = DEFAULT_MAX_SIZE, ring_size: int = RING_SIZE):
+        if not MSS_AVAILABLE:
+            raise ImportError("mss module is not available. Please install it with: pip install mss")
+        if monitor is None:
+            with mss.mss() as sct:
+                monitor = dict(sct.monitors[0])
+        self.monitor = monitor
+        self.target_fps = target_fps
+        width, height = monitor["width"], monitor["height"]
+        self.scale = 1.0
+        if max_size and (width > max_size[0] or height > max_size[1]):
+            self.scale = min(max_size[0] / width, max_size[1] / height)
+        self.size = (max(1, int(width * self.scale)), max(1, int(height * self.scale)))
+        # Preallocated buffers: one BGRA scratch frame for resizing, ring_size BGR output frames
+        self._scratch = np.empty((self.size[1], self.size[0], 4), dtype=np.uint8) if self.scale != 1.0 else None
+        self._ring = [np.empty((self.size[1], self.size[0], 3), dtype=np.uint8) for _ in range(max(3, ring_size))]
+        self._timestamps = [0.0] * len(self._ring)
+        self._latest = -1        # ring slot holding the newest frame
+        self._reading = -1       # ring slot currently lent to the consumer
+        self._seq = 0            # frames produced
+        self._last_read_seq = 0
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = None
+        self.error: Optional[str] = None
+        self._stats = {"produced": 0, "consumed": 0, "dropped": 0, "capture_ms": 0.0,
+                       "convert_ms": 0.0, "latency_ms": 0.0}
+        self._started_at = 0.0
+
+    # ------------------------------------------------------------------ producer
+    def start(self) -> "ScreenStream":
+        if self._thread is None:
+            self._stop.clear()
+            self._started_at = time.perf_counter()
+            self._thread = threading.Thread(target=self._produce, name="screen-stream", daemon=True)
+            self._thread.start()
+        return self
+
+    def _next_slot(self) -> int:
+        for offset in range(1, len(self._ring) + 1):
+            slot = (self._latest + offset) % len(self._ring)
+            if slot != self._latest and slot != self._reading:
+                return slot
+        return (self._latest + 1) % len(self._ring)
+
+    def _produce(self) -> None:
+        interval = 1.0 / self.target_fps if self.target_fps else 0.0
+        next_tick = time.perf_counter()
+        try:
+            # mss handles are per-thread, so the producer owns its own
+            with mss.mss() as sct:
+                while not self._stop.is_set():
+                    started = time.perf_counter()
+                    shot = sct.grab(self.monitor)
+                    raw = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+                    captured = time.perf_counter()
+                    with self._condition:
+                        slot = self._next_slot()
+                    if self._scratch is not None:
+                        cv2.resize(raw, self.size, dst=self._scratch, interpolation=cv2.INTER_AREA)
+                        cv2.cvtColor(self._scratch, cv2.COLOR_BGRA2BGR, dst=self._ring[slot])
+                    else:
+                        cv2.cvtColor(raw, cv2.COLOR_BGRA2BGR, dst=self._ring[slot])
+                    converted = time.perf_counter()
+                    with self._condition:
+                        self._timestamps[slot] = started
+                        self._latest = slot
+                        self._seq += 1
+                        self._stats["produced"] += 1
+                        self._stats["capture_ms"] = self._ewma(self._stats["capture_ms"], (captured - started) * 1000)
+                        self._stats["convert_ms"] = self._ewma(self._stats["convert_ms"], (converted - captured) * 1000)
+                        self._condition.notify_all()
+                    if interval:
+                        # Pace to the target FPS; if we fell behind, skip ahead instead of bursting
+                        next_tick += interval
+                        delay = next_tick - time.perf_counter()
+                        if delay > 0:
+                            self._stop.wait(delay)
+                        else:
+                            next_tick = time.perf_counter()
+        except Exception as e:
+            self.error = str(e)
+            logger.error(f"Screen stream capture failed: {e}")
+        finally:
+            with self._condition:
+                self._condition.notify_all()
+
+    @staticmethod
+    def _ewma(previous: float, value: float, weight: float = 0.1) -> float:
+        return value if previous == 0.0 else previous + weight * (value - previous)
+
+    # ------------------------------------------------------------------ consumer
+    def read(self, timeout: Optional[float] = 1.0) -> Optional[np.ndarray]:
+        """
+        Newest frame not returned before, waiting up to `timeout` for one. The array is a ring
+        buffer slot that stays valid (and may be drawn on) until the next read(). Frames produced
+        since the previous read, other than the newest, count as dropped.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._seq > self._last_read_seq or self._stop.is_set()
+                                            or self.error is not None, timeout):
+                return None
+            if self._seq == self._last_read_seq:
+                return None
+            self._stats["dropped"] += self._seq - self._last_read_seq - 1
+            self._stats["consumed"] += 1
+            self._last_read_seq = self._seq
+            self._reading = self._latest
+            self._stats["latency_ms"] = self._ewma(self._stats["latency_ms"],
+                                                   (time.perf_counter() - self._timestamps[self._reading]) * 1000)
+            return self._ring[self._reading]
+
+    def record_stage(self, name: str, milliseconds: float) -> None:
+        """Let the consumer add its own stage (e.g. display) to the smoothed latency stats."""
+        key = f"{name}_ms"
+        with self._condition:
+            self._stats[key] = self._ewma(self._stats.get(key, 0.0), milliseconds)
+
+    def to_frame_coords(self, x: int, y: int) -> Tuple[int, int]:
+        """Map a screen position to pixel coordinates in the (possibly downscaled) stream frame."""
+        return int((x - self.monitor.get("left", 0)) * self.scale), int((y - self.monitor.get("top", 0)) * self.scale)
+
+    def stats(self) -> Dict[str, Any]:
+        """Produced/displayed FPS, dropped frames and smoothed per-stage latency in milliseconds."""
+        with self._condition:
+            stats = dict(self._stats)
+        elapsed = max(time.perf_counter() - self._started_at, 1e-6) if self._started_at else 0.0
+        stats["capture_fps"] = round(stats["produced"] / elapsed, 1) if elapsed else 0.0
+        stats["display_fps"] = round(stats["consumed"] / elapsed, 1) if elapsed else 0.0
+        for key in stats:
+            if key.endswith("_ms"):
+                stats[key] = round(stats[key], 2)
+        stats["size"] = self.size
+        return stats
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def __enter__(self) -> "ScreenStream":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
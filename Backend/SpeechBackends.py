@@ -0,0 +1,247 @@
+import sys
+import os
+# Patch sys.path to the project root if run directly (so "from Backend..." imports work)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import json
+import time
+import wave
+import threading
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+from dotenv import dotenv_values
+from Backend.utils import QueryModifier
+
+# Pluggable speech-to-text backends. Every backend returns the same (text, error) tuple as
+# SpeechToText.SpeechRecognition; text is "" when nothing was heard before the timeout.
+#   browser - Chrome's Web Speech API through the persistent selenium session (needs network)
+#   vosk    - local CPU-only Kaldi model streaming 16 kHz PCM from the microphone (offline)
+
+try:
+    import vosk
+    vosk.SetLogLevel(-1)
+    VOSK_AVAILABLE = True
+except ImportError:
+    VOSK_AVAILABLE = False
+
+try:
+    import pyaudio
+    PYAUDIO_AVAILABLE = True
+except ImportError:
+    PYAUDIO_AVAILABLE = False
+
+env_vars = dotenv_values(".env")
+SPEECH_BACKEND = env_vars.get("SpeechBackend", "browser").strip().lower()
+VOSK_MODEL_PATH = env_vars.get("VoskModelPath", os.path.join("Data", "vosk-model"))
+SAMPLE_RATE = 16000
+CHUNK_FRAMES = 4000  # 250 ms of audio per read
+
+
+class SpeechBackend(ABC):
+    """Interface shared by all speech-to-text engines."""
+
+    name = "base"
+
+    @abstractmethod
+    def listen(self, timeout: Optional[float] = None) -> Tuple[str, Optional[str]]:
+        """Block until one utterance is recognized or the timeout passes."""
+
+    def transcribe_wav(self, path: str) -> Tuple[str, Optional[str]]:
+        """Transcribe a WAV file (used for benchmarks and tests without a microphone)."""
+        return "", f"{self.name} backend cannot transcribe files"
+
+    def warm(self) -> None:
+        """Do the expensive setup now instead of on the first listen()."""
+        pass
+
+    def pause(self) -> None:
+        """Stop capturing until the next listen() (before the assistant speaks or sleeps)."""
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class BrowserSpeechBackend(SpeechBackend):
+    """Web Speech API in headless Chrome (the original engine)."""
+
+    name = "browser"
+
+    def __init__(self):
+        # Imported lazily so the offline backend never needs selenium or Chrome
+        from Backend.SpeechToText import get_recognition_session
+        self.session = get_recognition_session()
+
+    def listen(self, timeout=None):
+        return self.session.listen(timeout)
+
+    def warm(self):
+        self.session.start()
+
+    def pause(self):
+        self.session.pause()
+
+    def close(self):
+        self.session.close()
+
+
+class VoskSpeechBackend(SpeechBackend):
+    """Offline recognizer: streams microphone PCM into a Vosk model on the CPU."""
+
+    name = "vosk"
+
+    def __init__(self, model_path: str = VOSK_MODEL_PATH):
+        if not VOSK_AVAILABLE:
+            raise RuntimeError("vosk is not installed. Install with: pip install vosk")
+        if not os.path.isdir(model_path):
+            raise RuntimeError(f"Vosk model not found at {model_path}. Download one from https://alphacephei.com/vosk/models")
+        self.model_path = model_path
+        self.model = vosk.Model(model_path)
+        self._audio = None
+        self._stream = None
+        self._utterance = None  # recognizer for the utterance in progress, kept across timeouts
+        self._lock = threading.Lock()
+
+    def _recognizer(self):
+        return vosk.KaldiRecognizer(self.model, SAMPLE_RATE)
+
+    @staticmethod
+    def _text(result_json: str) -> str:
+        try:
+            return json.loads(result_json).get("text", "").strip()
+        except ValueError:
+            return ""
+
+    def listen(self, timeout=None):
+        if not PYAUDIO_AVAILABLE:
+            return "", "pyaudio is not installed; the vosk backend needs it for microphone input."
+        deadline = time.monotonic() + timeout if timeout else None
+        with self._lock:
+            try:
+                if self._audio is None:
+                    self._audio = pyaudio.PyAudio()
+                if self._stream is None:
+                    # Kept open across idle timeouts (a phrase spoken over the boundary continues in
+                    # the same recognizer) and closed once something was heard, so the assistant
+                    # doesn't hear itself
+                    self._stream = self._audio.open(format=pyaudio.paInt16, channels=1, rate=SAMPLE_RATE,
+                                                    input=True, frames_per_buffer=CHUNK_FRAMES)
+                    self._utterance = self._recognizer()
+                while deadline is None or time.monotonic() < deadline:
+                    data = self._stream.read(CHUNK_FRAMES, exception_on_overflow=False)
+                    if self._utterance.AcceptWaveform(data):
+                        text = self._text(self._utterance.Result())
+                        if text:
+                            self._close_stream()
+                            return QueryModifier(text), None
+                return "", None
+            except Exception as e:
+                self._close_stream()
+                return "", f"Offline speech recognition failed: {e}"
+
+    def _close_stream(self):
+        if self._stream is not None:
+            try:
+                self._stream.stop_stream()
+                self._stream.close()
+            except Exception:
+                pass
+        self._stream = None
+        self._utterance = None
+
+    def pause(self):
+        with self._lock:
+            self._close_stream()
+
+    def transcribe_wav(self, path):
+        try:
+            with wave.open(path, "rb") as wav:
+                if wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+                    return "", f"{path}: expected 16-bit mono PCM"
+                recognizer = vosk.KaldiRecognizer(self.model, wav.getframerate())
+                parts = []
+                while True:
+                    data = wav.readframes(CHUNK_FRAMES)
+                    if not data:
+                        break
+                    if recognizer.AcceptWaveform(data):
+                        parts.append(self._text(recognizer.Result()))
+                parts.append(self._text(recognizer.FinalResult()))
+            text = " ".join(p for p in parts if p)
+            return (QueryModifier(text), None) if text else ("", None)
+        except (OSError, wave.Error) as e:
+            return "", f"Could not read {path}: {e}"
+
+    def close(self):
+        with self._lock:
+            self._close_stream()
+            if self._audio is not None:
+                self._audio.terminate()
+                self._audio = None
+
+
+BACKENDS = {
+    "browser": BrowserSpeechBackend,
+    "vosk": VoskSpeechBackend,
+}
+
+# Global instance
+_speech_backend = None
+_speech_backend_lock = threading.Lock()
+
+def get_speech_backend() -> SpeechBackend:
+    """Get or create the backend selected by SpeechBackend in .env (default: browser)."""
+    global _speech_backend
+    with _speech_backend_lock:
+        if _speech_backend is None:
+            backend_class = BACKENDS.get(SPEECH_BACKEND)
+            if backend_class is None:
+                logging.warning(f"Unknown SpeechBackend '{SPEECH_BACKEND}', using browser")
+                backend_class = BrowserSpeechBackend
+            _speech_backend = backend_class()
+        return _speech_backend
+
+
+def BenchmarkBackend(backend: SpeechBackend, wav_paths: List[str]) -> List[Dict]:
+    """
+    Transcribe WAV fixtures and time each one.
+    rtf is the real-time factor (processing time / audio length); below 1.0 is faster than real time.
+    """
+    results = []
+    for path in wav_paths:
+        try:
+            with wave.open(path, "rb") as wav:
+                audio_seconds = wav.getnframes() / float(wav.getframerate())
+        except (OSError, wave.Error):
+            audio_seconds = 0.0
+        start = time.perf_counter()
+        text, error = backend.transcribe_wav(path)
+        elapsed = time.perf_counter() - start
+        results.append({
+            "file": os.path.basename(path),
+            "text": text,
+            "error": error,
+            "seconds": round(elapsed, 3),
+            "audio_seconds": round(audio_seconds, 3),
+            "rtf": round(elapsed / audio_seconds, 3) if audio_seconds else None,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    # Usage: python Backend/SpeechBackends.py fixture1.wav fixture2.wav ...
+    from rich import print
+    from rich.table import Table
+    if len(sys.argv) < 2:
+        print("Usage: python Backend/SpeechBackends.py <file.wav> [...]")
+        sys.exit(1)
+    table = Table(title="Offline STT benchmark (vosk)")
+    for column in ("file", "audio_seconds", "seconds", "rtf", "text"):
+        table.add_column(column)
+    for row in BenchmarkBackend(VoskSpeechBackend(), sys.argv[1:]):
+        table.add_row(row["file"], str(row["audio_seconds"]), str(row["seconds"]), str(row["rtf"]),
+                      row["error"] or row["text"])
+    print(table)
@@ -4,56 +4,99 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+import asyncio
+import threading
 from dotenv import dotenv_values
 import mtranslate as mt
 from Backend.utils import TempDirectoryPath, SetAssistantStatus, QueryModifier
+from Backend.SpeechBackends import get_speech_backend
 
 env_vars = dotenv_values(".env")
 InputLanguage = env_vars.get("InputLanguage")
+LISTEN_TIMEOUT = float(env_vars.get("SpeechListenTimeout", 30))  # seconds per blocking wait
+ERROR_BACKOFF = 2.0
 
+# The page is loaded once per session. Final transcripts are queued in the page and handed to
+# Python through waitForTranscript(), which selenium's execute_async_script blocks on, so no
+# polling happens while waiting for speech.
 HtmlCode = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <title>Speech Recognition</title>
 </head>
 <body>
-    <button id="start" onclick="startRecognition()">Start Recognition</button>
-    <button id="end" onclick="stopRecognition()">Stop Recognition</button>
-    <p id="output"></p>
     <script>
-        const output = document.getElementById('output');
-        let recognition;
+        const pending = [];
+        let waiter = null;
+        let listening = false;
+        let active = false;
 
-        function startRecognition() {
-            recognition = new webkitSpeechRecognition() || new SpeechRecognition();
-            recognition.lang = '';
-            recognition.continuous = true;
+        const recognition = new (window.webkitSpeechRecognition || window.SpeechRecognition)();
+        recognition.lang = '';
+        recognition.continuous = true;
 
-            recognition.onresult = function(event) {
-                const transcript = event.results[event.results.length - 1][0].transcript;
-                output.textContent += transcript;
-            };
+        recognition.onresult = function(event) {
+            if (!listening) {
+                return;
+            }
+            for (let i = event.resultIndex; i < event.results.length; i++) {
+                if (event.results[i].isFinal) {
+                    deliver(event.results[i][0].transcript);
+                }
+            }
+        };
 
-            recognition.onend = function() {
+        recognition.onend = function() {
+            active = false;
+            if (listening) {
+                active = true;
                 recognition.start();
-            };
-            recognition.start();
+            }
+        };
+
+        function deliver(text) {
+            if (waiter) {
+                const resolve = waiter;
+                waiter = null;
+                resolve(text);
+            } else {
+                pending.push(text);
+            }
+        }
+
+        function startRecognition() {
+            listening = true;
+            if (!active) {
+                active = true;
+                try { recognition.start(); } catch (e) { }
+            }
         }
 
         function stopRecognition() {
-            recognition.stop();
-            output.innerHTML = "";
+            listening = false;
+            pending.length = 0;
+            try { recognition.stop(); } catch (e) { }
+        }
+
+        function waitForTranscript(timeoutMs, done) {
+            if (pending.length) {
+                done(pending.shift());
+                return;
+            }
+            const timer = setTimeout(function() {
+                waiter = null;
+                done(null);
+            }, timeoutMs);
+            waiter = function(text) {
+                clearTimeout(timer);
+                done(text);
+            };
         }
     </script>
 </body>
 </html>'''
 
-HtmlCode = str(HtmlCode).replace("recognition.lang= '';", f"recognition.lang = '{InputLanguage}';")
+HtmlCode = str(HtmlCode).replace("recognition.lang = '';", f"recognition.lang = '{InputLanguage}';")
 
 with open(r"Data\Voice.html", "w") as f:
     f.write(HtmlCode)
@@ -62,19 +105,7 @@ current_dir = os.getcwd()
 
 Link = f"{current_dir}/Data/Voice.html"
 
-chrome_options = Options()
 user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chorme/89.0.142.86 Safari/537.36"
-chrome_options.add_argument(f'user-agent={user_agent}')
-chrome_options.add_argument("--use-fake-ui-for-media-stream")
-chrome_options.add_argument("--use-fake-device-for-media-stream")
-chrome_options.add_argument("--headless=new")
-
-try:
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-except Exception as e:
-    driver = None
-    driver_error = str(e)
 
 def UniversalTranslator(Text):
     try:
@@ -85,31 +116,148 @@ def UniversalTranslator(Text):
     except Exception as e:
         return "", str(e)
 
-def SpeechRecognition():
-    if driver is None:
-        return "", f"Selenium WebDriver failed to start: {driver_error}"
+def ProcessTranscript(Text):
+    """Normalize a raw transcript, translating it to English when the input language isn't English."""
+    if InputLanguage and (InputLanguage.lower() == "en" or "en" in InputLanguage.lower()):
+        return QueryModifier(Text), None
+    SetAssistantStatus("Translating...")
+    translation, err = UniversalTranslator(Text)
+    return QueryModifier(translation), err
+
+
+class RecognitionSession:
+    """Long-lived headless Chrome page running the Web Speech API."""
+
+    def __init__(self, timeout: float = LISTEN_TIMEOUT):
+        self.timeout = timeout
+        self.driver = None
+        self.error = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        """Start the driver and load the recognition page once."""
+        if self.driver is not None:
+            return True
+        try:
+            # selenium and the driver download are only needed once a session actually starts
+            from selenium import webdriver
+            from selenium.webdriver.chrome.service import Service
+            from selenium.webdriver.chrome.options import Options
+            from webdriver_manager.chrome import ChromeDriverManager
+            chrome_options = Options()
+            chrome_options.add_argument(f'user-agent={user_agent}')
+            chrome_options.add_argument("--use-fake-ui-for-media-stream")
+            chrome_options.add_argument("--use-fake-device-for-media-stream")
+            chrome_options.add_argument("--headless=new")
+            service = Service(ChromeDriverManager().install())
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.driver.get("file:///" + Link)
+            self.driver.set_script_timeout(self.timeout + 10)
+            self.error = None
+            return True
+        except Exception as e:
+            self.close()
+            self.error = f"Selenium WebDriver failed to start: {e}"
+            return False
+
+    def start(self):
+        """Launch the browser ahead of the first listen (used for startup warm-up)."""
+        with self._lock:
+            if not self._ensure_started():
+                raise RuntimeError(self.error)
+
+    def listen(self, timeout: float = None):
+        """
+        Block until one final transcript arrives or the timeout passes.
+        Returns: (text, error) - text is "" when nothing was heard.
+        A timeout leaves recognition running with its queued transcripts, so a phrase spoken
+        across an idle check is not lost. Recognition stops once a transcript is returned (the
+        assistant is about to answer) and on pause(), so the assistant's own speech isn't transcribed.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        with self._lock:
+            if not self._ensure_started():
+                return "", self.error
+            try:
+                self.driver.execute_script("startRecognition();")
+                Text = self.driver.execute_async_script(
+                    "waitForTranscript(arguments[0], arguments[arguments.length - 1]);",
+                    int(timeout * 1000)
+                )
+                if Text:
+                    self.driver.execute_script("stopRecognition();")
+            except Exception as e:
+                # The browser died or the page broke; restart it on the next call
+                self.close()
+                return "", f"Speech recognition session failed: {e}"
+        if not Text or not Text.strip():
+            return "", None
+        return ProcessTranscript(Text.strip())
+
+    def pause(self):
+        """Stop recognition (and drop queued transcripts) before the assistant speaks or sleeps."""
+        with self._lock:
+            if self.driver is not None:
+                try:
+                    self.driver.execute_script("stopRecognition();")
+                except Exception:
+                    pass
+
+    def close(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+        self.driver = None
+
+
+# Global session
+_session = None
+_session_lock = threading.Lock()
+
+def get_recognition_session() -> RecognitionSession:
+    """Get or create the global recognition session."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = RecognitionSession()
+        return _session
+
+def GetSpeechBackend():
+    """Backend selected by SpeechBackend in .env. Returns: (backend, error)"""
     try:
-        driver.get("file:///" + Link)
-        driver.find_element(by=By.ID, value="start").click()
+        return get_speech_backend(), None
     except Exception as e:
-        return "", f"Could not load speech recognition HTML: {e}"
+        return None, f"Speech backend failed to start: {e}"
+
+def SpeechRecognition():
+    """Wait for the next utterance. Returns: (text, error)"""
+    backend, err = GetSpeechBackend()
+    if err:
+        return "", err
     while True:
-        try:
-            Text = driver.find_element(by=By.ID, value="output").text
-            if Text:
-                driver.find_element(by=By.ID, value="end").click()
-                if InputLanguage and (InputLanguage.lower() == "en" or "en" in InputLanguage.lower()):
-                    return QueryModifier(Text), None
-                else:
-                    SetAssistantStatus("Translating...")
-                    translation, err = UniversalTranslator(Text)
-                    return QueryModifier(translation), err
-        except Exception as e:
-            # Instead of silence, return the error if fails too often (or break if driver closed)
-            continue
+        Text, err = backend.listen()
+        if Text or err:
+            return Text, err
+
+async def Utterances(timeout: float = None):
+    """
+    Async iterator of (text, error) pairs from the configured speech backend.
+    Yields ("", None) whenever `timeout` seconds pass without speech so the consumer can do
+    idle work (e.g. go to sleep) without a separate timer.
+    """
+    while True:
+        backend, err = GetSpeechBackend()
+        if backend is not None:
+            Text, err = await asyncio.to_thread(backend.listen, timeout)
+        else:
+            Text = ""
+        yield Text, err
+        if err:
+            await asyncio.sleep(ERROR_BACKOFF)  # don't spin while the backend can't start
 
 if __name__ == "__main__":
     while True:
         result, err = SpeechRecognition()
         print("Result:", result, "Error:", err)
-            
\ No newline at end of file
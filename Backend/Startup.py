@@ -0,0 +1,124 @@
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+# Startup helpers: heavy clients are wrapped in LazyResource so importing a module no longer
+# creates them, and the StartupOrchestrator warms the registered resources concurrently on a
+# thread pool (e.g. while face authentication runs) and records how long each one took.
+
+STARTUP_WORKERS = 6
+
+
+class LazyResource:
+    """A value created on first use; concurrent callers wait for the same creation."""
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        self.name = name
+        self.factory = factory
+        self.seconds: Optional[float] = None
+        self.error: Optional[str] = None
+        self._value = None
+        self._created = False
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        """
+        Create the value if needed; returns None if the factory failed (raised or returned None).
+        A failure is not remembered, so the next get() tries again (e.g. once the network is back).
+        """
+        if self._created:
+            return self._value
+        with self._lock:
+            if not self._created:
+                start = time.perf_counter()
+                try:
+                    value = self.factory()
+                    if value is None:
+                        raise RuntimeError(f"{self.name} factory returned nothing")
+                    self._value = value
+                    self._created = True
+                    self.error = None
+                except Exception as e:
+                    self.error = str(e)
+                    logging.error(f"{self.name} initialization failed: {e}")
+                self.seconds = time.perf_counter() - start
+        return self._value
+
+    def warm(self) -> Any:
+        """Early get(), usually from the startup thread pool; raises if the factory failed."""
+        value = self.get()
+        if not self._created:
+            raise RuntimeError(self.error or f"{self.name} initialization failed")
+        return value
+
+    @property
+    def ready(self) -> bool:
+        return self._created
+
+
+class StartupOrchestrator:
+    """Runs registered warm-up tasks in parallel and keeps a per-component timing table."""
+
+    def __init__(self, max_workers: int = STARTUP_WORKERS):
+        self.max_workers = max_workers
+        self._tasks: List[tuple] = []
+        self._futures = []
+        self._timings: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def register(self, name: str, func: Callable[[], Any]) -> None:
+        self._tasks.append((name, func))
+
+    def mark(self, name: str, seconds: float, error: Optional[str] = None, mode: str = "serial") -> None:
+        """Record a step that ran outside the pool (imports, face authentication, ...)."""
+        with self._lock:
+            self._timings[name] = {"seconds": seconds, "error": error, "mode": mode}
+
+    def _run(self, name: str, func: Callable[[], Any]) -> None:
+        start = time.perf_counter()
+        error = None
+        try:
+            func()
+        except Exception as e:
+            error = str(e)
+            logging.error(f"Startup task '{name}' failed: {e}")
+        self.mark(name, time.perf_counter() - start, error, mode="parallel")
+
+    def start(self) -> None:
+        """Submit all registered tasks to the pool and return immediately."""
+        if self._executor is not None:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="startup")
+        self._futures = [self._executor.submit(self._run, name, func) for name, func in self._tasks]
+        self._executor.shutdown(wait=False)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every warm-up task finished (or the timeout passed)."""
+        _, pending = wait(self._futures, timeout=timeout)
+        return not pending
+
+    def timings(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._timings.items()}
+
+    def print_report(self, timeout: Optional[float] = None) -> None:
+        """Wait for the warm-up tasks and print the timing table."""
+        from rich import print
+        from rich.table import Table
+        self.wait(timeout)
+        table = Table(title="Startup timings")
+        table.add_column("Component")
+        table.add_column("Mode")
+        table.add_column("Seconds", justify="right")
+        table.add_column("Status")
+        for name, entry in sorted(self.timings().items(), key=lambda item: -item[1]["seconds"]):
+            status = f"[red]{entry['error']}[/red]" if entry["error"] else "[green]ok[/green]"
+            table.add_row(name, entry["mode"], f"{entry['seconds']:.2f}", status)
+        print(table)
+
+
+# Global convenience instance
+startup = StartupOrchestrator()
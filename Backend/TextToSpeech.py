@@ -4,81 +4,165 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-import pygame
+import queue
+import threading
 import random
 import asyncio
 import edge_tts
 from dotenv import dotenv_values
-from Backend.utils import ASSISTANT_NAME
+from Backend.AudioPlayer import get_audio_player, PlayAndWait
 
 env_vars = dotenv_values(".env")
 AssistantVoice = env_vars.get("AssistantVoice")
 
-async def TextToAudioFile(text) -> (bool, str):
-    file_path = r"Data\speech.mp3"
-    if os.path.exists(file_path):
-        os.remove(file_path)
-    try:
-        Communicate = edge_tts.Communicate(text, AssistantVoice, pitch='-5Hz', rate='+15%')
-        await Communicate.save(r"Data\speech.mp3")
-        return True, None
-    except Exception as e:
-        return False, str(e)
-
 def TTS(Text, func=lambda r=None: True):
+    # Synthesized in memory and played through the shared AudioPlayer (mixer stays open)
     try:
-        result, err = asyncio.run(TextToAudioFile(Text))
-        if not result:
-            return False, err
-        pygame.mixer.init()
-        pygame.mixer.music.load(r"Data\speech.mp3")
-        pygame.mixer.music.play()
-        while pygame.mixer.music.get_busy():
-            if func() == False:
-                break
-            pygame.time.Clock().tick(10)
-        return True, None
+        audio = asyncio.run(TextToAudioBytes(Text))
+        if not audio:
+            return False, "No audio received from edge-tts"
+        clip = get_audio_player().play(audio)
+        PlayAndWait(clip, func)
+        return (False, f"Error in TTS: {clip.error}") if clip.error else (True, None)
     except Exception as e:
         return False, f"Error in TTS: {e}"
     finally:
         try:
             func(False)
-            pygame.mixer.music.stop()
-            pygame.mixer.quit()
         except Exception:
             pass
 
+responses = [
+    "The rest of the result has been printed to the chat screen, kindly check it out sir.",
+    "The rest of the text is now on the chat screen, sir, please check it.",
+    "You can see the rest of the text on the chat screen, sir.",
+    "The remaining part of the text is now on the chat screen, sir.",
+    "Sir, you'll find more text on the chat screen for you to see.",
+    "The rest of the answer is now on the chat screen, sir.",
+    "Sir, please look at the chat screen, the rest of the answer is there.",
+    "You'll find the complete answer on the chat screen, sir.",
+    "The next part of the text is on the chat screen, sir.",
+    "Sir, please check the chat screen for more information.",
+    "There's more text on the chat screen for you, sir.",
+    "Sir, take a look at the chat screen for additional text.",
+    "You'll find more to read on the chat screen, sir.",
+    "Sir, check the chat screen for the rest of the text.",
+    "The chat screen has the rest of the text, sir.",
+    "There's more to see on the chat screen, sir, please look.",
+    "Sir, the chat screen holds the continuation of the text.",
+    "You'll find the complete answer on the chat screen, kindly check it out sir.",
+    "Please review the chat screen for the rest of the text, sir.",
+    "Sir, look at the chat screen for the complete answer."
+]
+
 def TextToSpeech(Text, func=lambda r=None: True):
     Data = str(Text).split(".")
-    
-    responses = [
-        "The rest of the result has been printed to the chat screen, kindly check it out sir.",
-        "The rest of the text is now on the chat screen, sir, please check it.",
-        "You can see the rest of the text on the chat screen, sir.",
-        "The remaining part of the text is now on the chat screen, sir.",
-        "Sir, you'll find more text on the chat screen for you to see.",
-        "The rest of the answer is now on the chat screen, sir.",
-        "Sir, please look at the chat screen, the rest of the answer is there.",
-        "You'll find the complete answer on the chat screen, sir.",
-        "The next part of the text is on the chat screen, sir.",
-        "Sir, please check the chat screen for more information.",
-        "There's more text on the chat screen for you, sir.",
-        "Sir, take a look at the chat screen for additional text.",
-        "You'll find more to read on the chat screen, sir.",
-        "Sir, check the chat screen for the rest of the text.",
-        "The chat screen has the rest of the text, sir.",
-        "There's more to see on the chat screen, sir, please look.",
-        "Sir, the chat screen holds the continuation of the text.",
-        "You'll find the complete answer on the chat screen, kindly check it out sir.",
-        "Please review the chat screen for the rest of the text, sir.",
-        "Sir, look at the chat screen for the complete answer."
-    ]
 
     if len(Data) > 4 and len(Text) >= 250:
         return TTS("".join(Text.split(".")[0:2]) + ". " + random.choice(responses), func)
     else:
         return TTS(Text, func)
 
+# --------------------------------------------------------------------------- #
+# Streaming speech: synthesize and play sentence by sentence
+# --------------------------------------------------------------------------- #
+STREAM_SPOKEN_SENTENCES = 2   # sentences always spoken before deciding the answer is "long"
+STREAM_LONG_SENTENCES = 4     # same thresholds TextToSpeech uses for full answers
+STREAM_LONG_CHARS = 250
+STREAM_AUDIO_BUFFER = 3       # synthesized clips kept ready ahead of playback
+
+async def TextToAudioBytes(text) -> bytes:
+    """Synthesize text with edge-tts into an in-memory mp3 clip."""
+    Communicate = edge_tts.Communicate(text, AssistantVoice, pitch='-5Hz', rate='+15%')
+    audio = bytearray()
+    async for chunk in Communicate.stream():
+        if chunk["type"] == "audio":
+            audio.extend(chunk["data"])
+    return bytes(audio)
+
+def SpokenSentences(sentences):
+    """
+    Apply the TextToSpeech long-answer policy to a stream of sentences: the first sentences are
+    spoken as soon as they arrive, and long answers end with a pointer to the chat screen.
+    """
+    pending = []
+    count = 0
+    chars = 0
+    for sentence in sentences:
+        text = str(sentence).strip()
+        if not text:
+            continue
+        count += 1
+        chars += len(text)
+        if count <= STREAM_SPOKEN_SENTENCES:
+            yield text
+            continue
+        pending.append(text)
+        if count > STREAM_LONG_SENTENCES and chars >= STREAM_LONG_CHARS:
+            yield random.choice(responses)
+            return
+    yield from pending
+
+def TextToSpeechStream(sentences, func=lambda r=None: True):
+    """
+    Speak an iterable of sentences while it is still being produced. A background thread
+    synthesizes each sentence with edge-tts while the previous one is playing.
+    Returns (success, error_message_or_None).
+    """
+    audio_queue = queue.Queue(maxsize=STREAM_AUDIO_BUFFER)
+    stop = threading.Event()
+    errors = []
+
+    def synthesize():
+        loop = asyncio.new_event_loop()
+        try:
+            for text in SpokenSentences(sentences):
+                if stop.is_set():
+                    break
+                try:
+                    audio = loop.run_until_complete(TextToAudioBytes(text))
+                except Exception as e:
+                    errors.append(str(e))
+                    continue
+                while not stop.is_set():
+                    try:
+                        audio_queue.put(audio, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+        except Exception as e:
+            errors.append(str(e))
+        finally:
+            loop.close()
+            while True:
+                try:
+                    audio_queue.put(None, timeout=0.1)
+                    break
+                except queue.Full:
+                    if stop.is_set():
+                        break
+
+    producer = threading.Thread(target=synthesize, daemon=True)
+    producer.start()
+    try:
+        while not stop.is_set():
+            audio = audio_queue.get()
+            if audio is None:
+                break
+            if not audio:
+                continue
+            if not PlayAndWait(audio, func) and func() == False:
+                stop.set()
+        return (False, "; ".join(errors)) if errors else (True, None)
+    except Exception as e:
+        return False, f"Error in streaming TTS: {e}"
+    finally:
+        stop.set()
+        try:
+            func(False)
+        except Exception:
+            pass
+
 if __name__ == "__main__":
     while True:
         text = input("Enter the text: ")
@@ -9,8 +9,9 @@ from Backend.Model import FirstLayerDMM
 from Backend.Chatbot import ChatBot
 from Backend.RealtimeSearchEngine import RealtimeSearchEngine
 import Backend.Automation as Automation
-from Backend.ImageGeneration import GenerateImages
-import asyncio
+from Backend.Commands import registry, CHAT, IMAGE, NAVIGATION
+from Backend.ImageGeneration import GenerateImages, OPEN_IMAGE_VIEWER
+from Backend.AutomationRuntime import get_automation_runtime
 from Backend.utils import AnswerModifier, QueryModifier, TempDirectoryPath, SetAssistantStatus, GetAssistantStatus
 
 def process_input(user_input):
@@ -24,15 +25,18 @@ def process_input(user_input):
     if not dmm_result or not isinstance(dmm_result, list):
         output_lines.append("Sorry, I couldn't understand your request.")
         return '\n'.join(output_lines), image_paths
-    is_command = any(not (item.startswith("general") or item.startswith("realtime")) for item in dmm_result)
+    kinds = [registry.kind(item) for item in dmm_result]
+    is_command = any(kind != CHAT for kind in kinds)
     is_realtime = any(item.startswith("realtime") for item in dmm_result)
     if is_command:
-        commands = [item for item in dmm_result if not item.startswith("general") and not item.startswith("realtime")]
-        for cmd in commands:
-            if cmd.startswith("generate image"):
+        commands = [(item, kind) for item, kind in zip(dmm_result, kinds) if kind != CHAT]
+        automation_commands = []
+        for cmd, kind in commands:
+            if kind == IMAGE:
                 prompt = cmd[len("generate image"):].strip(" ()")
                 output_lines.append(f"[Image Generation] Generating images for: {prompt}")
-                success, img_error = GenerateImages(prompt)
+                # The GUI shows thumbnails of image_paths, so the external viewer is optional
+                success, img_error = GenerateImages(prompt, open_viewer=OPEN_IMAGE_VIEWER)
                 if img_error:
                     output_lines.append(f"[Image Error] {img_error}")
                 if success:
@@ -44,15 +48,19 @@ def process_input(user_input):
                     output_lines.append("Image generation completed.")
                 else:
                     output_lines.append("Image generation failed.")
+            elif kind == NAVIGATION:
+                output_lines.append(f"[Navigation] {cmd}")
+                nav_results = Automation.nav.run(cmd)
+                output_lines.append("Navigation completed." if all(nav_results) else "Navigation failed.")
             else:
                 output_lines.append(f"[Automation] Executing command: {cmd}")
-                try:
-                    result, auto_error = asyncio.run(Automation.Automation([cmd]))
-                    if auto_error:
-                        output_lines.append(f"[Automation Error] {auto_error}")
-                    output_lines.append("Command executed." if result else "Command failed.")
-                except Exception as e:
-                    output_lines.append(f"Command error: {e}")
+                automation_commands.append(cmd)
+        if automation_commands:
+            # One batch on the shared automation loop; the scheduler keeps UI steps in order
+            result, auto_error = get_automation_runtime().run_commands(automation_commands)
+            if auto_error:
+                output_lines.append(f"[Automation Error] {auto_error}")
+            output_lines.append("Command executed." if result else "Command failed.")
     elif is_realtime:
         try:
             realtime_query = next(item[9:].strip() for item in dmm_result if item.startswith("realtime"))
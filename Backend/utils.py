@@ -1,10 +1,13 @@
 import os
 from dotenv import dotenv_values
+from Backend.EventBus import event_bus, STATUS_TOPIC, MESSAGE_TOPIC
 
 # Load environment variables once
 _ENV_VARS = dotenv_values('.env')
 ASSISTANT_NAME = _ENV_VARS.get('Assistantname', 'Assistant')
 USERNAME = _ENV_VARS.get('Username', 'User')
+# Also write status/messages to Frontend/Files/*.data for external tools
+MIRROR_STATUS_FILES = str(_ENV_VARS.get('MirrorStatusFiles', 'False')).lower() in ('1', 'true', 'yes')
 
 # Utilities
 
@@ -39,16 +42,33 @@ def TempDirectoryPath(filename):
 def GraphicDirectoryPath(filename):
     return os.path.join(GraphicsDirPath, filename)
 
+def _MirrorToFile(filename, text):
+    with open(os.path.join(TempDirPath, filename), "w", encoding='utf-8') as file:
+        file.write(text)
+
 def SetAssistantStatus(status):
-    try:
-        with open(os.path.join(TempDirPath, 'Status.data'), "w", encoding='utf-8') as file:
-            file.write(status)
-    except Exception as e:
-        print(f"Error setting assistant status: {e}")
+    event_bus.publish(STATUS_TOPIC, status)
+    if MIRROR_STATUS_FILES:
+        try:
+            _MirrorToFile('Status.data', status)
+        except Exception as e:
+            print(f"Error setting assistant status: {e}")
 
 def GetAssistantStatus():
+    status = event_bus.last(STATUS_TOPIC)
+    if status is not None:
+        return status.strip()
     try:
         with open(os.path.join(TempDirPath, 'Status.data'), "r", encoding='utf-8') as file:
             return file.read().strip()
     except Exception:
         return "Ready! 🚀"
+
+def ShowTextTOScreen(Text):
+    """Display text on screen with error handling."""
+    event_bus.publish(MESSAGE_TOPIC, Text)
+    if MIRROR_STATUS_FILES:
+        try:
+            _MirrorToFile('Responses.data', Text)
+        except Exception as e:
+            print(f"Error showing text to screen: {e}")
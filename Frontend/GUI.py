@@ -4,31 +4,38 @@ from PyQt5.QtWidgets import (
     QSizePolicy, QGraphicsDropShadowEffect, QScrollArea, QSlider, QShortcut
 )
 from PyQt5.QtGui import (
-    QIcon, QPainter, QMovie, QColor, QTextCharFormat, QFont, QPixmap, 
+    QIcon, QPainter, QMovie, QColor, QTextCharFormat, QTextCursor, QFont, QPixmap, 
     QTextBlockFormat, QLinearGradient, QPalette, QBrush, QPen, QKeySequence
 )
 from PyQt5.QtCore import (
     Qt, QSize, QTimer, QPropertyAnimation, QEasingCurve, QRect, 
-    QThread, pyqtSignal, QPoint, QPropertyAnimation, QParallelAnimationGroup
+    QThread, pyqtSignal, QPoint, QPropertyAnimation, QParallelAnimationGroup, QObject
 )
 from dotenv import dotenv_values
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import json
+from collections import deque
 from Backend.assistant_core import process_input
-from Backend.utils import AnswerModifier, QueryModifier, TempDirectoryPath, GraphicDirectoryPath, SetAssistantStatus, GetAssistantStatus
+from Backend.utils import AnswerModifier, QueryModifier, TempDirectoryPath, GraphicDirectoryPath, SetAssistantStatus, GetAssistantStatus, ShowTextTOScreen
+from Backend.EventBus import event_bus, STATUS_TOPIC, MESSAGE_TOPIC, IMAGE_TOPIC
+from Backend.ChatStore import get_chat_store, FormatChatEntry
+from Frontend.Thumbnails import ThumbnailLoader, THUMBNAIL_SIZE, THUMBNAIL_CACHE
 
 # Load environment variables
 env_vars = dotenv_values(".env")
 Assistantname = env_vars.get("Assistantname", "Jarvis")
 current_dir = os.getcwd()
-old_chat_message = ""
 
 # Paths
 TempDirPath = os.path.join(current_dir, "Frontend", "Files")
 GraphicsDirPath = os.path.join(current_dir, "Frontend", "Graphics")
 
+# Chat view: blocks kept in the document, and saved messages loaded per scroll to the top
+CHAT_MAX_BLOCKS = int(env_vars.get("ChatMaxBlocks", 1000))
+CHAT_HISTORY_PAGE = int(env_vars.get("ChatHistoryPage", 50))
+
 # Modern color scheme
 COLORS = {
     'primary': '#1a1a2e',
@@ -48,13 +55,21 @@ def MicButtonInitialed():
 def MicButtonClosed():
     SetMicrophoneStatus("True")
 
-def ShowTextTOScreen(Text):
-    """Display text on screen with error handling."""
-    try:
-        with open(os.path.join(TempDirPath, 'Responses.data'), "w", encoding='utf-8') as file:
-            file.write(Text)
-    except Exception as e:
-        print(f"Error showing text to screen: {e}")
+class BackendEvents(QObject):
+    """Bridges event bus topics to Qt signals; emits from worker threads are queued to the GUI thread."""
+    statusChanged = pyqtSignal(str)
+    messageReceived = pyqtSignal(str)
+    imageReceived = pyqtSignal(str)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        unsubscribers = [
+            event_bus.subscribe(STATUS_TOPIC, self.statusChanged.emit),
+            event_bus.subscribe(MESSAGE_TOPIC, self.messageReceived.emit),
+            # Images are events, not state: a late subscriber should not re-show the last one
+            event_bus.subscribe(IMAGE_TOPIC, self.imageReceived.emit, replay=False),
+        ]
+        # Stop delivering to this object once Qt deletes it
+        self.destroyed.connect(lambda *_: [unsubscribe() for unsubscribe in unsubscribers])
 
 class ModernButton(QPushButton):
     """Modern styled button with hover effects."""
@@ -113,12 +128,68 @@ class ModernTextEdit(QTextEdit):
             }
         """)
 
+class ImageStrip(QScrollArea):
+    """Row of generated-image thumbnails; only the newest `limit` are kept as widgets."""
+    def __init__(self, limit=THUMBNAIL_CACHE, parent=None):
+        super().__init__(parent)
+        self.limit = limit
+        self.labels = {}  # original path -> QLabel, oldest first
+        self.setWidgetResizable(True)
+        self.setFixedHeight(THUMBNAIL_SIZE + 30)
+        self.setFrameStyle(QFrame.NoFrame)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setStyleSheet("background: transparent;")
+        container = QWidget()
+        self.row = QHBoxLayout(container)
+        self.row.setContentsMargins(0, 0, 0, 0)
+        self.row.setSpacing(10)
+        self.row.addStretch()
+        self.setWidget(container)
+        self.hide()
+        self.loader = ThumbnailLoader(parent=self)
+        self.loader.thumbnailReady.connect(self.on_thumbnail)
+
+    def add_image(self, path):
+        """Queue a thumbnail for `path`; the label is filled in when it is ready."""
+        if path and os.path.exists(path):
+            self.loader.request(path)
+
+    def on_thumbnail(self, path, pixmap):
+        label = self.labels.pop(path, None)
+        if label is None:
+            label = QLabel()
+            label.setFixedSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE)
+            label.setAlignment(Qt.AlignCenter)
+            label.setToolTip(path)
+            self.row.insertWidget(self.row.count() - 1, label)
+        self.labels[path] = label  # re-insert so it counts as newest
+        label.setPixmap(pixmap)
+        while len(self.labels) > self.limit:
+            oldest = next(iter(self.labels))
+            self.labels.pop(oldest).deleteLater()
+        self.show()
+        self.horizontalScrollBar().setValue(self.horizontalScrollBar().maximum())
+
 class ChatSection(QWidget):
-    """Enhanced chat section with modern design."""
+    """
+    Enhanced chat section with modern design.
+
+    Messages are appended to the document as they arrive (never re-rendered). Each message is
+    tracked as a unit of blocks; once the document exceeds CHAT_MAX_BLOCKS the oldest units are
+    removed from the top. Saved history is loaded a page at a time when the view is scrolled to
+    the top, so startup and every reply cost only the messages being added.
+    """
     def __init__(self):
         super().__init__()
+        self.chat_store = get_chat_store()
+        # [store index, block count, saved] per message, top first. Saved history records its own
+        # index; live messages record the store length when shown (everything before it is older)
+        self.units = deque()
+        self.history_index = len(self.chat_store)  # oldest saved message shown (loads go below this)
+        self.loading_history = False
         self.setup_ui()
         self.setup_animations()
+        QTimer.singleShot(0, self.load_history)
         
     def setup_ui(self):
         """Setup the user interface."""
@@ -164,15 +235,21 @@ class ChatSection(QWidget):
             self.gif_label.setStyleSheet("font-size: 60px; color: #e94560;")
         self.gif_label.setAlignment(Qt.AlignCenter)
         
+        # Thumbnails of generated images, decoded off the GUI thread
+        self.image_strip = ImageStrip()
+        
         # Layout arrangement
         layout.addWidget(self.chat_text_edit, 2)  # Give chat box more stretch
+        layout.addWidget(self.image_strip)
         layout.addWidget(self.status_label)
         layout.addWidget(self.gif_label, 0)  # Less stretch for gif
         
-        # Setup timer for updates
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_content)
-        self.timer.start(100)  # Reduced frequency for better performance
+        # Receive status and messages from the backend as queued signals (no file polling)
+        self.events = BackendEvents(self)
+        self.events.messageReceived.connect(self.on_message, Qt.QueuedConnection)
+        self.events.statusChanged.connect(self.on_status, Qt.QueuedConnection)
+        self.events.imageReceived.connect(self.add_image, Qt.QueuedConnection)
+        self.chat_text_edit.verticalScrollBar().valueChanged.connect(self.on_scroll)
         
     def setup_animations(self):
         """Setup smooth animations."""
@@ -182,28 +259,21 @@ class ChatSection(QWidget):
         self.fade_animation.setEndValue(1.0)
         self.fade_animation.setEasingCurve(QEasingCurve.OutCubic)
         
-    def update_content(self):
-        """Update chat content and status."""
-        global old_chat_message
-        
-        # Update chat messages
-        try:
-            with open(TempDirectoryPath('Responses.data'), "r", encoding='utf-8') as file:
-                messages = file.read()
-                if messages and messages != old_chat_message:
-                    self.add_message(messages, COLORS['text'])
-            old_chat_message = messages
-        except Exception:
-            pass
-        
-        # Update status
-        try:
-            status = GetAssistantStatus()
-            if status != self.status_label.text():
-                self.status_label.setText(status)
-                self.update_status_color(status)
-        except Exception:
-            pass
+    def on_message(self, message):
+        """Append a message published by the backend."""
+        if message:
+            self.add_message(message, COLORS['text'])
+    
+    def add_image(self, path):
+        """Show a generated image as a thumbnail below the chat."""
+        self.image_strip.add_image(path)
+    
+    def on_status(self, status):
+        """Update the status label when the backend publishes a new status."""
+        status = status.strip()
+        if status != self.status_label.text():
+            self.status_label.setText(status)
+            self.update_status_color(status)
     
     def update_status_color(self, status):
         """Update status label color based on status."""
@@ -228,19 +298,73 @@ class ChatSection(QWidget):
             }}
         """)
     
-    def add_message(self, message, color):
-        """Add message with smooth animation."""
-        cursor = self.chat_text_edit.textCursor()
+    def insert_text(self, text, color, position):
+        """Insert text at a document position; returns how many blocks it added."""
+        document = self.chat_text_edit.document()
+        before = document.blockCount()
+        cursor = QTextCursor(document)
+        cursor.movePosition(position)
         format = QTextCharFormat()
         format.setForeground(QColor(color))
         cursor.setCharFormat(format)
-        cursor.insertText(message + "\n")
-        self.chat_text_edit.setTextCursor(cursor)
+        cursor.insertText(text + "\n")
+        return document.blockCount() - before
+
+    def add_message(self, message, color):
+        """Append one message; only the new text is laid out."""
+        blocks = self.insert_text(message, color, QTextCursor.End)
+        self.units.append([len(self.chat_store), blocks, False])
+        self.trim_blocks()
 
         # Auto-scroll to bottom
         scrollbar = self.chat_text_edit.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
+    def trim_blocks(self):
+        """Drop whole messages from the top until the document is within CHAT_MAX_BLOCKS."""
+        document = self.chat_text_edit.document()
+        while document.blockCount() > CHAT_MAX_BLOCKS and len(self.units) > 1:
+            index, blocks, saved = self.units.popleft()
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.Start)
+            cursor.movePosition(QTextCursor.NextBlock, QTextCursor.KeepAnchor, blocks)
+            cursor.removeSelectedText()
+            # Trimmed messages can be loaded again (from the store) by scrolling up; for a live
+            # message that means the turns saved before the messages that are still shown
+            self.history_index = index + 1 if saved else index
+
+    def load_history(self):
+        """Prepend the previous page of saved messages, keeping the visible text in place."""
+        if self.loading_history or self.history_index <= 0:
+            return
+        self.loading_history = True
+        try:
+            start = max(self.history_index - CHAT_HISTORY_PAGE, 0)
+            entries = self.chat_store.page(start, self.history_index)
+            scrollbar = self.chat_text_edit.verticalScrollBar()
+            distance_from_bottom = scrollbar.maximum() - scrollbar.value()
+            # Newest first, each inserted at the top
+            for index in range(len(entries) - 1, -1, -1):
+                text = AnswerModifier(FormatChatEntry(entries[index]))
+                if text:
+                    blocks = self.insert_text(text, COLORS['text_secondary'], QTextCursor.Start)
+                    self.units.appendleft([start + index, blocks, True])
+            self.history_index = start
+            scrollbar.setValue(scrollbar.maximum() - distance_from_bottom)
+        finally:
+            self.loading_history = False
+        # A page that does not fill the view leaves nothing to scroll; keep loading until it does
+        QTimer.singleShot(0, self.fill_view)
+
+    def fill_view(self):
+        if self.chat_text_edit.verticalScrollBar().maximum() == 0 and self.history_index > 0:
+            self.load_history()
+
+    def on_scroll(self, value):
+        """Load older history when the view reaches the top."""
+        if value == self.chat_text_edit.verticalScrollBar().minimum() and self.history_index > 0:
+            self.load_history()
+
 class ModernTopBar(QWidget):
     """Modern top bar with controls."""
     pinToggled = pyqtSignal(bool)  # Signal to toggle always-on-top
@@ -464,16 +588,10 @@ class MessageScreen(QWidget):
     def on_backend_finished(self, result, image_paths):
         # Show text result
         for line in result.split('\n'):
-            self.chat_section.addMessage(line, 'cyan')
-        # Show images inline if any
-        if image_paths:
-            from PyQt5.QtGui import QPixmap
-            for img_path in image_paths:
-                if os.path.exists(img_path):
-                    img_label = QLabel()
-                    pixmap = QPixmap(img_path)
-                    img_label.setPixmap(pixmap.scaled(200, 200))
-                    self.chat_section.layout().addWidget(img_label)
+            self.chat_section.add_message(line, 'cyan')
+        # Thumbnails are prepared in the background and appear as they finish
+        for img_path in image_paths:
+            self.chat_section.add_image(img_path)
         self.status_label.setText("")
         self.input_box.clear()
         self.input_box.setDisabled(False)
@@ -0,0 +1,131 @@
+import os
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+from PIL import Image
+from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
+from dotenv import dotenv_values
+
+# Generated images are shown in the chat as thumbnails prepared off the GUI thread. A worker
+# decodes each original at reduced resolution (JPEG draft mode scales during the DCT, reduce()
+# does integer box downsampling for other formats), writes "<name>.thumb<size>.jpg" next to the
+# original so later views skip decoding entirely, and hands the GUI a ready-sized QImage through a
+# queued signal. Decoded pixmaps live in a small LRU, so memory does not grow with the history.
+
+env_vars = dotenv_values(".env")
+THUMBNAIL_SIZE = int(env_vars.get("ThumbnailSize", 200))         # longest side, in pixels
+THUMBNAIL_CACHE = int(env_vars.get("ThumbnailCache", 32))        # decoded pixmaps kept in memory
+THUMBNAIL_WORKERS = 2
+THUMBNAIL_QUALITY = 85
+
+logger = logging.getLogger(__name__)
+
+
+def ThumbnailPath(path: str, size: int = THUMBNAIL_SIZE) -> str:
+    """On-disk thumbnail for an image, stored beside it."""
+    return f"{os.path.splitext(path)[0]}.thumb{size}.jpg"
+
+
+def MakeThumbnail(path: str, size: int = THUMBNAIL_SIZE) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Write (or reuse) the thumbnail for an image without decoding it at full size.
+    Returns: (thumbnail_path or None, error_message or None)
+    """
+    thumb_path = ThumbnailPath(path, size)
+    try:
+        if os.path.exists(thumb_path) and os.path.getmtime(thumb_path) >= os.path.getmtime(path):
+            return thumb_path, None
+        with Image.open(path) as image:
+            image.draft("RGB", (size, size))
+            factor = min(image.width // size, image.height // size)
+            if factor >= 2:
+                image = image.reduce(factor)
+            image = image.convert("RGB")
+            image.thumbnail((size, size), Image.LANCZOS)
+            temp_path = f"{thumb_path}.{threading.get_ident()}.tmp"
+            image.save(temp_path, "JPEG", quality=THUMBNAIL_QUALITY)
+        os.replace(temp_path, thumb_path)
+        return thumb_path, None
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not create thumbnail for {path}: {e}")
+        return None, str(e)
+
+
+def ImageVersion(path: str) -> Tuple[str, float]:
+    """Cache key for an image: its path and modification time (0 if it cannot be read)."""
+    try:
+        return path, os.path.getmtime(path)
+    except OSError:
+        return path, 0.0
+
+
+class PixmapCache:
+    """
+    Least-recently-used cache of decoded pixmaps keyed by (original path, mtime), so an image
+    regenerated into the same path is decoded again instead of showing the stale thumbnail.
+    """
+
+    def __init__(self, capacity: int = THUMBNAIL_CACHE):
+        self.capacity = capacity
+        self._pixmaps: "OrderedDict[Tuple[str, float], QPixmap]" = OrderedDict()
+
+    def get(self, key: Tuple[str, float]) -> Optional[QPixmap]:
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def put(self, key: Tuple[str, float], pixmap: QPixmap) -> None:
+        self._pixmaps[key] = pixmap
+        self._pixmaps.move_to_end(key)
+        while len(self._pixmaps) > self.capacity:
+            self._pixmaps.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._pixmaps)
+
+
+class ThumbnailLoader(QObject):
+    """
+    Prepares thumbnails on worker threads. Connect thumbnailReady(original_path, QPixmap) to
+    display them; pixmaps are built on the GUI thread (QImage is the thread-safe hand-off).
+    """
+    thumbnailReady = pyqtSignal(str, QPixmap)
+    thumbnailFailed = pyqtSignal(str, str)
+    _decoded = pyqtSignal(str, float, QImage)
+
+    def __init__(self, size: int = THUMBNAIL_SIZE, capacity: int = THUMBNAIL_CACHE, parent=None):
+        super().__init__(parent)
+        self.size = size
+        self.cache = PixmapCache(capacity)
+        self._pool = ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS, thread_name_prefix="thumbnail")
+        self._decoded.connect(self._on_decoded, Qt.QueuedConnection)  # emitted from pool threads
+        self.destroyed.connect(lambda *_: self._pool.shutdown(wait=False, cancel_futures=True))
+
+    def request(self, path: str) -> None:
+        """Emit thumbnailReady for `path`, from the LRU immediately or after a background decode."""
+        version = ImageVersion(path)
+        pixmap = self.cache.get(version)
+        if pixmap is not None:
+            self.thumbnailReady.emit(path, pixmap)
+            return
+        self._pool.submit(self._load, path, version[1])
+
+    def _load(self, path: str, mtime: float) -> None:
+        thumb_path, error = MakeThumbnail(path, self.size)
+        image = QImage(thumb_path) if thumb_path else QImage()
+        if image.isNull():
+            if error is None:
+                error = f"Unreadable thumbnail: {thumb_path}"
+                logger.error(error)
+            self.thumbnailFailed.emit(path, error)
+            return
+        self._decoded.emit(path, mtime, image)
+
+    def _on_decoded(self, path: str, mtime: float, image: QImage) -> None:
+        pixmap = QPixmap.fromImage(image)
+        self.cache.put((path, mtime), pixmap)
+        self.thumbnailReady.emit(path, pixmap)
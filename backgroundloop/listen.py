@@ -7,8 +7,12 @@ from pathlib import Path
 try:
     import speech_recognition as sr
 except ImportError:
-    print("Missing dependency: SpeechRecognition. Install with: pip install SpeechRecognition")
-    raise
+    sr = None
+
+# Project root on sys.path so the offline backend in Backend/ can be imported
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 
 def run_batch_file(batch_file_path: Path) -> None:
@@ -31,8 +35,40 @@ def run_batch_file(batch_file_path: Path) -> None:
     
 
 
+def listen_offline(target_phrase: str, batch_file_path: Path, model_path: str) -> None:
+    """Same as listen_and_execute, but recognizes speech locally with Vosk (no network needed)."""
+    from Backend.SpeechBackends import VoskSpeechBackend
+    try:
+        backend = VoskSpeechBackend(model_path)
+    except RuntimeError as exc:
+        print(exc)
+        sys.exit(1)
+    print("Listening offline for the phrase:", f'"{target_phrase}"')
+
+    while True:
+        try:
+            text, error = backend.listen(timeout=5)
+            if error:
+                print(f"Speech recognition error: {error}")
+                time.sleep(5)
+                continue
+            if not text:
+                continue
+            print(f"Heard: {text}")
+            if target_phrase.lower() in text.lower():
+                print("Trigger phrase detected. Executing batch file...")
+                run_batch_file(batch_file_path)
+        except KeyboardInterrupt:
+            print("\nExiting...")
+            break
+    backend.close()
+
+
 def listen_and_execute(target_phrase: str, batch_file_path: Path) -> None:
     """Continuously listen on the default microphone and execute the batch file when the target phrase is heard."""
+    if sr is None:
+        print("Missing dependency: SpeechRecognition. Install with: pip install SpeechRecognition (or use --offline)")
+        sys.exit(1)
     recognizer = sr.Recognizer()
     recognizer.energy_threshold = 4000
     recognizer.dynamic_energy_threshold = True
@@ -92,6 +128,18 @@ def parse_args() -> argparse.Namespace:
         default="launch jarvis",
         help="The wake phrase to listen for (default: 'launch jarvis')",
     )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Recognize speech locally with Vosk instead of Google's web service",
+    )
+    parser.add_argument(
+        "--model",
+        dest="model_path",
+        type=str,
+        default=str(PROJECT_ROOT / "Data" / "vosk-model"),
+        help="Path to the Vosk model directory used with --offline (default: Data/vosk-model)",
+    )
     return parser.parse_args()
 
 
@@ -106,7 +154,10 @@ def main() -> None:
         sys.exit(1)
     
     print(f"Using batch file: {batch_file_path}")
-    listen_and_execute(args.phrase, batch_file_path)
+    if args.offline:
+        listen_offline(args.phrase, batch_file_path, args.model_path)
+    else:
+        listen_and_execute(args.phrase, batch_file_path)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
 # ===================== Imports and Setup =====================
+from time import perf_counter
+IMPORT_START = perf_counter()
 from Frontend.GUI import (
     GraphicalUserInterface,
     SetAssistantStatus,
@@ -10,72 +12,69 @@ from Frontend.GUI import (
 )
 from Backend.Model import FirstLayerDMM
 from Backend.RealtimeSearchEngine import RealtimeSearchEngine
-from Backend.Automation import Automation
+from Backend.AutomationRuntime import get_automation_runtime
 from Backend.Automation import nav as navigator
+from Backend.Commands import registry, IMAGE, NAVIGATION, AUTOMATION
 from Backend.auth.recoganize import AuthenticateFace  # Import face recognition
 import pyautogui
-from Backend.SpeechToText import SpeechRecognition
-from Backend.Chatbot import ChatBot
-from Backend.TextToSpeech import TextToSpeech
-from Backend.ImageGeneration import GenerateImages
+from Backend.SpeechToText import Utterances
+from Backend.Chatbot import ChatBotStream
+from Backend.TextToSpeech import TextToSpeech, TextToSpeechStream
+from Backend.AudioPlayer import get_audio_player, PRIORITY_ALERT
+from Backend.ImageGeneration import get_image_queue, open_image, HF_API_KEY, OPEN_IMAGE_VIEWER
+from Backend.EventBus import event_bus, IMAGE_TOPIC
+from Backend.ChatStore import get_chat_store, IncrementalChatFormatter
+from Backend.Startup import startup
+from Backend.SpeechBackends import get_speech_backend
+from Backend.DecisionCache import get_decision_cache
+import Backend.Model as Model
+import Backend.Chatbot as Chatbot
+import Backend.RealtimeSearchEngine as RealtimeSearch
+import Backend.Automation as AutomationModule
 from dotenv import dotenv_values
 from asyncio import run
 from time import sleep, time, localtime
-import subprocess
 import threading
-import json
+import queue
+from concurrent.futures import CancelledError
 import os
 import logging
 import sys
 import pyaudio
 import numpy as np
 import platform
-import pygame
+import importlib
+startup.mark("imports", perf_counter() - IMPORT_START)
 
 # ===================== Logging and Environment =====================
 env_vars = dotenv_values(".env")
 USERNAME = env_vars.get("Username", "User")
 ASSISTANT_NAME = env_vars.get("Assistantname", "Assistant")
 DEFAULT_MESSAGE = f'''{USERNAME} 😄: Hello {ASSISTANT_NAME} 🌟, How are you?\n{ASSISTANT_NAME} 🤖: Welcome {USERNAME} 🎉, I am doing well. How may I help you today? 😊'''
-subprocesses = []
-FUNCTIONS = ["open", "close", "play", "system", "content", "google search", "youtube search", "write", "create presentation", 
-             "scroll", "swipe", "pdf", "youtube", "web", "zoom", "page", "home", "end", "next", "previous", "up", "down", 
-             "enter", "escape", "tab", "backspace", "delete", "select", "copy", "paste", "cut", "undo", "redo", "save", 
-             "find", "replace", "refresh", "fullscreen", "voice type", "type", "screenshot", "take screenshot", "read clipboard",
-             "copy to clipboard", "write to clipboard", "minimize window", "maximize window", "switch window", "create file",
-             "read file", "screen info", "get screen info", "analyze screen", "screen analysis", "read screen", "read screen text",
-             "find text", "click on", "observe screen", "what's on screen"]
 os.makedirs("Data", exist_ok=True)
 os.makedirs(os.path.join("Frontend", "Files"), exist_ok=True)
 last_interaction_time = time()
+IDLE_TIMEOUT = 60          # seconds of silence before the assistant goes to sleep
+IDLE_CHECK_INTERVAL = 10   # longest single wait for speech, so the idle timeout is noticed
+WAKE_PHRASES = ["wake up", "get up"]
+chat_store = get_chat_store()
+chat_formatter = IncrementalChatFormatter(chat_store)
 
 # ===================== Utility Functions =====================
-def play_audio_file(file_path: str) -> bool:
-    """Play an audio file using pygame."""
-    try:
-        if not os.path.exists(file_path):
-            logging.warning(f"Audio file not found: {file_path}")
-            return False
-        
-        pygame.mixer.init()
-        pygame.mixer.music.load(file_path)
-        pygame.mixer.music.play()
-        
-        # Wait for the music to finish playing
-        while pygame.mixer.music.get_busy():
-            pygame.time.Clock().tick(10)
-        
-        pygame.mixer.music.stop()
-        pygame.mixer.quit()
-        logging.info(f"Played audio file: {file_path}")
-        return True
-    except Exception as e:
-        logging.error(f"Error playing audio file {file_path}: {e}")
-        try:
-            pygame.mixer.quit()
-        except:
-            pass
+def play_audio_file(file_path: str, wait: bool = True) -> bool:
+    """Play an audio file on the shared audio player (ahead of queued speech)."""
+    if not os.path.exists(file_path):
+        logging.warning(f"Audio file not found: {file_path}")
+        return False
+    clip = get_audio_player().play_file(file_path, PRIORITY_ALERT)
+    if not wait:
+        return clip.error is None
+    clip.wait()
+    if clip.error:
+        logging.error(f"Error playing audio file {file_path}: {clip.error}")
         return False
+    logging.info(f"Played audio file: {file_path}")
+    return True
 
 def detect_clap():
     """Detect a clap sound using the microphone."""
@@ -98,78 +97,35 @@ def detect_clap():
 
 def show_default_chat_if_no_chats():
     """Show default chat if no previous chats exist."""
-    chat_log_path = r"Data\ChatLog.json"
-    try:
-        with open(chat_log_path, "r", encoding='utf-8') as file:
-            if len(file.read()) < 5:
-                with open(TempDirectoryPath('Database.data'), 'w', encoding='utf-8') as file:
-                    file.write("")
-                with open(TempDirectoryPath('Responses.data'), 'w', encoding='utf-8') as file:
-                    file.write(DEFAULT_MESSAGE)
-    except FileNotFoundError:
-        with open(chat_log_path, "w", encoding='utf-8') as file:
-            json.dump([], file)
+    if len(chat_store) == 0:
         with open(TempDirectoryPath('Database.data'), 'w', encoding='utf-8') as file:
             file.write("")
-        with open(TempDirectoryPath('Responses.data'), 'w', encoding='utf-8') as file:
-            file.write(DEFAULT_MESSAGE)
-
-def read_chat_log_json():
-    """Read chat log from JSON file."""
-    chat_log_path = r"Data\ChatLog.json"
-    try:
-        with open(chat_log_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
+        ShowTextTOScreen(DEFAULT_MESSAGE)
 
 def save_to_chat_log(user_message: str, assistant_message: str):
-    """Save user and assistant messages to ChatLog.json."""
-    chat_log_path = r"Data\ChatLog.json"
+    """Append user and assistant messages to the chat log."""
     try:
-        # Read existing chat history
-        chat_history = read_chat_log_json()
-        
-        # Ensure it's a list
-        if not isinstance(chat_history, list):
-            chat_history = []
-        
-        # Append new messages
-        chat_history.append({"role": "user", "content": user_message})
-        chat_history.append({"role": "assistant", "content": assistant_message})
-        
-        # Save to file
-        with open(chat_log_path, 'w', encoding='utf-8') as file:
-            json.dump(chat_history, file, indent=4, ensure_ascii=False)
+        chat_store.extend([
+            {"role": "user", "content": user_message},
+            {"role": "assistant", "content": assistant_message}
+        ])
+        logging.info(f"Saved chat history: {len(chat_store)} messages")
         
-        logging.info(f"Saved chat history: {len(chat_history)} messages")
-        
-        # Update GUI display
+        # The GUI already showed both messages live; only the Database.data mirror needs updating
         chat_log_integration()
-        show_chats_on_gui()
         
     except Exception as e:
         logging.error(f"Error saving to chat log: {e}")
 
 def chat_log_integration():
-    """Integrate chat log for display."""
-    json_data = read_chat_log_json()
-    formatted_chatlog = ""
-    for entry in json_data:
-        if entry.get("role") == "user":
-            formatted_chatlog += f"{USERNAME}: {entry.get('content', '')} 😄\n"
-        elif entry.get("role") == "assistant":
-            formatted_chatlog += f"{ASSISTANT_NAME}: {entry.get('content', '')} 🌟\n"
-    with open(TempDirectoryPath('Database.data'), 'w', encoding='utf-8') as file:
-        file.write(AnswerModifier(formatted_chatlog))
-
-def show_chats_on_gui():
-    """Display chats on the GUI."""
-    with open(TempDirectoryPath('Database.data'), 'r', encoding='utf-8') as file:
-        data = file.read()
-    if data:
-        with open(TempDirectoryPath('Responses.data'), 'w', encoding='utf-8') as file:
-            file.write(data)
+    """Render messages added since the last call and append them to Database.data."""
+    first_render = chat_formatter.rendered_count == 0
+    new_text = chat_formatter.render_new()
+    if not new_text and not first_render:
+        return
+    mode = 'w' if first_render else 'a'
+    with open(TempDirectoryPath('Database.data'), mode, encoding='utf-8') as file:
+        file.write(new_text if first_render else "\n" + new_text)
 
 def greet_user_by_time():
     """Greet the user based on the current time."""
@@ -196,21 +152,41 @@ def check_system():
     return True
 
 # ===================== Main Assistant Functions =====================
+def register_startup_tasks():
+    """Warm-up work that runs on the startup pool while face authentication is in progress."""
+    startup.register("speech session", lambda: get_speech_backend().warm())
+    startup.register("Cohere client", Model.cohere_client.warm)
+    startup.register("Groq client (chatbot)", Chatbot.client.warm)
+    startup.register("Groq client (realtime)", RealtimeSearch.client.warm)
+    startup.register("Groq client (automation)", AutomationModule.client.warm)
+    startup.register("decision cache", get_decision_cache)
+    startup.register("automation runtime", get_automation_runtime)
+    startup.register("audio player", get_audio_player)
+    startup.register("chat history", lambda: len(chat_store))
+    startup.register("AppOpener", lambda: importlib.import_module("AppOpener"))
+    startup.register("pywhatkit", lambda: importlib.import_module("pywhatkit"))
+
 def initial_execution():
     """Run initial setup and greetings with face authentication."""
     global last_interaction_time
+    register_startup_tasks()
+    startup.start()
     
     # Play startup sound
     startup_sound_path = os.path.join("Frontend", "audio", "start_sound.mp3")
     if os.path.exists(startup_sound_path):
-        threading.Thread(target=play_audio_file, args=(startup_sound_path,), daemon=True).start()
+        # Queued ahead of the first spoken line; both go through the one open audio device
+        play_audio_file(startup_sound_path, wait=False)
     
     ShowTextTOScreen(f"{ASSISTANT_NAME} 🤖: Initializing face authentication...")
     TextToSpeech("Initializing face authentication")
     sleep(0.5)
     
-    # Perform face authentication
-    if not AuthenticateFace():
+    # Perform face authentication (the startup pool keeps warming resources meanwhile)
+    auth_start = perf_counter()
+    authenticated = AuthenticateFace()
+    startup.mark("face authentication", perf_counter() - auth_start)
+    if not authenticated:
         ShowTextTOScreen(f"{ASSISTANT_NAME} 🤖: Face authentication failed. Shutting down.")
         TextToSpeech("Face authentication failed. Shutting down.")
         sleep(1)
@@ -225,32 +201,25 @@ def initial_execution():
         TextToSpeech("Initialization failed. Please fix issues and restart.")
         sys.exit(1)
     show_default_chat_if_no_chats()
+    # The GUI loads saved history from the chat store itself, a page at a time
     chat_log_integration()
-    show_chats_on_gui()
     greet_user_by_time()
     SetAssistantStatus("Available... ✅")
     last_interaction_time = time()
+    # Print the timing table once the remaining warm-up tasks are done, without blocking startup
+    threading.Thread(target=startup.print_report, daemon=True).start()
 
 initial_execution()
 
 def goodbye():
     """Graceful shutdown with immediate termination after greeting."""
     try:
-        # Terminate all subprocesses
-        for p in subprocesses:
-            try:
-                if p.poll() is None:  # Check if process is still running
-                    p.terminate()
-                    p.wait(timeout=5)
-            except Exception:
-                try:
-                    p.kill()  # Force kill if terminate fails
-                except Exception:
-                    pass
+        get_automation_runtime().shutdown()
         SetAssistantStatus("Shutting down... 🔚")
         ShowTextTOScreen(f"{ASSISTANT_NAME}: System shutdown complete. See you next time, {USERNAME}!")
         TextToSpeech("System shutdown complete. See you next time!")
         sleep(0.5)  # Brief pause to ensure message is displayed/spoken
+        get_audio_player().shutdown()
         # Kill the terminal
         if platform.system() == "Windows":
             os.system("taskkill /IM cmd.exe /F")
@@ -264,11 +233,9 @@ def goodbye():
         TextToSpeech("An error occurred during shutdown. Please try again or close the program manually.")
         os._exit(1)  # Force exit even on error
 
-def main_execution():
-    """Main user interaction and task execution loop."""
+def main_execution(query, q_error=None):
+    """Handle one recognized utterance: route it and execute the resulting tasks."""
     global last_interaction_time
-    SetAssistantStatus("Listening... 👂")
-    query, q_error = SpeechRecognition()  # PATCHED: expect (result, error)
     if q_error:
         ShowTextTOScreen(f"Speech recognition error: {q_error}")
         return
@@ -282,44 +249,47 @@ def main_execution():
         ShowTextTOScreen(f"DMM Error: {dmm_error}")
         return
     logging.info(f"Decision: {decision}")
-    image_execution = any("generate image" in q for q in decision)
-    task_execution = any(any(q.startswith(func) for func in FUNCTIONS) for q in decision)
+    kinds = [registry.kind(q) for q in decision]
+    image_execution = IMAGE in kinds
     merged_query = " and ".join([" ".join(q.split()[1:]) for q in decision if q.startswith("general") or q.startswith("realtime")])
     # Image generation
     if image_execution:
         ShowTextTOScreen(f"{ASSISTANT_NAME} 🤖: Generating image...")
         threading.Thread(target=TextToSpeech, args=("Generating image",), daemon=True).start()
-        with open(r"Frontend\Files\ImageGeneration.data", 'w') as file:
-            file.write(f"{query}, True")
-        try:
-            p1 = subprocess.Popen(
-                ['python', r'Backend\ImageGeneration.py'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                stdin=subprocess.PIPE,
-                shell=False
-            )
-            subprocesses.append(p1)
-            sleep(1)
+        prompts = [q[len("generate image"):].strip(" ()") for q, kind in zip(decision, kinds) if kind == IMAGE]
+        def image_ready(result):
+            # Runs on an image worker as each picture lands
+            if result.path:
+                ShowTextTOScreen(f"{ASSISTANT_NAME}: Image {result.index} ready{' (cached)' if result.cached else ''} 🖼️")
+                event_bus.publish(IMAGE_TOPIC, result.path)  # GUI thumbnail
+                if OPEN_IMAGE_VIEWER:
+                    open_image(result.path)
+        def image_failed(reason):
             SetAssistantStatus("Available... ✅")
-            success_msg = "Image generated successfully!"
-            ShowTextTOScreen(f"{ASSISTANT_NAME}: {success_msg} 🎉")
-            save_to_chat_log(query, success_msg)
-            threading.Thread(target=TextToSpeech, args=("Image generated!",), daemon=True).start()
-        except Exception as e:
-            logging.error(f"Error starting ImageGeneration.py: {e}")
-            error_msg = f"Image generation failed: {str(e)}"
+            error_msg = f"Image generation failed: {reason}"
             ShowTextTOScreen(f"{ASSISTANT_NAME}: {error_msg} 😞")
             save_to_chat_log(query, error_msg)
             threading.Thread(target=TextToSpeech, args=("Image generation failed. Please retry.",), daemon=True).start()
+        def images_done(job):
+            if not job.paths:
+                image_failed("; ".join(job.errors) or "no images returned")
+                return
+            SetAssistantStatus("Available... ✅")
+            success_msg = f"Generated {len(job.paths)} image(s) for {job.prompt}!"
+            ShowTextTOScreen(f"{ASSISTANT_NAME}: {success_msg} 🎉")
+            save_to_chat_log(query, success_msg)
+            threading.Thread(target=TextToSpeech, args=("Image generated!",), daemon=True).start()
+        if not HF_API_KEY:
+            image_failed("HuggingFace API key missing")
+            return True
+        SetAssistantStatus("Generating image... 🎨")
+        image_queue = get_image_queue()
+        for prompt in prompts:
+            image_queue.submit(prompt, on_image=image_ready, on_done=images_done)
+        logging.info(f"Image queue depth: {image_queue.queue_depth}")
         return True
     # Navigation execution
-    navigation_commands = [q for q in decision if any(
-        q.startswith(nav) or nav in q for nav in [
-            "scroll", "swipe", "pdf", "youtube", "web", "zoom", "page", "home", "end", "next", "previous",
-            "up", "down", "enter", "escape", "tab", "backspace", "delete", "select", "copy", "paste",
-            "cut", "undo", "redo", "save", "find", "replace", "refresh", "fullscreen"
-        ])]
+    navigation_commands = [q for q, kind in zip(decision, kinds) if kind == NAVIGATION]
     if navigation_commands:
         SetAssistantStatus("Navigating... 🧭")
         def run_navigation_new():
@@ -346,19 +316,13 @@ def main_execution():
         threading.Thread(target=run_navigation_new, daemon=True).start()
         return True
     # Task execution (non-navigation)
-    automation_commands = [q for q in decision if any(q.startswith(func) for func in [
-        "open", "close", "play", "system", "content", "google search", "youtube search", "write", "create presentation",
-        "voice type", "type", "screenshot", "take screenshot", "read clipboard", "copy to clipboard", "write to clipboard",
-        "minimize window", "maximize window", "switch window", "create file", "read file", "screen info", "get screen info",
-        "analyze screen", "screen analysis", "read screen", "read screen text", "find text", "click on", "observe screen",
-        "what's on screen", "send mail"
-    ])]
+    automation_commands = [q for q, kind in zip(decision, kinds) if kind == AUTOMATION]
     if automation_commands:
         SetAssistantStatus("Executing... 🚀")
-        def run_automation():
-            from asyncio import run as asyncio_run
+        def automation_done(future):
+            # Runs on the automation runtime's loop thread once the batch finished
             try:
-                result, auto_error = asyncio_run(Automation(automation_commands))
+                result, auto_error = future.result()
                 SetAssistantStatus("Available... ✅")
                 if auto_error:
                     error_msg = f"Some commands had issues: {auto_error}" if result else f"Command error: {auto_error}"
@@ -378,6 +342,9 @@ def main_execution():
                     ShowTextTOScreen(response_msg)
                     save_to_chat_log(query, fail_msg)
                     threading.Thread(target=TextToSpeech, args=(fail_msg,), daemon=True).start()
+            except CancelledError:
+                SetAssistantStatus("Available... ✅")
+                ShowTextTOScreen(f"{ASSISTANT_NAME}: Command cancelled.")
             except Exception as e:
                 logging.error(f"Automation execution error: {e}")
                 SetAssistantStatus("Available... ✅")
@@ -386,7 +353,9 @@ def main_execution():
                 ShowTextTOScreen(response_msg)
                 save_to_chat_log(query, error_msg)
                 threading.Thread(target=TextToSpeech, args=("An error occurred during automation.",), daemon=True).start()
-        threading.Thread(target=run_automation, daemon=True).start()
+        runtime = get_automation_runtime()
+        runtime.submit_commands(automation_commands).add_done_callback(automation_done)
+        logging.info(f"Automation queue depth: {runtime.queue_depth}")
         return True
     # Realtime/general queries
     if any(q.startswith("realtime") for q in decision):
@@ -399,10 +368,9 @@ def main_execution():
                 ShowTextTOScreen(f"Realtime error: {rt_error}")
             ShowTextTOScreen(f"{ASSISTANT_NAME}: {answer} 🌐")
             SetAssistantStatus("Answering... 💬")
-            # RealtimeSearchEngine already saves to ChatLog.json, so we just update the GUI
+            # RealtimeSearchEngine already saved the turn and the answer was shown above
             if not rt_error:
                 chat_log_integration()
-                show_chats_on_gui()
             threading.Thread(target=TextToSpeech, args=(answer,), daemon=True).start()
         threading.Thread(target=run_realtime, daemon=True).start()
         return True
@@ -410,16 +378,28 @@ def main_execution():
         if "general" in q:
             SetAssistantStatus("Thinking... 🤔")
             def run_general():
-                answer, cb_error = ChatBot(QueryModifier(q.replace("general ", "")))
+                # Sentences are spoken as soon as Groq produces them, while the rest is still generating
+                sentence_queue = queue.Queue()
+                def queued_sentences():
+                    while (sentence := sentence_queue.get()) is not None:
+                        yield sentence
+                threading.Thread(target=TextToSpeechStream, args=(queued_sentences(),), daemon=True).start()
+                sentences, cb_error = [], None
+                try:
+                    for sentence, error in ChatBotStream(QueryModifier(q.replace("general ", ""))):
+                        sentences.append(sentence)
+                        cb_error = cb_error or error
+                        sentence_queue.put(sentence)
+                finally:
+                    sentence_queue.put(None)
+                answer = AnswerModifier("".join(sentences))
                 if cb_error:
                     ShowTextTOScreen(f"Chatbot error: {cb_error}")
                 ShowTextTOScreen(f"{ASSISTANT_NAME}: {answer} 🌟")
                 SetAssistantStatus("Answering... 💬")
-                # ChatBot already saves to ChatLog.json, so we just update the GUI
+                # ChatBotStream already saved the turn and the answer was shown above
                 if not cb_error:
                     chat_log_integration()
-                    show_chats_on_gui()
-                threading.Thread(target=TextToSpeech, args=(answer,), daemon=True).start()
             threading.Thread(target=run_general, daemon=True).start()
             return True
         elif any(word in q.lower() for word in ["exit", "bye", "goodbye"]):
@@ -431,31 +411,42 @@ def main_execution():
     sleep(0.5)
 
 def sleep_assistant():
-    """Put the assistant into sleep state until user says 'wake up' or 'get up'."""
+    """Put the assistant into sleep state; listen_loop wakes it on 'wake up' or 'get up'."""
     SetAssistantStatus("Sleeping... 😴")
+    get_speech_backend().pause()  # the recognizer keeps running across idle checks; stop it before speaking
     ShowTextTOScreen(f"{ASSISTANT_NAME} 🤖: I am now sleeping. Say 'wake up' or 'get up' to continue.")
     TextToSpeech("I am now sleeping. Say wake up or get up to continue.")
-    while True:
-        query = SpeechRecognition()
-        if query and any(phrase in query.lower() for phrase in ["wake up", "get up"]):
-            SetAssistantStatus("Available... ✅")
-            ShowTextTOScreen(f"{ASSISTANT_NAME} 🤖: I'm back and ready to help!")
-            TextToSpeech("I'm back and ready to help!")
-            break
-        sleep(0.5)
+
+def wake_assistant():
+    SetAssistantStatus("Available... ✅")
+    ShowTextTOScreen(f"{ASSISTANT_NAME} 🤖: I'm back and ready to help!")
+    TextToSpeech("I'm back and ready to help!")
 
 # ===================== Threaded Main Loop =====================
-def first_thread():
+async def listen_loop():
+    """Consume utterances from the persistent speech session; sleeps after IDLE_TIMEOUT seconds of silence."""
     global last_interaction_time
-    while True:
-        current_time = time()
-        if (current_time - last_interaction_time) > 60:
-            sleep_assistant()
-            last_interaction_time = time()
-        else:
-            main_execution()
-        # Add a small delay to prevent rapid feedback and improve performance
-        sleep(0.2)
+    asleep = False
+    SetAssistantStatus("Listening... 👂")
+    async for query, q_error in Utterances(timeout=IDLE_CHECK_INTERVAL):
+        if asleep:
+            if query and any(phrase in query.lower() for phrase in WAKE_PHRASES):
+                asleep = False
+                last_interaction_time = time()
+                wake_assistant()
+                SetAssistantStatus("Listening... 👂")
+            continue
+        if not query and not q_error:
+            # Nothing heard within the wait; only idle housekeeping to do
+            if (time() - last_interaction_time) > IDLE_TIMEOUT:
+                asleep = True
+                sleep_assistant()
+            continue
+        main_execution(query, q_error)
+        SetAssistantStatus("Listening... 👂")
+
+def first_thread():
+    run(listen_loop())
 
 def second_thread():
     GraphicalUserInterface()